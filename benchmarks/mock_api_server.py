@@ -0,0 +1,172 @@
+import json
+import random
+import threading
+import time
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+
+# =============================================================================================== #
+
+def is_available(name: str) -> bool:
+    """Deterministic stand-in availability: roughly one name in three is available."""
+    return zlib.crc32(name.lower().encode('utf-8')) % 3 == 0
+
+
+def graphql_body(variables: Dict[str, str]) -> Dict:
+    """Answer a batched user/organization lookup the way GitHub's GraphQL API does."""
+    data, errors = {}, []
+    for key, login in variables.items():
+        index = key[1:]
+        for alias in (f"u{index}", f"o{index}"):
+            if is_available(login):
+                data[alias] = None
+                errors.append({'type': 'NOT_FOUND', 'path': [alias]})
+            else:
+                data[alias] = {'login': login} if alias.startswith('u') else None
+    return {'data': data, 'errors': errors} if errors else {'data': data}
+
+
+class MockApiServer:
+    """Local HTTP stand-in for the GoDaddy availability, GitHub users and package registry APIs.
+
+    Every response is delayed by latency seconds. A fraction error_rate of requests fail with
+    500 and a fraction throttle_rate are answered with 429 and a Retry-After of retry_after.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: int = 1,
+        seed: Optional[int] = None,
+        host: str = '127.0.0.1',
+        port: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.requests = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'MockApiServer':
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> 'MockApiServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _fault(self) -> Optional[Tuple[int, Dict[str, str]]]:
+        """Pick an injected failure for this request, if any."""
+        with self._lock:
+            roll = self._random.random()
+        if roll < self.throttle_rate:
+            return 429, {'Retry-After': str(self.retry_after)}
+        if roll < self.throttle_rate + self.error_rate:
+            return 500, {}
+        return None
+
+    def _record(self, route: str, status: int) -> None:
+        with self._lock:
+            self.requests[(route, status)] += 1
+
+    def _handler_class(self):
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args) -> None:
+                pass
+
+            def _send(self, route: str, status: int, body=None, headers=None) -> None:
+                server._record(route, status)
+                payload = json.dumps(body if body is not None else {}).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _read_json(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                return json.loads(self.rfile.read(length) or b'null')
+
+            def _respond(self, route: str, handler) -> None:
+                if server.latency:
+                    time.sleep(server.latency)
+                fault = server._fault()
+                if fault is not None:
+                    status, headers = fault
+                    self._send(route, status, {'code': 'INJECTED_FAULT'}, headers)
+                    return
+                status, body = handler()
+                self._send(route, status, body)
+
+            def do_GET(self) -> None:
+                url = urlparse(self.path)
+                if url.path.endswith('/domains/available'):
+                    domain = parse_qs(url.query).get('domain', [''])[0]
+                    self._respond('godaddy', lambda: (200, {
+                        'domain': domain,
+                        'available': is_available(domain),
+                    }))
+                elif url.path.startswith('/users/'):
+                    username = url.path[len('/users/'):]
+                    self._respond('github', lambda: (404 if is_available(username) else 200, {}))
+                elif url.path.startswith('/pypi/') and url.path.endswith('/json'):
+                    project = unquote(url.path[len('/pypi/'):-len('/json')])
+                    self._respond('pypi', lambda: (404 if is_available(project) else 200, {}))
+                elif url.path.startswith('/npm/'):
+                    package = unquote(url.path[len('/npm/'):])
+                    self._respond('npm', lambda: (404 if is_available(package) else 200, {}))
+                elif url.path.startswith('/v2/users/'):
+                    namespace = unquote(url.path[len('/v2/users/'):].rstrip('/'))
+                    status = 404 if is_available(namespace) else 200
+                    self._respond('dockerhub', lambda: (status, {}))
+                else:
+                    self._send('unknown', 404)
+
+            def do_POST(self) -> None:
+                url = urlparse(self.path)
+                if url.path.endswith('/domains/available'):
+                    domains = self._read_json() or []
+                    self._respond('godaddy_bulk', lambda: (200, {
+                        'domains': [
+                            {'domain': domain.lower(), 'available': is_available(domain)}
+                            for domain in domains
+                        ],
+                    }))
+                elif url.path == '/graphql':
+                    variables = (self._read_json() or {}).get('variables', {})
+                    self._respond('github_graphql', lambda: (200, graphql_body(variables)))
+                else:
+                    self._send('unknown', 404)
+
+        return _Handler
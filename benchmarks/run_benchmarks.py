@@ -0,0 +1,279 @@
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+from benchmarks.mock_api_server import MockApiServer
+from src.domain_checker import DomainChecker
+from src.github_checker import GitHubChecker
+from src.name_checker import NameChecker
+from src.utils.checkpoint import Checkpoint
+from src.utils.config_helper import ConfigHelper, EnvType
+from src.utils.http_session import create_session
+from src.utils.rate_limiter import RateLimiter
+from src.utils.results_store import ResultsStore
+
+
+# =============================================================================================== #
+
+UNLIMITED_RATE = 1_000_000
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method='inclusive')[int(percentile) - 1]
+
+
+def _git_version() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ['git', 'describe', '--always', '--dirty'],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True,
+        )
+        return result.stdout.decode('utf-8').strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def configure(
+    config_helper: ConfigHelper, server: MockApiServer, max_workers: int
+) -> ConfigHelper:
+    """Point a config at the mock server and lift limits that would hide checker throughput."""
+    config_helper.godaddy_api_url = f"{server.url}/v1/domains/available"
+    config_helper.github_api_url = f"{server.url}/users/"
+    config_helper.github_graphql_url = f"{server.url}/graphql"
+    config_helper.godaddy_max_workers = max_workers
+    config_helper.pool_maxsize = max(max_workers, config_helper.pool_maxsize)
+    config_helper.cache_enabled = False
+    config_helper.circuit_enabled = False
+    return config_helper
+
+
+@contextmanager
+def measure() -> Iterator[Dict]:
+    """Measure wall time and peak traced memory of the enclosed block."""
+    stats = {}
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats['seconds'] = time.perf_counter() - start
+        stats['peak_memory_kb'] = tracemalloc.get_traced_memory()[1] / 1024
+        tracemalloc.stop()
+
+
+def run_batches(
+    names: List[str],
+    batch_size: int,
+    check_batch: Callable[[List[str]], object],
+) -> Dict:
+    """Time check_batch over names split into batches."""
+    latencies = []
+    with measure() as stats:
+        for i in range(0, len(names), batch_size):
+            start = time.perf_counter()
+            check_batch(names[i: i + batch_size])
+            latencies.append(time.perf_counter() - start)
+    return {**stats, 'latencies': latencies}
+
+
+def bench_domain_checker(config_helper, session, names, batch_size, bulk: bool) -> Dict:
+    rate_limiter = RateLimiter(UNLIMITED_RATE, 1)
+
+    def _check(batch):
+        checker = DomainChecker(
+            host_names=batch,
+            env_type=config_helper.env_type,
+            config_helper=config_helper,
+            session=session,
+            rate_limiter=rate_limiter,
+        )
+        if bulk:
+            return checker.check()
+        return checker.check_domains(checker.domains)
+
+    return run_batches(names, batch_size, _check)
+
+
+def bench_github_checker(config_helper, session, names, batch_size, graphql: bool) -> Dict:
+    rate_limiter = RateLimiter(UNLIMITED_RATE, 1)
+
+    def _check(batch):
+        checker = GitHubChecker(
+            batch, config_helper, session=session, rate_limiter=rate_limiter, use_graphql=graphql
+        )
+        return checker.check()
+
+    return run_batches(names, batch_size, _check)
+
+
+def bench_name_checker(server, names, batch_size, max_workers, pipeline: bool) -> Dict:
+    name_checker = NameChecker(
+        env_type=EnvType.DEV,
+        names=names,
+        batch_size=batch_size,
+        test_mode=True,
+        # breakers are built with the checker, so they must be disabled before configure()
+        config_overrides={'CircuitBreaker': {'ENABLED': 'False'}},
+    )
+    configure(name_checker.cfg, server, max_workers)
+    name_checker.cache = None
+    name_checker.rate_limiters = {
+        provider: RateLimiter(UNLIMITED_RATE, 1) for provider in name_checker.rate_limiters
+    }
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        name_checker.results_store = ResultsStore(Path(tmp_dir) / 'results.sqlite3')
+        name_checker.checkpoint = Checkpoint(Path(tmp_dir) / 'checkpoint.json')
+        latencies = []
+        save_results = name_checker.save_results
+        last = [time.perf_counter()]
+
+        def _timed_save(results):
+            now = time.perf_counter()
+            latencies.append(now - last[0])
+            last[0] = now
+            save_results(results)
+
+        name_checker.save_results = _timed_save
+        with measure() as stats:
+            last[0] = time.perf_counter()
+            if pipeline:
+                name_checker.run_pipeline()
+            else:
+                name_checker.run()
+        name_checker.results_store.close()
+    return {**stats, 'latencies': latencies}
+
+
+SCENARIOS = {
+    'domain_checker_bulk': lambda server, cfg, session, names, batch_size, workers:
+        bench_domain_checker(cfg, session, names, batch_size, bulk=True),
+    'domain_checker_per_domain': lambda server, cfg, session, names, batch_size, workers:
+        bench_domain_checker(cfg, session, names, batch_size, bulk=False),
+    'github_checker_graphql': lambda server, cfg, session, names, batch_size, workers:
+        bench_github_checker(cfg, session, names, batch_size, graphql=True),
+    'github_checker_rest': lambda server, cfg, session, names, batch_size, workers:
+        bench_github_checker(cfg, session, names, batch_size, graphql=False),
+    'name_checker_run': lambda server, cfg, session, names, batch_size, workers:
+        bench_name_checker(server, names, batch_size, workers, pipeline=False),
+    'name_checker_pipeline': lambda server, cfg, session, names, batch_size, workers:
+        bench_name_checker(server, names, batch_size, workers, pipeline=True),
+}
+
+
+def run_benchmarks(
+    scenarios: List[str],
+    name_count: int,
+    batch_sizes: List[int],
+    concurrency: List[int],
+    latency: float,
+    error_rate: float,
+    throttle_rate: float,
+) -> Dict:
+    """Run every scenario at every batch size and concurrency level against a mock server."""
+    names = [f"BenchName{i}" for i in range(name_count)]
+    report = {
+        'version': _git_version(),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'server': {'latency': latency, 'error_rate': error_rate, 'throttle_rate': throttle_rate},
+        'results': [],
+    }
+    for scenario in scenarios:
+        for batch_size in batch_sizes:
+            for workers in concurrency:
+                server = MockApiServer(latency, error_rate, throttle_rate, retry_after=0, seed=0)
+                with server:
+                    config_helper = configure(
+                        ConfigHelper(EnvType.DEV, test_mode=True), server, workers
+                    )
+                    session = create_session(
+                        config_helper.pool_connections, config_helper.pool_maxsize
+                    )
+                    with session:
+                        stats = SCENARIOS[scenario](
+                            server, config_helper, session, names, batch_size, workers
+                        )
+                    requests = {
+                        f"{route} {status}": count
+                        for (route, status), count in server.requests.items()
+                    }
+                latencies_ms = [latency * 1000 for latency in stats['latencies']]
+                result = {
+                    'scenario': scenario,
+                    'names': name_count,
+                    'batch_size': batch_size,
+                    'concurrency': workers,
+                    'seconds': round(stats['seconds'], 4),
+                    'names_per_sec': (
+                        round(name_count / stats['seconds'], 2) if stats['seconds'] else None
+                    ),
+                    'batch_p50_ms': round(_percentile(latencies_ms, 50), 2),
+                    'batch_p99_ms': round(_percentile(latencies_ms, 99), 2),
+                    'peak_memory_kb': round(stats['peak_memory_kb'], 1),
+                    'requests': requests,
+                }
+                print(
+                    f"{scenario:<28} batch={batch_size:<4} workers={workers:<3} "
+                    f"{result['names_per_sec']:>9} names/s  p50={result['batch_p50_ms']}ms "
+                    f"p99={result['batch_p99_ms']}ms  peak={result['peak_memory_kb']}KB"
+                )
+                report['results'].append(result)
+    return report
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(item) for item in value.split(',') if item]
+
+
+def main(argv: Optional[List[str]] = None) -> Dict:
+    parser = argparse.ArgumentParser(description="Benchmark NameChecker against a local mock API.")
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS),
+                        help="Comma-separated scenarios to run.")
+    parser.add_argument('--names', type=int, default=200, help="Number of names to check.")
+    parser.add_argument('--batch-sizes', type=_int_list, default=[10, 25, 100])
+    parser.add_argument('--concurrency', type=_int_list, default=[1, 4, 16])
+    parser.add_argument('--latency', type=float, default=0.02,
+                        help="Mock response latency in seconds.")
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--output', type=Path, default=None,
+                        help="JSON report path (default: output/benchmarks/<timestamp>.json).")
+    args = parser.parse_args(argv)
+
+    scenarios = [scenario for scenario in args.scenarios.split(',') if scenario]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    report = run_benchmarks(
+        scenarios, args.names, args.batch_sizes, args.concurrency,
+        args.latency, args.error_rate, args.throttle_rate,
+    )
+    output = args.output
+    if output is None:
+        output_dir = Path(__file__).resolve().parent.parent / 'output' / 'benchmarks'
+        output = output_dir / f"benchmark-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=4)
+    print(f"Benchmark results written to: {output}")
+    return report
+
+
+# =============================================================================================== #
+
+if __name__ == "__main__":
+    main()
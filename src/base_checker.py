@@ -0,0 +1,172 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import quote
+
+import requests
+
+from src.utils.circuit_breaker import CircuitBreaker
+from src.utils.config_helper import ConfigHelper
+from src.utils.http_session import session_from_config
+from src.utils.metrics import metrics
+from src.utils.name_index import canonical_name
+from src.utils.rate_limiter import RateLimiter, create_rate_limiter
+from src.utils.result_cache import ResultCache
+
+
+# =============================================================================================== #
+
+class BaseChecker:
+    """Interface of a pluggable namespace checker.
+
+    A checker names its provider, which is also its result column and its config section, and
+    declares its concurrency hints (max_workers requests per batch, stage_workers batches in the
+    pipeline), rate-limit policy (rate_limit requests per rate_period seconds), cache TTLs and
+    cache key scheme. Every hint can be overridden by the same key, upper-cased, in the provider's
+    config section. Subclasses implement check_name(), or check() for providers with a batch API.
+    """
+
+    provider: str = ''
+    api_url: str = ''
+    max_workers: int = 4
+    stage_workers: int = 1
+    max_retries: int = 3
+    rate_limit: int = 60
+    rate_period: int = 60
+    cache_ttl_available: int = 3600
+    cache_ttl_taken: int = 604800
+
+    def __init__(
+        self,
+        config_helper: ConfigHelper,
+        session: Optional[requests.Session] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        cache: Optional[ResultCache] = None
+    ) -> None:
+        self.cfg = config_helper
+        self.session = session or session_from_config(self.cfg)
+        self.rate_limiter = rate_limiter or self.create_rate_limiter(self.cfg)
+        self.circuit_breaker = circuit_breaker
+        self.cache = cache
+        self.failures = {}
+
+    @classmethod
+    def get_setting(cls, config_helper: ConfigHelper, name: str) -> Union[int, str]:
+        """Get a setting from the provider's config section, falling back to the class default."""
+        default = getattr(cls, name)
+        config = config_helper.config
+        if not config.has_option(cls.provider, name.upper()):
+            return default
+        if isinstance(default, int):
+            return config.getint(cls.provider, name.upper())
+        return config.get(cls.provider, name.upper())
+
+    @classmethod
+    def create_rate_limiter(cls, config_helper: ConfigHelper, share: int = 1) -> RateLimiter:
+        """Create a rate limiter for the provider's policy, keeping 1/share of the quota."""
+        rate = max(1, cls.get_setting(config_helper, 'rate_limit') // share)
+        period = cls.get_setting(config_helper, 'rate_period')
+        return create_rate_limiter(config_helper, rate, period)
+
+    @classmethod
+    def get_cache_ttls(cls, config_helper: ConfigHelper) -> Tuple[int, int]:
+        """Get the (available TTL, taken TTL) the provider's results are cached for."""
+        return (cls.get_setting(config_helper, 'cache_ttl_available'),
+                cls.get_setting(config_helper, 'cache_ttl_taken'))
+
+    def cache_key(self, name: str) -> str:
+        """Get the key a name's result is cached under; names with the same key share a result."""
+        return canonical_name(name)
+
+    def check_name(self, name: str) -> Optional[bool]:
+        """Check a single name; None when it is unknown, with the reason in failures."""
+        raise NotImplementedError
+
+    def check_names(self, names: List[str]) -> List[Optional[bool]]:
+        """Check names concurrently with up to MAX_WORKERS requests in flight."""
+        if not names:
+            return []
+        with ThreadPoolExecutor(max_workers=self.get_setting(self.cfg, 'max_workers')) as executor:
+            return list(executor.map(self.check_name, names))
+
+    def check(self, names: List[str]) -> List[Dict[str, bool]]:
+        """Check the availability of all names and return the results.
+
+        Names that could not be checked are None, with the failure under 'reason'.
+        """
+        keys = {name: self.cache_key(name) for name in names}
+        cached = self.cache.get_many(self.provider, keys.values()) if self.cache else {}
+        availability = {name: cached[key] for name, key in keys.items() if key in cached}
+        uncached = [name for name in names if name not in availability]
+        availability.update(zip(uncached, self.check_names(uncached)))
+
+        if self.cache:
+            self.cache.set_many(self.provider, {
+                keys[name]: availability[name] for name in uncached if name not in self.failures
+            })
+
+        results = []
+        for name in names:
+            result = {'name': name, self.provider: availability[name]}
+            if name in self.failures:
+                result['reason'] = self.failures[name]
+            results.append(result)
+        return results
+
+
+class HttpStatusChecker(BaseChecker):
+    """Checker for registries that answer GET API_URL with 404 for free names, 200 for taken ones.
+
+    API_URL is a template with a {name} field, filled with the name's cache key.
+    """
+
+    def request_url(self, name: str) -> str:
+        api_url = self.get_setting(self.cfg, 'api_url')
+        return api_url.format(name=quote(self.cache_key(name), safe=''))
+
+    def _allow_request(self) -> bool:
+        return self.circuit_breaker is None or self.circuit_breaker.allow()
+
+    def check_name(self, name: str) -> Optional[bool]:
+        url = self.request_url(name)
+        max_retries = self.get_setting(self.cfg, 'max_retries')
+
+        for attempt in range(max_retries):
+            if not self._allow_request():
+                self.failures[name] = 'circuit open'
+                return None
+            try:
+                self.rate_limiter.acquire()
+                with metrics.timer('request_seconds', provider=self.provider, endpoint='lookup'):
+                    response = self.session.get(url=url)
+                metrics.inc('requests_total', provider=self.provider, endpoint='lookup',
+                            status=response.status_code)
+                self.rate_limiter.update(response.headers)
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_status(response.status_code)
+
+                if response.status_code == 404:
+                    return True
+                elif response.status_code == 200:
+                    return False
+                elif response.status_code == 429:
+                    metrics.inc('rate_limited_total', provider=self.provider)
+                    delay = self.rate_limiter.backoff(attempt, response.headers)
+                    print(f"ERROR: RATE_LIMITED -> backing off for {delay:.1f} seconds...")
+                else:
+                    print(f"ERROR: {response.status_code} -> {response.text}")
+                    self.failures[name] = f"HTTP {response.status_code}"
+                    return None
+
+            except Exception as e:
+                metrics.inc('request_errors_total', provider=self.provider)
+                print(f"ERROR: {e}")
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure()
+                self.failures[name] = str(e)
+                return None
+
+        print(f"ERROR: Failed to fetch {self.provider} data after {max_retries} retries.")
+        metrics.inc('retries_exhausted_total', provider=self.provider)
+        self.failures[name] = 'retries exhausted'
+        return None
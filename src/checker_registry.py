@@ -0,0 +1,75 @@
+import importlib
+from importlib.metadata import entry_points
+from typing import Dict, Iterable, Iterator, List, Type
+
+from src.base_checker import BaseChecker
+from src.package_checkers import DockerHubChecker, NpmChecker, PyPIChecker
+from src.utils.config_helper import ConfigHelper
+
+
+# =============================================================================================== #
+
+ENTRY_POINT_GROUP = 'namechecker.checkers'
+BUILTIN_CHECKERS = (PyPIChecker, NpmChecker, DockerHubChecker)
+
+
+class CheckerRegistry:
+    """Checker classes by provider name.
+
+    Checkers come from this package, from installed distributions that declare them in the
+    'namechecker.checkers' entry point group, and from 'module:Class' paths in [Checkers] PLUGINS.
+    A later registration replaces an earlier one for the same provider.
+    """
+
+    def __init__(self, checkers: Iterable[Type[BaseChecker]] = ()) -> None:
+        self._checkers: Dict[str, Type[BaseChecker]] = {}
+        for checker in checkers:
+            self.register(checker)
+
+    def __contains__(self, provider: str) -> bool:
+        return provider in self._checkers
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._checkers)
+
+    def register(self, checker: Type[BaseChecker]) -> Type[BaseChecker]:
+        """Register a checker class under its provider; returns it, so it works as a decorator."""
+        if not (isinstance(checker, type) and issubclass(checker, BaseChecker)):
+            raise TypeError(f"{checker!r} is not a BaseChecker subclass.")
+        if not checker.provider:
+            raise ValueError(f"{checker.__name__} does not name its provider.")
+        self._checkers[checker.provider] = checker
+        return checker
+
+    def get(self, provider: str) -> Type[BaseChecker]:
+        if provider not in self._checkers:
+            raise ValueError(f"Unknown checker: {provider}")
+        return self._checkers[provider]
+
+    def providers(self) -> List[str]:
+        return list(self._checkers)
+
+    def load_entry_points(self, group: str = ENTRY_POINT_GROUP) -> int:
+        """Register every checker class installed under an entry point group; returns the count."""
+        loaded = 0
+        for entry_point in entry_points(group=group):
+            self.register(entry_point.load())
+            loaded += 1
+        return loaded
+
+    def load_plugin(self, path: str) -> Type[BaseChecker]:
+        """Import and register a checker class from a 'module:Class' path."""
+        module_name, _, class_name = path.partition(':')
+        if not module_name or not class_name:
+            raise ValueError(f"Invalid checker plugin path: {path} (expected 'module:Class')")
+        module = importlib.import_module(module_name)
+        return self.register(getattr(module, class_name))
+
+
+def registry_from_config(config_helper: ConfigHelper) -> CheckerRegistry:
+    """Create the registry of built-in, installed and configured checkers."""
+    registry = CheckerRegistry(BUILTIN_CHECKERS)
+    registry.load_entry_points()
+    for path in config_helper.checkers_plugins:
+        registry.load_plugin(path)
+    return registry
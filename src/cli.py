@@ -0,0 +1,125 @@
+import argparse
+import contextlib
+import os
+import sys
+from typing import List, Optional
+
+from src.name_checker import NameChecker
+from src.result_writers import WRITERS
+from src.utils.config_helper import EnvType, Overrides
+
+
+# =============================================================================================== #
+
+def parse_override(value: str) -> tuple:
+    """Parse a SECTION.KEY=VALUE config override."""
+    option, sep, setting = value.partition('=')
+    section, dot, key = option.partition('.')
+    if not sep or not dot or not section or not key:
+        raise argparse.ArgumentTypeError(f"Expected SECTION.KEY=VALUE, got {value!r}")
+    return section, key, setting
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m src',
+        description='Check generated names for domain and GitHub username availability.',
+    )
+    parser.add_argument('--env', choices=[env.name for env in EnvType], default='DEV',
+                        help='environment whose API URLs and credentials to use (default: DEV)')
+    parser.add_argument('--test-mode', action='store_true',
+                        help='read config from tests/cfg and write output under tests/')
+    names = parser.add_mutually_exclusive_group()
+    names.add_argument('--seeds', metavar='PATH',
+                       help='seeds JSON file (default: cfg/seeds.json)')
+    names.add_argument('--names', nargs='+', metavar='NAME',
+                       help='check these names instead of seeds')
+    parser.add_argument('--delta', action='store_true',
+                        help='only check seed combinations added since the last complete run')
+    parser.add_argument('--retry-stored', action='store_true',
+                        help='also retry unknown results stored by earlier runs for other names')
+    parser.add_argument('--endings', nargs='+', metavar='TLD',
+                        help='domain endings to check (default: com)')
+    parser.add_argument('--checkers', nargs='+', metavar='NAME',
+                        help='plugin checkers to enable, e.g. PyPI npm DockerHub '
+                             '(default: [Checkers] ENABLED)')
+    parser.add_argument('--providers', nargs='+', metavar='NAME',
+                        help='providers to check: GoDaddy, GitHub or enabled checkers '
+                             '(default: all)')
+    parser.add_argument('--batch-size', type=int, metavar='N', help='names per batch')
+    parser.add_argument('--batch-limit', type=int, metavar='N', help='stop after N batches')
+    parser.add_argument('--workers', type=int, metavar='N',
+                        help='concurrent GoDaddy requests per batch')
+    parser.add_argument('--pipeline', action='store_true',
+                        help='check every provider concurrently through the asyncio pipeline')
+    parser.add_argument('--prioritize', action='store_true',
+                        help='check the most promising names first, per the [Priority] settings')
+    parser.add_argument('--stop-after', type=int, metavar='N',
+                        help='stop once N available names were found')
+    parser.add_argument('--resume', action='store_true', help='resume from the last checkpoint')
+    parser.add_argument('--format', choices=sorted(WRITERS), default='jsonl',
+                        help='output format: jsonl, csv or available (names only) '
+                             '(default: jsonl)')
+    parser.add_argument('--output', metavar='PATH', help='write results here instead of stdout')
+    parser.add_argument('--set', dest='overrides', action='append', type=parse_override,
+                        default=[], metavar='SECTION.KEY=VALUE',
+                        help='override a config value; repeatable')
+    return parser
+
+
+def get_overrides(args: argparse.Namespace) -> Overrides:
+    """Collect the config override layer from the arguments."""
+    overrides = {}
+    for section, key, value in args.overrides:
+        overrides.setdefault(section, {})[key] = value
+    if args.seeds:
+        overrides.setdefault('Filename', {})['SEEDS'] = os.path.abspath(args.seeds)
+    if args.workers:
+        overrides.setdefault('GoDaddy', {})['MAX_WORKERS'] = str(args.workers)
+    if args.prioritize:
+        overrides.setdefault('Priority', {})['ENABLED'] = 'True'
+    if args.stop_after:
+        overrides.setdefault('Priority', {})['STOP_AFTER'] = str(args.stop_after)
+    if args.checkers:
+        overrides.setdefault('Checkers', {})['ENABLED'] = ','.join(args.checkers)
+    return overrides
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    output = open(args.output, 'w', newline='') if args.output else sys.stdout
+    try:
+        writer = WRITERS[args.format](output)
+        # progress goes to stderr so stdout carries only results
+        with contextlib.redirect_stdout(sys.stderr):
+            name_checker = NameChecker(
+                env_type=EnvType[args.env],
+                names=args.names,
+                batch_size=args.batch_size,
+                batch_limit=args.batch_limit,
+                domain_endings=args.endings,
+                test_mode=args.test_mode,
+                config_overrides=get_overrides(args),
+                providers=args.providers,
+                delta=args.delta,
+                retry_stored=args.retry_stored,
+            )
+            try:
+                name_checker.get_stages()
+            except ValueError as e:
+                parser.error(str(e))
+            if args.pipeline:
+                name_checker.run_pipeline(resume=args.resume, on_batch=writer.write)
+            else:
+                for batch_results in name_checker.iter_results(resume=args.resume):
+                    writer.write(batch_results)
+            name_checker.results_store.close()
+            print(f"Wrote {writer.count} results.")
+    except KeyboardInterrupt:
+        print('Interrupted; rerun with --resume to continue.', file=sys.stderr)
+        return 130
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return 0
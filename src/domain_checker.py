@@ -1,9 +1,16 @@
-import time
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Union
 
 import requests
 
+from src.domain_planner import DomainPlanner
+from src.utils.circuit_breaker import CircuitBreaker, circuit_breaker_from_config
 from src.utils.config_helper import ConfigHelper, EnvType
+from src.utils.dns_resolver import DnsResolver, StaticResolver
+from src.utils.http_session import session_from_config
+from src.utils.metrics import metrics
+from src.utils.rate_limiter import RateLimiter, rate_limiter_from_config
+from src.utils.result_cache import ResultCache
 
 
 # =============================================================================================== #
@@ -16,13 +23,36 @@ class DomainChecker:
         env_type: EnvType,
         endings: Optional[List[str]] = None,
         max_retries: Optional[int] = None,
-        test_mode: Optional[bool] = False
+        max_workers: Optional[int] = None,
+        test_mode: Optional[bool] = False,
+        config_helper: Optional[ConfigHelper] = None,
+        session: Optional[requests.Session] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResultCache] = None,
+        resolver: Optional[Union[DnsResolver, StaticResolver]] = None,
+        primary_ending: Optional[str] = None,
+        short_circuit: Optional[bool] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None
     ) -> None:
         self.host_names = host_names
         self.env_type = env_type
         self.endings = endings or ["com"]
-        self.cfg = ConfigHelper(self.env_type, test_mode)
+        self.cfg = config_helper or ConfigHelper(self.env_type, test_mode)
         self._set_max_retries(max_retries)
+        self._set_max_workers(max_workers)
+        self.session = session or session_from_config(self.cfg)
+        self.rate_limiter = rate_limiter or rate_limiter_from_config(self.cfg, 'GoDaddy')
+        self.circuit_breaker = circuit_breaker or circuit_breaker_from_config(self.cfg, 'GoDaddy')
+        self.cache = cache
+        self.resolver = resolver
+        self.failures = {}
+        if primary_ending is None:
+            primary_ending = self.cfg.godaddy_primary_ending
+        if short_circuit is None:
+            short_circuit = self.cfg.godaddy_short_circuit
+        self.planner = DomainPlanner(
+            self.endings, primary_ending=primary_ending, short_circuit=short_circuit
+        )
         self.domains = self.get_domains()
         self.api_headers = self.get_api_headers()
 
@@ -31,6 +61,11 @@ class DomainChecker:
         if max_retries is not None:
             self.cfg.godaddy_max_retries = max_retries
 
+    def _set_max_workers(self, max_workers: int) -> None:
+        """Set the maximum number of domain checks in flight."""
+        if max_workers is not None:
+            self.cfg.godaddy_max_workers = max_workers
+
     def get_api_headers(self) -> Dict[str, str]:
         """Generate the API headers required for the GoDaddy API request."""
         api_key = self.cfg.godaddy_api_key
@@ -48,35 +83,187 @@ class DomainChecker:
                 domains.append(f"{hostname}.{ending}")
         return domains
 
-    def check_domain(self, domain: str) -> bool:
-        """Check the availability of a single domain."""
+    def _allow_request(self) -> bool:
+        """Check the circuit breaker before calling GoDaddy."""
+        return self.circuit_breaker is None or self.circuit_breaker.allow()
+
+    def _record_response(self, response: Optional[requests.Response]) -> None:
+        """Report a response, or None for a failed request, to the circuit breaker."""
+        if self.circuit_breaker is None:
+            return
+        if response is None:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_status(response.status_code)
+
+    def check_domain(self, domain: str) -> Optional[bool]:
+        """Check the availability of a single domain; None when it could not be determined.
+
+        The reason a domain could not be checked is kept in failures.
+        """
         endpoint = f"{self.cfg.godaddy_api_url}?domain={domain}"
 
-        for _ in range(self.cfg.godaddy_max_retries or 0):
-            response = requests.get(endpoint, headers=self.api_headers)
+        for attempt in range(self.cfg.godaddy_max_retries or 0):
+            if not self._allow_request():
+                self.failures[domain] = "circuit open"
+                return None
+            try:
+                self.rate_limiter.acquire()
+                with metrics.timer("request_seconds", provider="GoDaddy", endpoint="available"):
+                    response = self.session.get(endpoint, headers=self.api_headers)
+            except Exception as e:
+                metrics.inc("request_errors_total", provider="GoDaddy")
+                print(f"ERROR: {e}")
+                self._record_response(None)
+                self.failures[domain] = str(e)
+                return None
+            metrics.inc("requests_total", provider="GoDaddy", endpoint="available",
+                        status=response.status_code)
+            self.rate_limiter.update(response.headers)
+            self._record_response(response)
 
             if response.status_code == 200:
                 data = response.json()
                 return data["available"]
 
             if response.status_code == 429:
-                print("ERROR: TOO_MANY_REQUESTS -> pausing for 30 seconds...")
-                if not self.cfg.test_mode:
-                    time.sleep(30)
+                metrics.inc("rate_limited_total", provider="GoDaddy")
+                delay = self.rate_limiter.backoff(attempt, response.headers)
+                print(f"ERROR: TOO_MANY_REQUESTS -> backing off for {delay:.1f} seconds...")
             else:
                 print(f"ERROR: {response.status_code} -> {response.text}")
-                return False
+                self.failures[domain] = f"HTTP {response.status_code}"
+                return None
 
         print(f"ERROR: Failed to fetch data after {self.cfg.godaddy_max_retries} retries.")
-        return False
+        metrics.inc("retries_exhausted_total", provider="GoDaddy")
+        self.failures[domain] = "retries exhausted"
+        return None
+
+    def _fail_bulk(self, domains: List[str], reason: str) -> Dict[str, Optional[bool]]:
+        """Leave every domain of a failed bulk request unknown, with the reason in failures."""
+        for domain in domains:
+            self.failures[domain] = reason
+        return dict.fromkeys(domains)
+
+    def check_domains_bulk(self, domains: List[str]) -> Dict[str, Optional[bool]]:
+        """Check up to BULK_LIMIT domains with a single bulk availability request.
+
+        Domains the API reports errors for are left out of the returned mapping, to be checked
+        one by one. When the whole request fails or the circuit breaker is open, every domain is
+        None with the reason in failures, rather than multiplying the requests to an overloaded
+        API.
+        """
+        for attempt in range(self.cfg.godaddy_max_retries or 0):
+            if not self._allow_request():
+                return self._fail_bulk(domains, "circuit open")
+            try:
+                self.rate_limiter.acquire()
+                with metrics.timer("request_seconds", provider="GoDaddy", endpoint="bulk"):
+                    response = self.session.post(
+                        self.cfg.godaddy_api_url,
+                        headers=self.api_headers,
+                        params={"checkType": "FAST"},
+                        json=domains,
+                    )
+            except Exception as e:
+                metrics.inc("request_errors_total", provider="GoDaddy")
+                print(f"ERROR: {e}")
+                self._record_response(None)
+                return self._fail_bulk(domains, str(e))
+            metrics.inc("requests_total", provider="GoDaddy", endpoint="bulk",
+                        status=response.status_code)
+            self.rate_limiter.update(response.headers)
+            self._record_response(response)
+
+            if response.status_code in (200, 203):
+                data = response.json()
+                requested = {domain.lower(): domain for domain in domains}
+                results = {}
+                for item in data.get("domains", []):
+                    domain = requested.get(item["domain"].lower())
+                    if domain is not None:
+                        results[domain] = item["available"]
+                return results
+
+            if response.status_code == 429:
+                metrics.inc("rate_limited_total", provider="GoDaddy")
+                delay = self.rate_limiter.backoff(attempt, response.headers)
+                print(f"ERROR: TOO_MANY_REQUESTS -> backing off for {delay:.1f} seconds...")
+            else:
+                print(f"ERROR: {response.status_code} -> {response.text}")
+                return self._fail_bulk(domains, f"HTTP {response.status_code}")
+
+        print(f"ERROR: Failed to fetch bulk data after {self.cfg.godaddy_max_retries} retries.")
+        metrics.inc("retries_exhausted_total", provider="GoDaddy")
+        return self._fail_bulk(domains, "retries exhausted")
+
+    def check_domains(self, domains: List[str]) -> List[Optional[bool]]:
+        """Check the availability of many domains concurrently, preserving input order."""
+        max_workers = min(self.cfg.godaddy_max_workers, len(domains))
+        if max_workers <= 1:
+            return [self.check_domain(domain) for domain in domains]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.check_domain, domains))
+
+    def prescreen(self, domains: List[str]) -> List[str]:
+        """Find the domains that DNS shows are already registered, concurrently."""
+        if not self.resolver or not domains:
+            return []
+        max_workers = min(self.cfg.dns_max_workers, len(domains))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            registered = list(executor.map(self.resolver.is_registered, domains))
+        taken = [domain for domain, is_registered in zip(domains, registered) if is_registered]
+        metrics.inc("dns_prescreen_total", len(taken), result="taken")
+        metrics.inc("dns_prescreen_total", len(domains) - len(taken), result="ambiguous")
+        return taken
+
+    def resolve(self, domains: List[str]) -> Dict[str, Optional[bool]]:
+        """Resolve domains from the cache, the DNS pre-screen, bulk requests and single checks."""
+        availability = self.cache.get_many("GoDaddy", domains) if self.cache else {}
+        uncached = [domain for domain in domains if domain not in availability]
+        availability.update(dict.fromkeys(self.prescreen(uncached), False))
+        unscreened = [domain for domain in uncached if domain not in availability]
+
+        bulk_limit = self.cfg.godaddy_bulk_limit
+        for i in range(0, len(unscreened), bulk_limit):
+            availability.update(self.check_domains_bulk(unscreened[i: i + bulk_limit]))
+
+        unresolved = [domain for domain in uncached if domain not in availability]
+        metrics.inc("bulk_fallbacks_total", len(unresolved), provider="GoDaddy")
+        availability.update(zip(unresolved, self.check_domains(unresolved)))
+
+        if self.cache:
+            self.cache.set_many("GoDaddy", {
+                domain: availability[domain]
+                for domain in uncached if domain not in self.failures
+            })
+        return availability
 
     def check(self) -> List[Dict[str, bool]]:
-        """Check the availability of all domains and return the results."""
+        """Check the availability of all domains and return the results.
+
+        Domains are checked one ending at a time, primary ending first; domains skipped by the
+        planner's short-circuit are left out of the results. Domains that could not be checked
+        are None, with the failure under "reason".
+        """
         results = []
+        availability = {}
+
+        def _is_taken(domain: str) -> bool:
+            return availability.get(domain) is False and domain not in self.failures
+
+        for ending, domains in self.planner.plan(self.host_names, _is_taken):
+            availability.update(self.resolve(domains))
+            skipped = len(self.host_names) - len(domains)
+            metrics.inc("domains_skipped_total", skipped, provider="GoDaddy")
 
         for domain in self.domains:
-            is_available = self.check_domain(domain)
-            host_name, domain_ending = domain.rsplit(".", 1)
-            results.append({"name": host_name, domain: is_available})
+            if domain in availability:
+                host_name, domain_ending = domain.rsplit(".", 1)
+                result = {"name": host_name, domain: availability[domain]}
+                if domain in self.failures:
+                    result["reason"] = self.failures[domain]
+                results.append(result)
 
         return results
@@ -0,0 +1,49 @@
+from typing import Callable, Iterator, List, Optional, Set, Tuple
+
+
+# =============================================================================================== #
+
+class DomainPlanner:
+    """Plan domain checks as one group per ending, with the primary ending first.
+
+    Grouping by ending keeps every bulk request to a single TLD. With short_circuit, host names
+    whose primary-ending domain is taken are left out of the groups for the other endings.
+    """
+
+    def __init__(
+        self,
+        endings: List[str],
+        primary_ending: Optional[str] = None,
+        short_circuit: bool = False,
+    ) -> None:
+        self.endings = list(dict.fromkeys(endings))
+        self.primary_ending = primary_ending if primary_ending in self.endings else None
+        self.short_circuit = short_circuit and self.primary_ending is not None
+
+    def ordered_endings(self) -> List[str]:
+        """Get the endings in check order: the primary ending, then the rest as given."""
+        if self.primary_ending is None:
+            return list(self.endings)
+        others = [ending for ending in self.endings if ending != self.primary_ending]
+        return [self.primary_ending] + others
+
+    def plan(
+        self,
+        host_names: List[str],
+        is_taken: Callable[[str], bool],
+    ) -> Iterator[Tuple[str, List[str]]]:
+        """Yield (ending, domains) groups in check order.
+
+        is_taken is called on the primary-ending domains once their group has been checked, so
+        the caller must record a group's results before requesting the next group.
+        """
+        skipped: Set[str] = set()
+        for ending in self.ordered_endings():
+            yield ending, [
+                f"{host_name}.{ending}" for host_name in host_names if host_name not in skipped
+            ]
+            if self.short_circuit and ending == self.primary_ending:
+                skipped = {
+                    host_name for host_name in host_names
+                    if is_taken(f"{host_name}.{ending}")
+                }
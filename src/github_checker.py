@@ -1,46 +1,210 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import requests
 
+from src.utils.circuit_breaker import CircuitBreaker, circuit_breaker_from_config
 from src.utils.config_helper import ConfigHelper
+from src.utils.http_session import session_from_config
+from src.utils.metrics import metrics
+from src.utils.rate_limiter import RateLimiter, rate_limiter_from_config
+from src.utils.result_cache import ResultCache
 
 
 # =============================================================================================== #
 
 class GitHubChecker:
 
-    def __init__(self, usernames: List[str], config_helper: ConfigHelper) -> None:
+    def __init__(
+        self,
+        usernames: List[str],
+        config_helper: ConfigHelper,
+        session: Optional[requests.Session] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResultCache] = None,
+        use_graphql: Optional[bool] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ) -> None:
         self.usernames = usernames
         self.cfg = config_helper
+        self.use_graphql = self.cfg.github_use_graphql if use_graphql is None else use_graphql
+        self.session = session or session_from_config(self.cfg)
+        self.rate_limiter = rate_limiter or rate_limiter_from_config(self.cfg, 'GitHub')
+        self.circuit_breaker = circuit_breaker or circuit_breaker_from_config(self.cfg, 'GitHub')
+        self.cache = cache
+        self.failures = {}
 
 
-    def check_username(self, username: str) -> bool:
-        """Check the availability of a single username."""
+    def _allow_request(self) -> bool:
+        """Check the circuit breaker before calling GitHub."""
+        return self.circuit_breaker is None or self.circuit_breaker.allow()
+
+    def _record_response(self, response: Optional[requests.Response]) -> None:
+        """Report a response, or None for a failed request, to the circuit breaker."""
+        if self.circuit_breaker is None:
+            return
+        if response is None:
+            self.circuit_breaker.record_failure()
+        else:
+            rate_limited = self._is_rate_limited(response)
+            self.circuit_breaker.record_status(response.status_code, rate_limited)
+
+    def check_username(self, username: str) -> Optional[bool]:
+        """Check the availability of a single username; None when it could not be determined.
+
+        The reason a username could not be checked is kept in failures.
+        """
         endpoint = f"{self.cfg.github_api_url}{username}"
         headers = {'Authorization': f"token {self.cfg.github_token}"}
 
-        try:
-            response = requests.get(url=endpoint, headers=headers)
+        for attempt in range(self.cfg.github_max_retries or 0):
+            if not self._allow_request():
+                self.failures[username] = 'circuit open'
+                return None
+            try:
+                self.rate_limiter.acquire()
+                with metrics.timer('request_seconds', provider='GitHub', endpoint='users'):
+                    response = self.session.get(url=endpoint, headers=headers)
+                metrics.inc('requests_total', provider='GitHub', endpoint='users',
+                            status=response.status_code)
+                self.rate_limiter.update(response.headers)
+                self._record_response(response)
+
+                if response.status_code == 404:
+                    return True
+                elif response.status_code == 200:
+                    return False
+                elif self._is_rate_limited(response):
+                    metrics.inc('rate_limited_total', provider='GitHub')
+                    delay = self.rate_limiter.backoff(attempt, response.headers)
+                    print(f"ERROR: RATE_LIMITED -> backing off for {delay:.1f} seconds...")
+                else:
+                    print(f"ERROR: {response.status_code} -> {response.text}")
+                    self.failures[username] = f"HTTP {response.status_code}"
+                    return None
+
+            except Exception as e:
+                metrics.inc('request_errors_total', provider='GitHub')
+                print(f"ERROR: {e}")
+                self._record_response(None)
+                self.failures[username] = str(e)
+                return None
+
+        print(f"ERROR: Failed to fetch data after {self.cfg.github_max_retries} retries.")
+        metrics.inc('retries_exhausted_total', provider='GitHub')
+        self.failures[username] = 'retries exhausted'
+        return None
+
+    @staticmethod
+    def _is_rate_limited(response: requests.Response) -> bool:
+        """Check for GitHub's secondary (429) or exhausted primary (403) rate limit."""
+        if response.status_code == 429:
+            return True
+        return response.status_code == 403 and (
+            response.headers.get('X-RateLimit-Remaining') == '0'
+            or 'Retry-After' in response.headers
+        )
+
+    @staticmethod
+    def build_graphql_query(usernames: List[str]) -> Dict:
+        """Build one query that looks up every username as both a user and an organization."""
+        variables = {f"l{i}": username for i, username in enumerate(usernames)}
+        params = ', '.join(f"${key}: String!" for key in variables)
+        fields = ' '.join(
+            f"u{i}: user(login: $l{i}) {{ login }} o{i}: organization(login: $l{i}) {{ login }}"
+            for i in range(len(usernames))
+        )
+        return {'query': f"query({params}) {{ {fields} }}", 'variables': variables}
+
+    @staticmethod
+    def parse_graphql_response(usernames: List[str], body: Dict) -> Dict[str, bool]:
+        """Map usernames to availability; names with errors other than NOT_FOUND are left out."""
+        data = body.get('data') or {}
+        failed_aliases = {
+            error['path'][0]
+            for error in body.get('errors') or []
+            if error.get('type') != 'NOT_FOUND' and error.get('path')
+        }
+        if not data and body.get('errors'):
+            return {}
+
+        results = {}
+        for i, username in enumerate(usernames):
+            aliases = (f"u{i}", f"o{i}")
+            if any(alias in failed_aliases or alias not in data for alias in aliases):
+                continue
+            results[username] = all(data[alias] is None for alias in aliases)
+        return results
 
-            if response.status_code == 404:
-                return True
-            elif response.status_code == 200:
-                return False
-            else:
-                print(f"ERROR: {response.status_code} -> {response.text}")
-                return False
+    def check_usernames_graphql(self, usernames: List[str]) -> Dict[str, bool]:
+        """Check up to GRAPHQL_BATCH_SIZE usernames with a single GraphQL request.
 
-        except Exception as e:
-            print(f"ERROR: {e}")
-            return False
+        Usernames the response reports unexpected errors for are left out of the returned mapping,
+        as is every username while the circuit breaker is open.
+        """
+        headers = {'Authorization': f"bearer {self.cfg.github_token}"}
+        query = self.build_graphql_query(usernames)
 
+        for attempt in range(self.cfg.github_max_retries or 0):
+            if not self._allow_request():
+                return {}
+            try:
+                self.rate_limiter.acquire()
+                with metrics.timer('request_seconds', provider='GitHub', endpoint='graphql'):
+                    response = self.session.post(
+                        url=self.cfg.github_graphql_url, headers=headers, json=query
+                    )
+                metrics.inc('requests_total', provider='GitHub', endpoint='graphql',
+                            status=response.status_code)
+                self.rate_limiter.update(response.headers)
+                self._record_response(response)
+
+                if response.status_code == 200:
+                    return self.parse_graphql_response(usernames, response.json())
+                elif self._is_rate_limited(response):
+                    metrics.inc('rate_limited_total', provider='GitHub')
+                    delay = self.rate_limiter.backoff(attempt, response.headers)
+                    print(f"ERROR: RATE_LIMITED -> backing off for {delay:.1f} seconds...")
+                else:
+                    print(f"ERROR: {response.status_code} -> {response.text}")
+                    return {}
+
+            except Exception as e:
+                metrics.inc('request_errors_total', provider='GitHub')
+                print(f"ERROR: {e}")
+                self._record_response(None)
+                return {}
+
+        print(f"ERROR: Failed to fetch GraphQL data after {self.cfg.github_max_retries} retries.")
+        metrics.inc('retries_exhausted_total', provider='GitHub')
+        return {}
 
     def check(self) -> List[Dict[str, bool]]:
-        """Check the availability of all usernames and return the results."""
-        results = []
+        """Check the availability of all usernames and return the results.
 
-        for username in self.usernames:
-            is_available = self.check_username(username)
-            results.append({'name': username, 'GitHub': is_available})
+        Usernames that could not be checked are None, with the failure under 'reason'.
+        """
+        availability = self.cache.get_many('GitHub', self.usernames) if self.cache else {}
+        uncached = [username for username in self.usernames if username not in availability]
 
+        if self.use_graphql:
+            batch_size = self.cfg.github_graphql_batch_size
+            for i in range(0, len(uncached), batch_size):
+                availability.update(self.check_usernames_graphql(uncached[i: i + batch_size]))
+
+        for username in uncached:
+            if username not in availability:
+                availability[username] = self.check_username(username)
+
+        if self.cache:
+            self.cache.set_many('GitHub', {
+                username: availability[username]
+                for username in uncached if username not in self.failures
+            })
+
+        results = []
+        for username in self.usernames:
+            result = {'name': username, 'GitHub': availability[username]}
+            if username in self.failures:
+                result['reason'] = self.failures[username]
+            results.append(result)
         return results
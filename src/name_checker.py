@@ -1,11 +1,34 @@
+import hashlib
 import json
+import math
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice, product
 
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
 
-from src.utils.config_helper import ConfigHelper, EnvType
+from src.utils.config_helper import ConfigHelper, EnvType, Overrides
+from src.base_checker import BaseChecker
+from src.checker_registry import registry_from_config
 from src.domain_checker import DomainChecker
 from src.github_checker import GitHubChecker
+from src.name_filter import NameFilter, name_filter_from_config
+from src.name_scorer import NameScorer, name_scorer_from_config
+from src.pipeline import BatchPipeline
+from src.seed_delta import SeedDelta
+from src.result_table import ResultTable
+from src.retry_queue import RetryQueue
+from src.utils.dns_resolver import resolver_from_config
+from src.utils.http_session import session_from_config
+from src.utils.rate_limiter import rate_limiter_from_config
+from src.utils.result_cache import cache_from_config
+from src.utils.results_store import results_store_from_config
+from src.utils.checkpoint import CheckpointMismatchError, checkpoint_from_config
+from src.utils.circuit_breaker import circuit_breaker_from_config
+from src.utils.metrics import configure_metrics, metrics
+from src.utils.name_index import NameIndex, canonical_name
+from src.utils.sharding import ShardStrategy, iter_hash_shard, shard_bounds, shard_filename
 
 
 # =============================================================================================== #
@@ -21,6 +44,17 @@ class NameChecker:
         batch_limit: Optional[int] = None,
         domain_max_retries: Optional[int] = None,
         domain_endings: Optional[List[str]] = None,
+        test_mode: Optional[bool] = False,
+        name_filter: Optional[NameFilter] = None,
+        shard_index: int = 0,
+        shard_count: int = 1,
+        shard_strategy: Union[ShardStrategy, str] = ShardStrategy.RANGE,
+        config_overrides: Optional[Overrides] = None,
+        providers: Optional[List[str]] = None,
+        name_scorer: Optional[NameScorer] = None,
+        stop_after: Optional[int] = None,
+        delta: bool = False,
+        retry_stored: bool = False,
     ) -> None:
         self.env_type = env_type
         self.names = names
@@ -29,18 +63,106 @@ class NameChecker:
         self.batch_limit = batch_limit
         self.domain_max_retries = domain_max_retries
         self.domain_endings = domain_endings
+        self.test_mode = test_mode
+        self.name_filter = name_filter
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+        self.shard_strategy = ShardStrategy(shard_strategy)
+        self.config_overrides = config_overrides
+        self.providers = providers
+        self.name_scorer = name_scorer
+        self.stop_after = stop_after
+        self.delta = delta
+        self.retry_stored = retry_stored
         self.__post_init__()
 
     def __post_init__(self) -> None:
         """Post initialization to set class properties."""
-        self.cfg = ConfigHelper(self.env_type)
+        self.cfg = ConfigHelper(self.env_type, self.test_mode, self.config_overrides)
+        self.configure_shard()
+        self.session = session_from_config(self.cfg)
+        self.rate_limiters = {
+            provider: rate_limiter_from_config(self.cfg, provider)
+            for provider in ('GoDaddy', 'GitHub')
+        }
+        self.circuit_breakers = {
+            provider: circuit_breaker_from_config(self.cfg, provider)
+            for provider in ('GoDaddy', 'GitHub')
+        }
+        self.cache = cache_from_config(self.cfg)
+        self.registry = registry_from_config(self.cfg)
+        self.plugins = self.get_plugins()
+        self.resolver = resolver_from_config(self.cfg)
+        self.results_store = results_store_from_config(self.cfg, migrate=self.shard_count == 1)
+        self.checkpoint = checkpoint_from_config(self.cfg)
+        self.name_filter = self.name_filter or name_filter_from_config(self.cfg)
+        self.metrics_path = configure_metrics(self.cfg)
         self.seeds = self.get_seeds()
-        self.names = self.force_list(self.names) or self.get_names()
+        self.name_index = NameIndex()
+        self.retry_queue = RetryQueue()
+        if self.name_scorer is None:
+            self.name_scorer = name_scorer_from_config(self.cfg, self.get_seed_weights())
+        if self.stop_after is None:
+            self.stop_after = self.cfg.priority_stop_after
+        self.names = self.force_list(self.names) or None
+        self.seed_delta = self.get_seed_delta() if self.delta else None
         self.batch_size = self.batch_size or self.cfg.batch_size
         self.batch_retries = self.batch_retries or self.cfg.batch_retries
         self.batch_limit = self.batch_limit
+        self.name_count = self.get_name_count()
+        self.batch_count = self.get_batch_count()
         self.batches = self.create_batches()
 
+    def configure_shard(self) -> None:
+        """Give a shard its own output files and credentials, or a share of the rate limits.
+
+        Shards without their own credentials in secrets.ini split the shared quota evenly.
+        """
+        if not 0 <= self.shard_index < self.shard_count:
+            raise ValueError(
+                f"Shard index {self.shard_index} is out of range for {self.shard_count} shards."
+            )
+        if self.shard_count == 1:
+            return
+        for attr in ('results_db_filename', 'checkpoint_filename', 'metrics_filename'):
+            filename = getattr(self.cfg, attr)
+            setattr(self.cfg, attr, shard_filename(filename, self.shard_index, self.shard_count))
+
+        providers = self.cfg.apply_shard_credentials(self.shard_index)
+        if 'GoDaddy' not in providers:
+            self.cfg.godaddy_rate_limit = max(1, self.cfg.godaddy_rate_limit // self.shard_count)
+        if 'GitHub' not in providers:
+            self.cfg.github_rate_limit = max(1, self.cfg.github_rate_limit // self.shard_count)
+
+    def reload_config(self) -> bool:
+        """Pick up changes to the config files between batches.
+
+        Settings read per batch, like retries, workers and the bulk limit, apply from the next
+        batch; the run's batch layout, output files, rate limiters and circuit breakers are kept.
+        """
+        output_dir = self.cfg.output_dir
+        if not self.cfg.reload_if_changed():
+            return False
+        self.cfg.output_dir = output_dir
+        self.configure_shard()
+        print("Config files changed -> reloaded the settings.")
+        return True
+
+    def get_plugins(self) -> Dict[str, Type[BaseChecker]]:
+        """Get the checker classes enabled in [Checkers] and give each a rate limiter and breaker.
+
+        Plugin providers have no per-shard credentials, so each shard keeps a share of their quota.
+        """
+        plugins = {provider: self.registry.get(provider) for provider in self.cfg.checkers_enabled}
+        for provider, checker in plugins.items():
+            self.rate_limiters[provider] = checker.create_rate_limiter(
+                self.cfg, share=self.shard_count
+            )
+            self.circuit_breakers[provider] = circuit_breaker_from_config(self.cfg, provider)
+            if self.cache is not None:
+                self.cache.ttls.setdefault(provider, checker.get_cache_ttls(self.cfg))
+        return plugins
+
     @staticmethod
     def force_list(string_or_list: Union[str, List[str], None]) -> List[str]:
         """Force a string or list of strings to a list of strings."""
@@ -58,56 +180,253 @@ class NameChecker:
             return json.load(f)
 
     def get_seed_items(self, seed_position: int) -> List[str]:
-        """Get the list of seed items for a given seed position."""
+        """Get the list of seed items for a given seed position, without repeats in any case."""
         for seed in self.seeds:
             if seed["seedPosition"] == seed_position:
-                return seed["seedItems"]
+                items = {}
+                for item in seed["seedItems"]:
+                    items.setdefault(canonical_name(item), item)
+                return list(items.values())
         return []
 
-    def get_names(self) -> List[str]:
-        """Generate the list of names to check."""
+    def get_seed_weights(self) -> Dict[str, float]:
+        """Get the optional user-assigned seedWeights of every seed position."""
+        weights = {}
+        for seed in self.seeds:
+            weights.update(seed.get("seedWeights", {}))
+        return weights
+
+    def get_seed_item_lists(self) -> List[List[str]]:
+        """Get the seed items for every seed position, in position order."""
         seed_positions = sorted([seed["seedPosition"] for seed in self.seeds])
+        return [self.get_seed_items(position) for position in seed_positions]
 
-        def _combine_items(pos_index: int) -> List[str]:
-            """Recursively combine seed items to generate names."""
-            if pos_index == len(seed_positions) - 1:
-                return self.get_seed_items(seed_positions[pos_index])
-            current_items = self.get_seed_items(seed_positions[pos_index])
-            next_items = _combine_items(pos_index + 1)
-            combined = [
-                c_item + n_item for c_item in current_items for n_item in next_items
-            ]
-            return combined
-
-        return _combine_items(0)
-
-    def create_batches(self) -> List[List[str]]:
-        """Create batches of names to check."""
-        if self.names is None:
-            return []
-        batches = []
-        batch_size = self.batch_size or 1
-        for i in range(0, len(self.names), batch_size):
-            batches.append(self.names[i: i + batch_size])
+    def get_previous_seed_item_lists(self) -> Optional[List[List[str]]]:
+        """Get the seed item lists of the last complete run recorded in the results store."""
+        seed_items = self.results_store.get_metadata('seed_items')
+        return json.loads(seed_items) if seed_items else None
 
-        if self.batch_limit is not None and len(batches) > self.batch_limit > 0:
-            return batches[: self.batch_limit]
-        else:
+    def get_seed_delta(self) -> Optional[SeedDelta]:
+        """Get the seed combinations added since the last complete run, or None to check all."""
+        if self.names is not None:
+            return None
+        previous = self.get_previous_seed_item_lists()
+        if previous is None or len(previous) != len(self.get_seed_item_lists()):
+            print("No comparable previous seeds recorded; checking every name.")
+            return None
+        seed_delta = SeedDelta(previous, self.get_seed_item_lists())
+        print(f"Checking {len(seed_delta)} names from new seed items {seed_delta.added_items()}.")
+        return seed_delta
+
+    def record_seed_items(self) -> None:
+        """Record the seed item lists once all their names were checked, as the delta run base."""
+        if self.names is not None or self.batch_count * self.batch_size < self.name_count:
+            return
+        self.results_store.set_metadata('seed_items', json.dumps(self.get_seed_item_lists()))
+
+    def get_all_names(self) -> Iterator[str]:
+        """Lazily generate every name in the name space, across all shards.
+
+        In a delta run the name space is only the combinations added since the last complete run.
+        """
+        if self.names is not None:
+            yield from self.names
+            return
+        if self.seed_delta is not None:
+            yield from self.seed_delta
+            return
+        item_lists = self.get_seed_item_lists()
+        if not item_lists:
+            return
+        for items in product(*item_lists):
+            yield "".join(items)
+
+    def get_names(self, start: int = 0) -> Iterator[str]:
+        """Lazily generate this shard's names to check, skipping the first start names."""
+        names = self.get_all_names()
+        if self.shard_count > 1 and self.shard_strategy == ShardStrategy.HASH:
+            names = iter_hash_shard(names, self.shard_index, self.shard_count)
+        elif self.shard_count > 1:
+            names = islice(names, *self.get_shard_bounds())
+        yield from islice(names, start, None)
+
+    def get_seeds_fingerprint(self) -> str:
+        """Fingerprint the name space so checkpoints are only resumed against the same names."""
+        source = self.names if self.names is not None else self.get_seed_item_lists()
+        if self.seed_delta is not None:
+            source = [source, self.get_previous_seed_item_lists()]
+        if self.shard_count > 1:
+            source = [source, self.shard_index, self.shard_count, self.shard_strategy.value]
+        if self.name_scorer is not None:
+            source = [source, self.name_scorer.describe(), self.cfg.priority_window]
+        return hashlib.sha256(json.dumps(source).encode("utf-8")).hexdigest()
+
+    def get_name_count(self) -> int:
+        """Get the number of names in this shard.
+
+        Range shards are counted without generating names; hash shards need one pass over them.
+        """
+        if self.shard_count > 1 and self.shard_strategy == ShardStrategy.HASH:
+            return sum(1 for _ in self.get_names())
+        elif self.shard_count > 1:
+            shard_start, shard_stop = self.get_shard_bounds()
+            return shard_stop - shard_start
+        return self.get_total_name_count()
+
+    def get_total_name_count(self) -> int:
+        """Get the total number of names across all shards without generating them."""
+        if self.names is not None:
+            return len(self.names)
+        if self.seed_delta is not None:
+            return len(self.seed_delta)
+        item_lists = self.get_seed_item_lists()
+        if not item_lists:
+            return 0
+        return math.prod(len(items) for items in item_lists)
+
+    def get_shard_bounds(self) -> Tuple[int, int]:
+        """Get the [start, stop) positions of this range shard in the full name space."""
+        return shard_bounds(self.get_total_name_count(), self.shard_index, self.shard_count)
+
+    def get_batch_count(self) -> int:
+        """Get the total number of batches without generating them."""
+        batch_count = math.ceil(self.name_count / (self.batch_size or 1))
+        if self.batch_limit is not None and batch_count > self.batch_limit > 0:
+            return self.batch_limit
+        return batch_count
+
+    @staticmethod
+    def iter_batches(names: Iterable[str], batch_size: int) -> Iterator[List[str]]:
+        """Split a stream of names into lists of at most batch_size names."""
+        names = iter(names)
+        while True:
+            batch = list(islice(names, batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def create_batches(self, start_batch: int = 0) -> Iterator[List[str]]:
+        """Lazily create batches of names to check, starting at batch index start_batch.
+
+        Batches are cut from the unfiltered name stream, so batch indexes stay aligned with name
+        positions. With a name scorer the stream is reordered best-first, deterministically, so a
+        batch index still identifies the same names on resume. Names seen before under any
+        spelling, and names rejected by the name filter, are dropped from their batch and recorded
+        in the results store instead.
+        """
+        batch_size = self.batch_size or 1
+        names = self.get_names()
+        if self.name_scorer is not None:
+            names = self.name_scorer.prioritize(names, self.cfg.priority_window)
+        # replay the names of completed batches into a fresh index, so their other spellings
+        # are still recognized as duplicates after a resume
+        self.name_index = NameIndex()
+        self.name_index.update(islice(names, start_batch * batch_size))
+        batches = self.iter_batches(names, batch_size)
+        batches = islice(batches, max(0, self.batch_count - start_batch))
+        batches = (self.dedupe_batch(batch) for batch in batches)
+        if self.name_filter is None:
             return batches
+        return (self.filter_batch(batch) for batch in batches)
+
+    def dedupe_batch(self, batch: List[str]) -> List[str]:
+        """Drop names already seen under any spelling and record other spellings as aliases."""
+        unique, aliases = self.name_index.dedupe(batch)
+        if aliases:
+            self.results_store.add_aliases(aliases)
+        if len(unique) < len(batch):
+            metrics.inc('duplicate_names_total', len(batch) - len(unique))
+        return unique
 
-    def process_batch(self, batch: List[str]) -> List[Dict[str, bool]]:
-        """Process a batch of names."""
-        print(f"Processing batch: {batch} of {len(self.batches)}...")
-        domain_checker = DomainChecker(
+    def filter_batch(self, batch: List[str]) -> List[str]:
+        """Drop names that cannot be valid and record why they were rejected."""
+        accepted, rejected = self.name_filter.filter(batch)
+        if rejected:
+            self.results_store.reject(rejected)
+        return accepted
+
+    def create_domain_checker(self, batch: List[str],
+                              endings: Optional[List[str]] = None) -> DomainChecker:
+        """Create a domain checker for a batch that shares this run's resources."""
+        return DomainChecker(
             host_names=batch,
+            env_type=self.env_type,
             config_helper=self.cfg,
             max_retries=self.domain_max_retries,
-            endings=self.domain_endings,
+            endings=endings or self.domain_endings,
+            session=self.session,
+            rate_limiter=self.rate_limiters['GoDaddy'],
+            circuit_breaker=self.circuit_breakers['GoDaddy'],
+            cache=self.cache,
+            resolver=self.resolver,
         )
-        github_checker = GitHubChecker(usernames=batch, config_helper=self.cfg)
 
-        results = self.aggregate_results(
-            domain_checker.check(), github_checker.check())
+    def create_github_checker(self, batch: List[str]) -> GitHubChecker:
+        """Create a GitHub checker for a batch that shares this run's resources."""
+        return GitHubChecker(
+            usernames=batch,
+            config_helper=self.cfg,
+            session=self.session,
+            rate_limiter=self.rate_limiters['GitHub'],
+            circuit_breaker=self.circuit_breakers['GitHub'],
+            cache=self.cache,
+        )
+
+    def create_plugin_checker(self, provider: str) -> BaseChecker:
+        """Create an enabled plugin checker that shares this run's resources."""
+        return self.plugins[provider](
+            config_helper=self.cfg,
+            session=self.session,
+            rate_limiter=self.rate_limiters[provider],
+            circuit_breaker=self.circuit_breakers[provider],
+            cache=self.cache,
+        )
+
+    def wait_for_provider(self, provider: str) -> None:
+        """Pause while a provider's circuit is open; in the pipeline this pauses only its stage."""
+        circuit_breaker = self.circuit_breakers.get(provider)
+        if circuit_breaker is not None:
+            circuit_breaker.wait()
+
+    def get_stages(self) -> Dict[str, Callable[[List[str]], List[Dict[str, bool]]]]:
+        """Get the per-provider check functions in result order: GoDaddy, GitHub, then plugins."""
+        def _check_domains(batch: List[str]) -> List[Dict[str, bool]]:
+            self.wait_for_provider('GoDaddy')
+            with metrics.timer('stage_seconds', provider='GoDaddy'):
+                return self.create_domain_checker(batch).check()
+
+        def _check_github(batch: List[str]) -> List[Dict[str, bool]]:
+            self.wait_for_provider('GitHub')
+            with metrics.timer('stage_seconds', provider='GitHub'):
+                return self.create_github_checker(batch).check()
+
+        def _plugin_stage(provider: str) -> Callable[[List[str]], List[Dict[str, bool]]]:
+            def _check_plugin(batch: List[str]) -> List[Dict[str, bool]]:
+                self.wait_for_provider(provider)
+                with metrics.timer('stage_seconds', provider=provider):
+                    return self.create_plugin_checker(provider).check(batch)
+            return _check_plugin
+
+        stages = {'GoDaddy': _check_domains, 'GitHub': _check_github}
+        stages.update({provider: _plugin_stage(provider) for provider in self.plugins})
+        if self.providers is None:
+            return stages
+        unknown = set(self.providers) - set(stages)
+        if unknown:
+            raise ValueError(f"Unknown providers: {', '.join(sorted(unknown))}")
+        return {
+            provider: check for provider, check in stages.items() if provider in self.providers
+        }
+
+    def process_batch(self, batch: List[str]) -> ResultTable:
+        """Process a batch of names, checking it with every provider concurrently."""
+        print(f"Processing batch: {batch} of {self.batch_count}...")
+        stages = self.get_stages()
+        with metrics.timer('batch_seconds'), \
+                ThreadPoolExecutor(max_workers=len(stages)) as executor:
+            futures = [executor.submit(check, batch) for check in stages.values()]
+            results = self.aggregate_results(*(future.result() for future in futures))
+        metrics.inc('batches_total')
         return results
 
     # def check(self) -> None:
@@ -137,39 +456,260 @@ class NameChecker:
     #         print(f"Total: {total_available} of "
     #               f"{total_processed} available ({total_percent:.1f}%).")
 
-    def aggregate_results(self, *results) -> List[Dict[str, bool]]:
-        """Aggregate the results from multiple checkers."""
-        aggregated_results = []
-        for result in results:
-            aggregated_results.extend(result)
-        return aggregated_results
+    def aggregate_results(self, *results: List[Dict[str, bool]]) -> ResultTable:
+        """Aggregate the results from multiple checkers into one compact table."""
+        return ResultTable.from_records(*results)
+
+    def report_batch(self, results: ResultTable) -> None:
+        """Print how many names in a batch are available everywhere, and per check."""
+        available = len(results.available_names())
+        print(f"Batch: {available} of {len(results.names)} names available on every check.")
+        for key, counts in results.summary().items():
+            print(f"  {key}: {counts['available']} available, {counts['taken']} taken, "
+                  f"{counts['unknown']} unknown")
+
+    @staticmethod
+    def get_provider(column_key: str) -> str:
+        """Get the provider behind a result column: domain columns ('.com') are GoDaddy's."""
+        return 'GoDaddy' if column_key.startswith('.') else column_key
+
+    def queue_unknown(self, results: ResultTable) -> None:
+        """Queue the names with unknown results to be retried at the end of the run."""
+        for name, column_key in results.unknown():
+            self.retry_queue.add(column_key, name)
+
+    def queue_stored_unknown(self, providers: Iterable[str]) -> None:
+        """Queue the unknown results in the results store for the given providers.
+
+        This picks up unknown results of this run's names that the in-memory queue lost, e.g. from
+        batches finished before a crash and resume. Unknown results of other names, e.g. from an
+        earlier run whose retries were exhausted, are only queued with retry_stored.
+        """
+        providers = set(providers)
+        for name, key in self.results_store.iter_unknown():
+            column_key = ResultTable.column_key(name, key)
+            if self.get_provider(column_key) not in providers:
+                continue
+            if self.retry_stored or name in self.name_index:
+                self.retry_queue.add(column_key, name)
 
-    def save_results(self, results: List[Dict[str, bool]]) -> None:
-        """Save the results to the results file."""
-        # FIXME: this doesn't feel like it will work properly
+    def get_retry_check(self, column_key: str, stages: Dict[str, Callable]) -> Callable:
+        """Get the check that re-checks a result column; a domain column checks just its ending."""
+        if self.get_provider(column_key) != 'GoDaddy':
+            return stages[column_key]
 
+        def _check_ending(batch: List[str]) -> List[Dict[str, bool]]:
+            self.wait_for_provider('GoDaddy')
+            with metrics.timer('stage_seconds', provider='GoDaddy'):
+                return self.create_domain_checker(batch, endings=[column_key[1:]]).check()
+        return _check_ending
+
+    @staticmethod
+    def retry_provider(check: Callable[[List[str]], List[Dict[str, bool]]], names: List[str],
+                       batch_size: int) -> List[Dict[str, bool]]:
+        """Re-check names with one provider, batch by batch."""
+        results = []
+        for batch in NameChecker.iter_batches(names, batch_size):
+            results.extend(check(batch))
+        return results
+
+    def retry_unknown(self) -> Iterator[ResultTable]:
+        """Drain the retry queue, re-checking unknown results for up to batch_retries rounds.
+
+        The queue is first topped up with the unknown results in the results store. Each round
+        waits RETRY_BACKOFF seconds, doubling every round, then re-checks every provider's queued
+        names concurrently; results that are still unknown are queued for the next round. The
+        results of each round are saved and yielded.
+        """
+        stages = self.get_stages()
+        if self.batch_retries:
+            self.queue_stored_unknown(stages)
+        for attempt in range(self.batch_retries or 0):
+            pending = self.retry_queue.pop_all()
+            if not pending:
+                return
+            delay = self.cfg.batch_retry_backoff * 2 ** attempt
+            print(f"Retrying {sum(len(names) for names in pending.values())} unknown results "
+                  f"in {delay} seconds (attempt {attempt + 1} of {self.batch_retries})...")
+            time.sleep(delay)
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                futures = [
+                    executor.submit(self.retry_provider, self.get_retry_check(column_key, stages),
+                                    names, self.batch_size)
+                    for column_key, names in pending.items()
+                ]
+                results = self.aggregate_results(*(future.result() for future in futures))
+            for column_key, names in pending.items():
+                provider = self.get_provider(column_key)
+                metrics.inc('retried_names_total', len(names), provider=provider)
+            self.queue_unknown(results)
+            self.save_results(results)
+            yield results
+        if self.retry_queue:
+            print(f"{len(self.retry_queue)} results are still unknown "
+                  f"after {self.batch_retries} retries.")
+
+    def save_results(self, results: Union[ResultTable, List[Dict[str, bool]]]) -> None:
+        """Upsert the results into the results store."""
+        if isinstance(results, ResultTable):
+            results = results.iter_records()
+        self.results_store.upsert(results)
+
+    def export_results(self) -> None:
+        """Write every stored result to the results JSON file.
+
+        Shards skip this; the sharded run exports the merged results store instead.
+        """
+        if self.shard_count > 1:
+            return
         filepath = os.path.join(self.cfg.output_dir, self.cfg.results_filename)
-        try:
-            with open(filepath, "r") as f:
-                existing_data = json.load(f)
-        except FileNotFoundError:
-            existing_data = []
-
-        for item in results:
-            for existing_item in existing_data:
-                if item["name"] == existing_item["name"]:
-                    existing_item.update(item)
+        self.results_store.export_json(filepath)
+
+    def write_metrics(self) -> None:
+        """Write the metrics snapshot, if metrics are enabled."""
+        if self.metrics_path is not None:
+            metrics.write(self.metrics_path)
+
+    def load_resume_state(self) -> Optional[Dict]:
+        """Load the saved checkpoint, checking it was written for these names and batch size."""
+        state = self.checkpoint.load()
+        if state is None:
+            return None
+        if state["seeds_fingerprint"] != self.get_seeds_fingerprint():
+            raise CheckpointMismatchError("Checkpoint was written for a different set of names.")
+        if state["batch_size"] != self.batch_size:
+            raise CheckpointMismatchError(
+                f"Checkpoint batch size {state['batch_size']} does not match {self.batch_size}."
+            )
+        return state
+
+    def save_checkpoint(
+        self, batch_index: int, results_saved: int, completed: bool = False
+    ) -> None:
+        """Record that every batch before batch_index has been checked and saved."""
+        self.checkpoint.save({
+            "batch_index": batch_index,
+            "name_position": min(batch_index * self.batch_size, self.name_count),
+            "batch_size": self.batch_size,
+            "seeds_fingerprint": self.get_seeds_fingerprint(),
+            "results_saved": results_saved,
+            "completed": completed,
+        })
+
+    def should_stop(self, available_found: int) -> bool:
+        """Check whether enough available names were found to stop the run early."""
+        if self.stop_after and available_found >= self.stop_after:
+            print(f"Found {available_found} available names; stopping early.")
+            return True
+        return False
+
+    def run(self, resume: bool = False) -> None:
+        """Check every batch, saving results and a checkpoint after each one.
+
+        With resume, batches completed by a previous run (per the checkpoint) are skipped.
+        """
+        for _ in self.iter_results(resume):
+            pass
+
+    def iter_results(self, resume: bool = False) -> Iterator[ResultTable]:
+        """Like run(), but yield each batch's results once they are saved and checkpointed.
+
+        Only one batch is held at a time; the final checkpoint is written once the generator is
+        exhausted, so stopping early leaves the run resumable.
+        """
+        state = self.load_resume_state() if resume else None
+        start_batch = state["batch_index"] if state else 0
+        results_saved = state["results_saved"] if state else 0
+        if start_batch:
+            print(f"Resuming from batch {start_batch + 1} of {self.batch_count}...")
+
+        batch_index = start_batch
+        available_found = 0
+        stopped = False
+        with self.session, metrics.timer('run_seconds', mode='batch'):
+            for batch in self.create_batches(start_batch):
+                batch_results = self.process_batch(batch)
+                self.report_batch(batch_results)
+                self.save_results(batch_results)
+                self.queue_unknown(batch_results)
+                batch_index += 1
+                results_saved += len(batch_results)
+                self.save_checkpoint(batch_index, results_saved)
+                self.reload_config()
+                yield batch_results
+                available_found += len(batch_results.available_names())
+                stopped = self.should_stop(available_found)
+                if stopped:
                     break
-            else:
-                existing_data.append(item)
-
-        with open(filepath, "w") as f:
-            json.dump(existing_data, f, indent=4)
-
-    def run(self) -> None:
-        all_results = []
-        for batch in self.batches:
-            batch_results = self.process_batch(batch)
-            all_results.extend(batch_results)
-            # TODO: save batch results
-        # TODO: save all results
+            yield from self.retry_unknown()
+        self.save_checkpoint(batch_index, results_saved, completed=not stopped)
+        if not stopped:
+            self.record_seed_items()
+        self.export_results()
+        self.write_metrics()
+
+    def run_pipeline(
+        self,
+        resume: bool = False,
+        on_batch: Optional[Callable[[ResultTable], None]] = None,
+    ) -> None:
+        """Like run(), but checks every provider concurrently through an asyncio pipeline.
+
+        Each provider stage has its own STAGE_WORKERS limit and batches flow through queues of
+        QUEUE_SIZE, so every provider's quota is spent at the same time. on_batch is called
+        with each batch's results, in batch order, once they are saved.
+        """
+        state = self.load_resume_state() if resume else None
+        start_batch = state["batch_index"] if state else 0
+        results_saved = state["results_saved"] if state else 0
+        if start_batch:
+            print(f"Resuming from batch {start_batch + 1} of {self.batch_count}...")
+
+        next_batch = start_batch
+        available_found = 0
+        stopped = False
+
+        def _write(batch_index: int, batch_results: List[Dict[str, bool]]) -> None:
+            nonlocal results_saved, next_batch, available_found, stopped
+            print(f"Finished batch {batch_index + 1} of {self.batch_count}.")
+            metrics.inc('batches_total')
+            batch_results = self.aggregate_results(batch_results)
+            self.report_batch(batch_results)
+            self.save_results(batch_results)
+            self.queue_unknown(batch_results)
+            results_saved += len(batch_results)
+            self.save_checkpoint(batch_index + 1, results_saved)
+            self.reload_config()
+            next_batch = batch_index + 1
+            if on_batch is not None:
+                on_batch(batch_results)
+            available_found += len(batch_results.available_names())
+            if not stopped and self.should_stop(available_found):
+                stopped = True
+                pipeline.stop()
+
+        pipeline = BatchPipeline(
+            batches=self.create_batches(start_batch),
+            stages=self.get_stages(),
+            writer=_write,
+            stage_workers={
+                'GoDaddy': self.cfg.godaddy_stage_workers,
+                'GitHub': self.cfg.github_stage_workers,
+                **{provider: checker.get_setting(self.cfg, 'stage_workers')
+                   for provider, checker in self.plugins.items()},
+            },
+            queue_size=self.cfg.queue_size,
+            start_index=start_batch,
+        )
+        with self.session, metrics.timer('run_seconds', mode='pipeline'):
+            pipeline.run()
+            for retry_results in self.retry_unknown():
+                if on_batch is not None:
+                    on_batch(retry_results)
+        if stopped:
+            self.save_checkpoint(next_batch, results_saved)
+        else:
+            self.save_checkpoint(max(start_batch, self.batch_count), results_saved, completed=True)
+            self.record_seed_items()
+        self.export_results()
+        self.write_metrics()
@@ -0,0 +1,100 @@
+import re
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from src.utils.config_helper import ConfigHelper
+
+
+# =============================================================================================== #
+
+FilterRule = Callable[[str], Optional[str]]
+
+VALID_NAME_PATTERN = r'^[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?$'
+
+
+class NameFilter:
+    """Rejects names that no provider could accept before any network call is made.
+
+    Each rule takes a name and returns a rejection reason, or None to accept it. Rules run in
+    order and the first reason wins.
+    """
+
+    def __init__(self, rules: Optional[List[FilterRule]] = None) -> None:
+        self.rules = list(rules or [])
+
+    def add_rule(self, rule: FilterRule) -> None:
+        self.rules.append(rule)
+
+    def reason(self, name: str) -> Optional[str]:
+        """Get the reason a name is rejected, or None if it passes every rule."""
+        for rule in self.rules:
+            reason = rule(name)
+            if reason is not None:
+                return reason
+        return None
+
+    def filter(self, names: Iterable[str]) -> Tuple[List[str], List[Tuple[str, str]]]:
+        """Split names into the accepted names and (name, reason) rejections."""
+        accepted = []
+        rejected = []
+        for name in names:
+            reason = self.reason(name)
+            if reason is None:
+                accepted.append(name)
+            else:
+                rejected.append((name, reason))
+        return accepted, rejected
+
+
+def max_length_rule(max_length: int) -> FilterRule:
+    """Reject names longer than max_length (GitHub logins allow 39 characters, DNS labels 63)."""
+    def _rule(name: str) -> Optional[str]:
+        if len(name) > max_length:
+            return f"longer than {max_length} characters"
+        return None
+    return _rule
+
+
+def allowed_chars_rule(pattern: str = VALID_NAME_PATTERN) -> FilterRule:
+    """Reject names that are not valid DNS labels / GitHub logins."""
+    regex = re.compile(pattern)
+
+    def _rule(name: str) -> Optional[str]:
+        if regex.match(name) is None:
+            return "contains invalid characters"
+        return None
+    return _rule
+
+
+def blocklist_rule(blocked_words: Iterable[str]) -> FilterRule:
+    """Reject names containing any blocked word, ignoring case."""
+    blocked_words = sorted({word.strip().lower() for word in blocked_words if word.strip()})
+    if not blocked_words:
+        return lambda name: None
+    regex = re.compile('|'.join(re.escape(word) for word in blocked_words), re.IGNORECASE)
+
+    def _rule(name: str) -> Optional[str]:
+        match = regex.search(name)
+        if match is not None:
+            return f"blocklisted: {match.group(0).lower()}"
+        return None
+    return _rule
+
+
+def load_blocklist(config_helper: ConfigHelper) -> List[str]:
+    """Load the blocklist file from the config directory, one word per line."""
+    filepath = config_helper.config_dir / config_helper.blocklist_filename
+    if not filepath.exists():
+        return []
+    with open(filepath, 'r') as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+
+def name_filter_from_config(config_helper: ConfigHelper) -> Optional[NameFilter]:
+    """Build the default name filter from the [Filter] settings, or None when disabled."""
+    if not config_helper.filter_enabled:
+        return None
+    return NameFilter([
+        max_length_rule(config_helper.filter_max_length),
+        allowed_chars_rule(),
+        blocklist_rule(load_blocklist(config_helper)),
+    ])
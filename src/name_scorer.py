@@ -0,0 +1,99 @@
+import heapq
+from itertools import count
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.utils.config_helper import ConfigHelper
+
+
+# =============================================================================================== #
+
+Heuristic = Callable[[str], float]
+
+VOWELS = frozenset('aeiouy')
+
+
+class NameScorer:
+    """Scores names with weighted heuristics and reorders a name stream best-first.
+
+    Each heuristic takes a name and returns a score, higher meaning more promising. A name's
+    score is the weighted sum over every heuristic.
+    """
+
+    def __init__(self, heuristics: Optional[List[Tuple[str, Heuristic, float]]] = None) -> None:
+        self.heuristics = list(heuristics or [])
+
+    def add_heuristic(self, label: str, heuristic: Heuristic, weight: float = 1.0) -> None:
+        self.heuristics.append((label, heuristic, weight))
+
+    def score(self, name: str) -> float:
+        return sum(weight * heuristic(name) for _, heuristic, weight in self.heuristics)
+
+    def describe(self) -> List[Tuple[str, float]]:
+        """Get the (label, weight) pairs, so checkpoints can tell when the ordering changes."""
+        return [(label, weight) for label, _, weight in self.heuristics]
+
+    def prioritize(self, names: Iterable[str], window: int) -> Iterator[str]:
+        """Yield names best-first within a sliding window of at most window names.
+
+        A bounded heap keeps memory constant: once it holds window names, each new name pushes
+        out the best one seen so far. The order is deterministic, ties keep generation order.
+        """
+        heap = []
+        sequence = count()
+        for name in names:
+            item = (-self.score(name), next(sequence), name)
+            if len(heap) < window:
+                heapq.heappush(heap, item)
+            else:
+                yield heapq.heappushpop(heap, item)[2]
+        while heap:
+            yield heapq.heappop(heap)[2]
+
+
+def length_heuristic(target_length: int) -> Heuristic:
+    """Prefer names close to target_length: 0 at the target, -1 per character away from it."""
+    def _heuristic(name: str) -> float:
+        return -abs(len(name) - target_length)
+    return _heuristic
+
+
+def pronounceability_heuristic(name: str) -> float:
+    """Share of adjacent letters that alternate between vowel and consonant, from 0 to 1."""
+    letters = [char.lower() for char in name if char.isalpha()]
+    if len(letters) < 2:
+        return 1.0
+    alternations = sum((a in VOWELS) != (b in VOWELS) for a, b in zip(letters, letters[1:]))
+    return alternations / (len(letters) - 1)
+
+
+def seed_weight_heuristic(seed_weights: Dict[str, float]) -> Heuristic:
+    """Add up the user-assigned weights of the seed items a name contains, ignoring case."""
+    seed_weights = {item.lower(): weight for item, weight in seed_weights.items()}
+
+    def _heuristic(name: str) -> float:
+        lowered = name.lower()
+        return sum(weight for item, weight in seed_weights.items() if item in lowered)
+    return _heuristic
+
+
+def name_scorer_from_config(
+    config_helper: ConfigHelper,
+    seed_weights: Optional[Dict[str, float]] = None,
+) -> Optional[NameScorer]:
+    """Build the name scorer from the [Priority] settings, or None when disabled."""
+    if not config_helper.priority_enabled:
+        return None
+    scorer = NameScorer()
+    scorer.add_heuristic(
+        'length',
+        length_heuristic(config_helper.priority_target_length),
+        config_helper.priority_length_weight,
+    )
+    scorer.add_heuristic(
+        'pronounceability',
+        pronounceability_heuristic,
+        config_helper.priority_pronounceability_weight,
+    )
+    if seed_weights:
+        scorer.add_heuristic('seed_weights', seed_weight_heuristic(seed_weights))
+    return scorer
@@ -0,0 +1,54 @@
+import re
+from typing import Optional
+
+from src.base_checker import HttpStatusChecker
+
+
+# =============================================================================================== #
+
+class PyPIChecker(HttpStatusChecker):
+    """Checks project names on PyPI's JSON API."""
+
+    provider = 'PyPI'
+    api_url = 'https://pypi.org/pypi/{name}/json'
+    max_workers = 8
+    stage_workers = 2
+    rate_limit = 600
+
+    def cache_key(self, name: str) -> str:
+        """Normalize a project name as PEP 503 does: runs of '-', '_' and '.' are one '-'."""
+        return re.sub(r'[-_.]+', '-', name).lower()
+
+
+class NpmChecker(HttpStatusChecker):
+    """Checks unscoped package names on the npm registry."""
+
+    provider = 'npm'
+    api_url = 'https://registry.npmjs.org/{name}'
+    max_workers = 8
+    stage_workers = 2
+    rate_limit = 600
+
+    def cache_key(self, name: str) -> str:
+        """New npm packages must be lowercase, so a name can only be published in lowercase."""
+        return name.lower()
+
+
+class DockerHubChecker(HttpStatusChecker):
+    """Checks Docker Hub namespaces, which are shared by users and organizations."""
+
+    provider = 'DockerHub'
+    api_url = 'https://hub.docker.com/v2/users/{name}/'
+    rate_limit = 180
+    rate_period = 3600
+
+    NAMESPACE_PATTERN = re.compile(r'[a-z0-9]{4,30}')
+
+    def cache_key(self, name: str) -> str:
+        return name.lower()
+
+    def check_name(self, name: str) -> Optional[bool]:
+        """Names that are not valid namespaces (4-30 letters and digits) cannot be registered."""
+        if not self.NAMESPACE_PATTERN.fullmatch(self.cache_key(name)):
+            return False
+        return super().check_name(name)
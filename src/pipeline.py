@@ -0,0 +1,120 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List
+
+
+# =============================================================================================== #
+
+StageFunc = Callable[[List[str]], List[Dict[str, bool]]]
+WriterFunc = Callable[[int, List[Dict[str, bool]]], None]
+
+_DONE = object()
+
+
+class BatchPipeline:
+    """Asyncio pipeline that checks batches with every provider stage concurrently.
+
+    A producer feeds each batch to one bounded queue per provider stage. Each stage runs its
+    blocking checker in worker threads, and a single writer merges the per-provider results and
+    hands complete batches to the writer function in batch order. Bounded queues keep the
+    producer at most a few batches ahead of the slowest stage.
+    """
+
+    def __init__(
+        self,
+        batches: Iterable[List[str]],
+        stages: Dict[str, StageFunc],
+        writer: WriterFunc,
+        stage_workers: Dict[str, int],
+        queue_size: int = 4,
+        start_index: int = 0,
+    ) -> None:
+        self.batches = batches
+        self.stages = stages
+        self.writer = writer
+        self.stage_workers = {provider: stage_workers.get(provider, 1) for provider in stages}
+        self.queue_size = queue_size
+        self.start_index = start_index
+        self.stopped = False
+
+    def run(self) -> None:
+        """Run the pipeline to completion."""
+        asyncio.run(self.run_async())
+
+    def stop(self) -> None:
+        """Stop feeding new batches; batches already queued are still checked and written."""
+        self.stopped = True
+
+    async def run_async(self) -> None:
+        stage_queues = {provider: asyncio.Queue(self.queue_size) for provider in self.stages}
+        result_queue = asyncio.Queue(self.queue_size * len(self.stages))
+        worker_count = sum(self.stage_workers.values())
+
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            tasks = [asyncio.ensure_future(self._produce(stage_queues))]
+            for provider, queue in stage_queues.items():
+                tasks.extend(
+                    asyncio.ensure_future(self._check(provider, queue, result_queue, executor))
+                    for _ in range(self.stage_workers[provider])
+                )
+            tasks.append(asyncio.ensure_future(self._write(result_queue, worker_count)))
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+    async def _produce(self, stage_queues: Dict[str, asyncio.Queue]) -> None:
+        """Feed every batch to every stage, then tell each stage worker to stop."""
+        for index, batch in enumerate(self.batches, start=self.start_index):
+            if self.stopped:
+                break
+            for queue in stage_queues.values():
+                await queue.put((index, batch))
+        for provider, queue in stage_queues.items():
+            for _ in range(self.stage_workers[provider]):
+                await queue.put(_DONE)
+
+    async def _check(
+        self,
+        provider: str,
+        queue: asyncio.Queue,
+        result_queue: asyncio.Queue,
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        """Run one provider's checker on batches until the producer is done."""
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                await result_queue.put(_DONE)
+                return
+            index, batch = item
+            results = await loop.run_in_executor(executor, self.stages[provider], batch)
+            await result_queue.put((index, provider, results))
+
+    async def _write(self, result_queue: asyncio.Queue, worker_count: int) -> None:
+        """Merge provider results per batch and write complete batches in order."""
+        pending: Dict[int, Dict[str, List[Dict[str, bool]]]] = {}
+        next_index = self.start_index
+        finished_workers = 0
+        while finished_workers < worker_count:
+            item = await result_queue.get()
+            if item is _DONE:
+                finished_workers += 1
+                continue
+            index, provider, results = item
+            pending.setdefault(index, {})[provider] = results
+            while len(pending.get(next_index, {})) == len(self.stages):
+                batch_results = pending.pop(next_index)
+                self.writer(next_index, self._merge(batch_results))
+                next_index += 1
+
+    def _merge(self, batch_results: Dict[str, List[Dict[str, bool]]]) -> List[Dict[str, bool]]:
+        """Concatenate per-provider results in stage order."""
+        merged = []
+        for provider in self.stages:
+            merged.extend(batch_results[provider])
+        return merged
@@ -0,0 +1,190 @@
+from enum import IntEnum
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# =============================================================================================== #
+
+class Availability(IntEnum):
+    UNKNOWN = 0
+    AVAILABLE = 1
+    TAKEN = 2
+
+    @classmethod
+    def from_value(cls, value: Optional[bool]) -> 'Availability':
+        """Convert a checker result (True, False or None) to an availability state."""
+        if value is None:
+            return cls.UNKNOWN
+        return cls.AVAILABLE if value else cls.TAKEN
+
+    def to_value(self) -> Optional[bool]:
+        """Convert back to the checker result format: True, False or None when unknown."""
+        if self is Availability.UNKNOWN:
+            return None
+        return self is Availability.AVAILABLE
+
+
+# Cell value for results that were never recorded, e.g. domains skipped by a short-circuit.
+_UNSET = 255
+_AVAILABLE_MASK = bytes(1 if state == Availability.AVAILABLE else 0 for state in range(256))
+
+
+class ResultTable:
+    """Compact column store of availability results for a fixed set of names.
+
+    Names are interned to row ids and each column holds one Availability byte per row. Domain
+    columns are keyed by their ending ('.com') rather than per-name keys ('RedOak.com'), so a
+    batch needs one bytearray per ending instead of one dict per name and domain. Cells that were
+    never recorded are kept apart from UNKNOWN results and are not written back out. Checker
+    dicts are converted in at add_records() and back out at iter_records(), at the edges only.
+    The reasons UNKNOWN results could not be determined are kept sparsely, by (row, column).
+    """
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self.names: List[str] = []
+        self.columns: Dict[str, bytearray] = {}
+        self.reasons: Dict[Tuple[int, str], str] = {}
+        self._rows: Dict[str, int] = {}
+        for name in names:
+            self._add_row(name)
+
+    def __len__(self) -> int:
+        """Number of recorded results in the table."""
+        return sum(len(column) - column.count(_UNSET) for column in self.columns.values())
+
+    def _add_row(self, name: str) -> int:
+        row = self._rows.get(name)
+        if row is None:
+            row = self._rows[name] = len(self.names)
+            self.names.append(name)
+            for column in self.columns.values():
+                column.append(_UNSET)
+        return row
+
+    def _column(self, key: str) -> bytearray:
+        column = self.columns.get(key)
+        if column is None:
+            column = self.columns[key] = bytearray([_UNSET]) * len(self.names)
+        return column
+
+    @staticmethod
+    def column_key(name: str, key: str) -> str:
+        """Map a checker result key to its column: 'RedOak.com' -> '.com', 'GitHub' -> 'GitHub'."""
+        return key[len(name):] if key.startswith(f"{name}.") else key
+
+    def set(
+        self, name: str, key: str, value: Optional[bool], reason: Optional[str] = None
+    ) -> None:
+        """Store one result, adding its row and column if needed; reason explains an unknown."""
+        row = self._add_row(name)
+        column_key = self.column_key(name, key)
+        self._column(column_key)[row] = Availability.from_value(value)
+        if value is None and reason is not None:
+            self.reasons[row, column_key] = reason
+        else:
+            self.reasons.pop((row, column_key), None)
+
+    def get(self, name: str, key: str) -> Optional[bool]:
+        """Get one result in the checker format."""
+        row = self._rows.get(name)
+        column = self.columns.get(self.column_key(name, key))
+        if row is None or column is None or column[row] == _UNSET:
+            return None
+        return Availability(column[row]).to_value()
+
+    def get_reason(self, name: str, key: str) -> Optional[str]:
+        """Get the reason a result is unknown, if one was given."""
+        row = self._rows.get(name)
+        return self.reasons.get((row, self.column_key(name, key)))
+
+    def add_records(self, records: Iterable[Dict]) -> 'ResultTable':
+        """Add checker results of the form {'name': ..., key: value}, with an optional 'reason'."""
+        for record in records:
+            name = record['name']
+            reason = record.get('reason')
+            for key, value in record.items():
+                if key not in ('name', 'reason'):
+                    self.set(name, key, value, reason)
+        return self
+
+    @classmethod
+    def from_records(cls, *results: Iterable[Dict]) -> 'ResultTable':
+        """Build a table from one or more lists of checker results."""
+        table = cls()
+        for records in results:
+            table.add_records(records)
+        return table
+
+    def _record(self, row: int, key: str) -> Dict:
+        """Convert one cell back to the checker format."""
+        name = self.names[row]
+        result_key = f"{name}{key}" if key.startswith('.') else key
+        record = {'name': name, result_key: Availability(self.columns[key][row]).to_value()}
+        if (row, key) in self.reasons:
+            record['reason'] = self.reasons[row, key]
+        return record
+
+    def iter_records(self) -> Iterator[Dict]:
+        """Yield the recorded results in the checker format, domain columns first, name by name."""
+        domain_columns = [key for key in self.columns if key.startswith('.')]
+        other_columns = [key for key in self.columns if not key.startswith('.')]
+        for row in range(len(self.names)):
+            for key in domain_columns:
+                if self.columns[key][row] != _UNSET:
+                    yield self._record(row, key)
+        for key in other_columns:
+            column = self.columns[key]
+            for row in range(len(self.names)):
+                if column[row] != _UNSET:
+                    yield self._record(row, key)
+
+    def iter_rows(self) -> Iterator[Dict]:
+        """Yield one merged record per name, e.g. {'name': 'RedOak', 'RedOak.com': True}.
+
+        Reasons for unknown results are gathered under 'reasons', keyed like the results.
+        """
+        for row, name in enumerate(self.names):
+            record = {'name': name}
+            reasons = {}
+            for key, column in self.columns.items():
+                if column[row] != _UNSET:
+                    result_key = f"{name}{key}" if key.startswith('.') else key
+                    record[result_key] = Availability(column[row]).to_value()
+                    if (row, key) in self.reasons:
+                        reasons[result_key] = self.reasons[row, key]
+            if reasons:
+                record['reasons'] = reasons
+            yield record
+
+    def unknown(self) -> Iterator[Tuple[str, str]]:
+        """Yield the (name, column) pairs whose results are unknown."""
+        for key, column in self.columns.items():
+            for row in range(len(self.names)):
+                if column[row] == Availability.UNKNOWN:
+                    yield self.names[row], key
+
+    def to_records(self) -> List[Dict]:
+        return list(self.iter_records())
+
+    def count(self, key: str, state: Availability) -> int:
+        """Count the rows of a column in a given state."""
+        column = self.columns.get(key)
+        return column.count(state) if column is not None else 0
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """Count available, taken and unknown results per column."""
+        return {
+            key: {state.name.lower(): column.count(state) for state in Availability}
+            for key, column in self.columns.items()
+        }
+
+    def available_names(self, keys: Optional[List[str]] = None) -> List[str]:
+        """Get the names that are available in every given column (default: all columns)."""
+        keys = list(self.columns) if keys is None else keys
+        if not keys or not self.names:
+            return []
+        mask = -1
+        for key in keys:
+            column = self.columns.get(key, b'')
+            mask &= int.from_bytes(bytes(column).translate(_AVAILABLE_MASK), 'little')
+        flags = mask.to_bytes(len(self.names), 'little')
+        return [name for name, flag in zip(self.names, flags) if flag]
@@ -0,0 +1,70 @@
+import csv
+import json
+from typing import Dict, TextIO, Type
+
+from src.result_table import ResultTable
+
+
+# =============================================================================================== #
+
+class ResultWriter:
+    """Stream batch results to a text stream as they finish, flushing after every batch."""
+
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+        self.count = 0
+
+    def write(self, results: ResultTable) -> None:
+        self.write_table(results)
+        self.stream.flush()
+
+    def write_table(self, results: ResultTable) -> None:
+        raise NotImplementedError
+
+
+class JsonlWriter(ResultWriter):
+    """One JSON object per name, with every check's result."""
+
+    def write_table(self, results: ResultTable) -> None:
+        for record in results.iter_rows():
+            self.stream.write(json.dumps(record) + '\n')
+            self.count += 1
+
+
+class CsvWriter(ResultWriter):
+    """One CSV row per name and check; the long format keeps the header fixed across batches.
+
+    available is empty for unknown results, with the reason in the reason column.
+    """
+
+    HEADER = ['name', 'check', 'available', 'reason']
+
+    def __init__(self, stream: TextIO) -> None:
+        super().__init__(stream)
+        self.writer = csv.writer(stream)
+        self.writer.writerow(self.HEADER)
+
+    def write_table(self, results: ResultTable) -> None:
+        for record in results.iter_records():
+            name = record.pop('name')
+            reason = record.pop('reason', '')
+            for key, value in record.items():
+                value = '' if value is None else str(value).lower()
+                self.writer.writerow([name, key, value, reason])
+                self.count += 1
+
+
+class AvailableWriter(ResultWriter):
+    """Only the names available on every check, one per line."""
+
+    def write_table(self, results: ResultTable) -> None:
+        for name in results.available_names():
+            self.stream.write(name + '\n')
+            self.count += 1
+
+
+WRITERS: Dict[str, Type[ResultWriter]] = {
+    'jsonl': JsonlWriter,
+    'csv': CsvWriter,
+    'available': AvailableWriter,
+}
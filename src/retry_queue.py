@@ -0,0 +1,27 @@
+from typing import Dict, List
+
+
+# =============================================================================================== #
+
+class RetryQueue:
+    """Deferred retries: the names whose results came back unknown, grouped by result column.
+
+    Columns are provider names, or domain endings such as '.com' for GoDaddy, so each unknown
+    result is retried exactly as it was checked. A name is queued once per column, and names are
+    handed back in the order they were first queued.
+    """
+
+    def __init__(self) -> None:
+        self._pending: Dict[str, Dict[str, None]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(names) for names in self._pending.values())
+
+    def add(self, column_key: str, name: str) -> None:
+        self._pending.setdefault(column_key, {})[name] = None
+
+    def pop_all(self) -> Dict[str, List[str]]:
+        """Take every queued name, by column, leaving the queue empty."""
+        pending = {provider: list(names) for provider, names in self._pending.items()}
+        self._pending.clear()
+        return pending
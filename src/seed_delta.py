@@ -0,0 +1,58 @@
+import math
+from itertools import product
+from typing import Iterator, List, Tuple
+
+from src.utils.name_index import canonical_name
+
+
+# =============================================================================================== #
+
+class SeedDelta:
+    """The seed combinations that are new since a previous set of seed item lists.
+
+    A combination is new when at least one of its items is new at its position. Grouping the new
+    combinations by the first such position splits them into disjoint products:
+
+        kept[0] x ... x kept[i-1] x added[i] x new[i+1] x ... x new[n-1]
+
+    so the delta is generated and counted from the item lists alone, without building the old or
+    new product. Items compare ignoring case; removed items simply drop out of the new lists.
+    """
+
+    def __init__(self, old_item_lists: List[List[str]], new_item_lists: List[List[str]]) -> None:
+        if len(old_item_lists) != len(new_item_lists):
+            raise ValueError(
+                f"Cannot diff {len(new_item_lists)} seed positions against {len(old_item_lists)}."
+            )
+        self.new_item_lists = [list(items) for items in new_item_lists]
+        self.kept_item_lists = []
+        self.added_item_lists = []
+        for old_items, new_items in zip(old_item_lists, new_item_lists):
+            old_canonical = {canonical_name(item) for item in old_items}
+            self.kept_item_lists.append(
+                [item for item in new_items if canonical_name(item) in old_canonical]
+            )
+            self.added_item_lists.append(
+                [item for item in new_items if canonical_name(item) not in old_canonical]
+            )
+
+    def iter_products(self) -> Iterator[Tuple[List[str], ...]]:
+        """Yield the item lists of each disjoint product, skipping empty ones."""
+        for position, added_items in enumerate(self.added_item_lists):
+            if added_items:
+                yield (*self.kept_item_lists[:position], added_items,
+                       *self.new_item_lists[position + 1:])
+
+    def __iter__(self) -> Iterator[str]:
+        for item_lists in self.iter_products():
+            for items in product(*item_lists):
+                yield "".join(items)
+
+    def __len__(self) -> int:
+        return sum(
+            math.prod(len(items) for items in item_lists) for item_lists in self.iter_products()
+        )
+
+    def added_items(self) -> List[List[str]]:
+        """Get the new items at each seed position."""
+        return [list(items) for items in self.added_item_lists]
@@ -0,0 +1,101 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Union
+
+from src.name_checker import NameChecker
+from src.utils.config_helper import ConfigHelper, EnvType
+from src.utils.results_store import ResultsStore, results_store_from_config
+from src.utils.sharding import ShardStrategy
+
+
+# =============================================================================================== #
+
+def run_shard(
+    env_type: EnvType,
+    shard_index: int,
+    shard_count: int,
+    shard_strategy: ShardStrategy,
+    test_mode: bool,
+    pipeline: bool,
+    resume: bool,
+    checker_kwargs: dict,
+) -> Path:
+    """Check one shard of the name space in this process and return its results store path."""
+    name_checker = NameChecker(
+        env_type=env_type,
+        test_mode=test_mode,
+        shard_index=shard_index,
+        shard_count=shard_count,
+        shard_strategy=shard_strategy,
+        **checker_kwargs,
+    )
+    if pipeline:
+        name_checker.run_pipeline(resume=resume)
+    else:
+        name_checker.run(resume=resume)
+    name_checker.results_store.close()
+    return name_checker.results_store.filepath
+
+
+class ShardedRun:
+    """Split the name space into shards, check each in its own process and merge the results.
+
+    The legacy results JSON is migrated once, into the main store, before the shards start. Every
+    shard writes its own results store and checkpoint, so a failed shard can be resumed on its
+    own; the shard stores are merged into the environment's results store at the end, which
+    is then exported to the results JSON file.
+    """
+
+    def __init__(
+        self,
+        env_type: EnvType,
+        shard_count: Optional[int] = None,
+        shard_strategy: Optional[Union[ShardStrategy, str]] = None,
+        processes: Optional[int] = None,
+        test_mode: Optional[bool] = False,
+        **checker_kwargs,
+    ) -> None:
+        self.env_type = EnvType(env_type)
+        self.test_mode = test_mode
+        self.cfg = ConfigHelper(
+            self.env_type, self.test_mode, checker_kwargs.get('config_overrides')
+        )
+        self.shard_count = shard_count or self.cfg.shard_count
+        self.shard_strategy = ShardStrategy(shard_strategy or self.cfg.shard_strategy)
+        self.processes = processes or self.shard_count
+        self.checker_kwargs = checker_kwargs
+        self.results_store = results_store_from_config(self.cfg)
+
+    def run(self, resume: bool = False, pipeline: bool = False) -> List[Path]:
+        """Run every shard, merge their results and return the shard store paths."""
+        args = [
+            (self.env_type, shard_index, self.shard_count, self.shard_strategy,
+             self.test_mode, pipeline, resume, self.checker_kwargs)
+            for shard_index in range(self.shard_count)
+        ]
+        if self.processes == 1:
+            shard_paths = [run_shard(*shard_args) for shard_args in args]
+        else:
+            with ProcessPoolExecutor(max_workers=self.processes) as executor:
+                shard_paths = list(executor.map(run_shard, *zip(*args)))
+        self.merge(shard_paths)
+        self.results_store.export_json(self.cfg.output_dir / self.cfg.results_filename)
+        return shard_paths
+
+    def merge(self, shard_paths: List[Path]) -> int:
+        """Merge the shard results stores into the results store, returning the rows merged.
+
+        The seed items are recorded for --delta runs only when every shard finished its names.
+        """
+        seed_items = set()
+        for path in shard_paths:
+            shard_store = ResultsStore(path)
+            seed_items.add(shard_store.get_metadata('seed_items'))
+            shard_store.close()
+        merged = sum(
+            self.results_store.merge(path, skip_metadata=['seed_items']) for path in shard_paths
+        )
+        if len(seed_items) == 1 and None not in seed_items:
+            self.results_store.set_metadata('seed_items', seed_items.pop())
+        print(f"Merged {merged} results from {len(shard_paths)} shards.")
+        return merged
@@ -0,0 +1,53 @@
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from src.utils.config_helper import ConfigHelper
+
+
+# =============================================================================================== #
+
+class Checkpoint:
+    """Durable record of how far a NameChecker run has progressed."""
+
+    def __init__(self, filepath: Union[str, Path]) -> None:
+        self.filepath = Path(filepath)
+
+    def load(self) -> Optional[Dict]:
+        """Load the saved checkpoint state, if any."""
+        try:
+            with open(self.filepath, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def save(self, state: Dict) -> None:
+        """Atomically replace the checkpoint file with the given state."""
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        state = {**state, 'updated_at': time.time()}
+        fd, tmp_path = tempfile.mkstemp(dir=self.filepath.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(state, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.filepath)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def clear(self) -> None:
+        """Delete the checkpoint file."""
+        self.filepath.unlink(missing_ok=True)
+
+
+class CheckpointMismatchError(ValueError):
+    """Raised when a checkpoint was written for a different name space or batch size."""
+
+
+def checkpoint_from_config(config_helper: ConfigHelper) -> Checkpoint:
+    """Create the checkpoint for the environment's output directory."""
+    return Checkpoint(config_helper.output_dir / config_helper.checkpoint_filename)
@@ -0,0 +1,173 @@
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Optional
+
+from src.utils.config_helper import ConfigHelper
+from src.utils.metrics import metrics
+from src.utils.rate_limiter import SimulatedClock
+
+
+# =============================================================================================== #
+
+class CircuitState(Enum):
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker shared by every request made to one provider.
+
+    While closed, the outcome of each request is kept in a sliding window; once the window holds
+    at least min_requests outcomes and the share of errors reaches error_threshold, the circuit
+    opens and requests are refused without calling the provider. After open_seconds it turns
+    half-open and lets probe_requests requests through: a successful probe closes it again, a
+    failed one reopens it for another open_seconds.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        window: int = 20,
+        min_requests: int = 10,
+        error_threshold: float = 0.5,
+        open_seconds: float = 30.0,
+        probe_requests: int = 1,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.provider = provider
+        self.min_requests = min_requests
+        self.error_threshold = error_threshold
+        self.open_seconds = open_seconds
+        self.probe_requests = probe_requests
+        self._sleep = sleep
+        self._clock = clock
+        self._outcomes = deque(maxlen=window)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._refresh(self._clock())
+            return self._state
+
+    def _refresh(self, now: float) -> None:
+        """Turn half-open once the open period has passed."""
+        if self._state is CircuitState.OPEN and now >= self._opened_at + self.open_seconds:
+            self._transition(CircuitState.HALF_OPEN)
+            self._probes = 0
+
+    def _transition(self, state: CircuitState) -> None:
+        self._state = state
+        metrics.inc('circuit_transitions_total', provider=self.provider, state=state.value)
+        print(f"{self.provider} circuit {state.value.replace('_', '-')}.")
+
+    def _open(self, now: float) -> None:
+        self._opened_at = now
+        self._outcomes.clear()
+        self._transition(CircuitState.OPEN)
+
+    def error_rate(self) -> float:
+        """Share of errors among the requests in the window."""
+        with self._lock:
+            return sum(self._outcomes) / len(self._outcomes) if self._outcomes else 0.0
+
+    def allow(self) -> bool:
+        """Check whether a request may be made now; in half-open state this claims a probe."""
+        with self._lock:
+            self._refresh(self._clock())
+            if self._state is CircuitState.CLOSED:
+                return True
+            if self._state is CircuitState.HALF_OPEN and self._probes < self.probe_requests:
+                self._probes += 1
+                return True
+        metrics.inc('circuit_rejected_total', provider=self.provider)
+        return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self._outcomes.clear()
+                self._transition(CircuitState.CLOSED)
+            elif self._state is CircuitState.CLOSED:
+                self._outcomes.append(False)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            now = self._clock()
+            if self._state is CircuitState.HALF_OPEN:
+                self._open(now)
+            elif self._state is CircuitState.CLOSED:
+                self._outcomes.append(True)
+                errors = sum(self._outcomes)
+                requests = len(self._outcomes)
+                if requests >= self.min_requests and errors / requests >= self.error_threshold:
+                    self._open(now)
+
+    def record_skipped(self) -> None:
+        """Record a request whose outcome says nothing about the provider's health.
+
+        In half-open state this frees the probe it claimed, so a later request can probe instead.
+        """
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def record_status(self, status_code: int, rate_limited: Optional[bool] = None) -> None:
+        """Record a response: server errors count against the provider, anything else for it.
+
+        Rate-limited responses (429 unless rate_limited says otherwise) count neither way.
+        """
+        if rate_limited is None:
+            rate_limited = status_code == 429
+        if rate_limited:
+            self.record_skipped()
+        elif status_code >= 500:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def retry_in(self) -> float:
+        """Seconds until the circuit lets a probe through; 0 unless it is open."""
+        with self._lock:
+            now = self._clock()
+            self._refresh(now)
+            if self._state is not CircuitState.OPEN:
+                return 0.0
+            return self._opened_at + self.open_seconds - now
+
+    def wait(self) -> float:
+        """Pause the caller while the circuit is open and return the time waited."""
+        waited = 0.0
+        delay = self.retry_in()
+        while delay > 0:
+            print(f"{self.provider} circuit open -> pausing for {delay:.1f} seconds...")
+            self._sleep(delay)
+            waited += delay
+            delay = self.retry_in()
+        return waited
+
+
+def circuit_breaker_from_config(
+    config_helper: ConfigHelper, provider: str
+) -> Optional[CircuitBreaker]:
+    """Create a provider's circuit breaker from [CircuitBreaker], or None when it is disabled."""
+    if not config_helper.circuit_enabled:
+        return None
+    settings = dict(
+        window=config_helper.circuit_window,
+        min_requests=config_helper.circuit_min_requests,
+        error_threshold=config_helper.circuit_error_threshold_percent / 100,
+        open_seconds=config_helper.circuit_open_seconds,
+        probe_requests=config_helper.circuit_probe_requests,
+    )
+    if config_helper.test_mode:
+        clock = SimulatedClock()
+        return CircuitBreaker(provider, **settings, sleep=clock.sleep, clock=clock)
+    return CircuitBreaker(provider, **settings)
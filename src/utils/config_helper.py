@@ -1,6 +1,9 @@
 import configparser
+import os
+import threading
 from enum import Enum
-from typing import Optional, Union
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
 
 from src.utils.toad_utils import find_project_root
 from src.utils.validator import Validator, ValidatorType
@@ -8,6 +11,9 @@ from src.utils.validator import Validator, ValidatorType
 # =============================================================================================== #
 
 CONFIG_FILES = ['config.ini', 'secrets.ini']
+ENV_PREFIX = 'NAMECHECKER_'
+
+Overrides = Dict[str, Dict[str, str]]
 
 class EnvType(Enum):
     DEV = 'Development'
@@ -15,50 +21,292 @@ class EnvType(Enum):
     PRD = 'Production'
 
 
+class FrozenConfigParser(configparser.ConfigParser):
+    """ConfigParser that rejects changes once frozen, so a snapshot can be shared safely."""
+
+    _frozen = False
+
+    def freeze(self) -> 'FrozenConfigParser':
+        self._frozen = True
+        return self
+
+    def _check_frozen(self) -> None:
+        if self._frozen:
+            raise TypeError("Config snapshots are read-only; set ConfigHelper properties instead.")
+
+    def set(self, section, option, value=None):
+        self._check_frozen()
+        super().set(section, option, value)
+
+    def add_section(self, section):
+        self._check_frozen()
+        super().add_section(section)
+
+    def remove_option(self, section, option):
+        self._check_frozen()
+        return super().remove_option(section, option)
+
+    def remove_section(self, section):
+        self._check_frozen()
+        return super().remove_section(section)
+
+
+class ConfigSnapshot:
+    """Parsed config files plus override layers, loaded once and shared by every ConfigHelper."""
+
+    def __init__(self, root_dir: Path, overrides: Overrides) -> None:
+        self.root_dir = root_dir
+        self.config_dir = root_dir / 'cfg'
+        self.mtimes = self.get_mtimes()
+        parser = FrozenConfigParser()
+        parser.read([self.config_dir / config_file for config_file in CONFIG_FILES])
+        parser.read_dict(env_overrides(parser))
+        parser.read_dict(overrides)
+        self.config = parser.freeze()
+
+    def get_mtimes(self) -> Tuple[Optional[int], ...]:
+        """Get the modification times of the config files, None for missing files."""
+        mtimes = []
+        for config_file in CONFIG_FILES:
+            try:
+                mtimes.append((self.config_dir / config_file).stat().st_mtime_ns)
+            except FileNotFoundError:
+                mtimes.append(None)
+        return tuple(mtimes)
+
+    def is_stale(self) -> bool:
+        """Check whether any config file changed since the snapshot was loaded."""
+        return self.get_mtimes() != self.mtimes
+
+
+def env_overrides(config: configparser.ConfigParser) -> Overrides:
+    """Collect NAMECHECKER_<SECTION>_<KEY> environment variables for known config options."""
+    overrides = {}
+    for section in config.sections():
+        for key in config.options(section):
+            value = os.environ.get(f"{ENV_PREFIX}{section.upper()}_{key.upper()}")
+            if value is not None:
+                overrides.setdefault(section, {})[key] = value
+    return overrides
+
+
+_snapshots: Dict[tuple, ConfigSnapshot] = {}
+_snapshots_lock = threading.Lock()
+_validator = Validator(ValidatorType.CONFIG)
+
+
+def load_snapshot(
+    test_mode: bool = False, overrides: Optional[Overrides] = None
+) -> ConfigSnapshot:
+    """Get the cached config snapshot, reloaded if a config file or NAMECHECKER_ var changed."""
+    overrides = overrides or {}
+    env_key = tuple(sorted(
+        (key, value) for key, value in os.environ.items() if key.startswith(ENV_PREFIX)
+    ))
+    overrides_key = tuple(sorted(
+        (section, key, value)
+        for section, values in overrides.items() for key, value in values.items()
+    ))
+    cache_key = (os.getcwd(), bool(test_mode), env_key, overrides_key)
+    with _snapshots_lock:
+        snapshot = _snapshots.get(cache_key)
+        if snapshot is None or snapshot.is_stale():
+            root_dir = find_project_root('NameChecker', test_mode)
+            snapshot = _snapshots[cache_key] = ConfigSnapshot(root_dir, overrides)
+        return snapshot
+
+
+def clear_snapshots() -> None:
+    """Drop every cached config snapshot."""
+    with _snapshots_lock:
+        _snapshots.clear()
+
+
 class ConfigHelper:
     def __init__(
         self,
         env_type: Union[EnvType, str],
-        test_mode: Optional[bool] = False
+        test_mode: Optional[bool] = False,
+        overrides: Optional[Overrides] = None
     ) -> None:
         self.env_type = EnvType(env_type)
         self.test_mode = test_mode
+        self.overrides = overrides
         self._batch_size = None
         self._batch_retries = None
+        self._pool_connections = None
+        self._pool_maxsize = None
         self._seeds_filename = None
         self._results_filename = None
         self._godaddy_max_retries = None
+        self._godaddy_max_workers = None
+        self._godaddy_bulk_limit = None
+        self._godaddy_rate_limit = None
+        self._godaddy_rate_period = None
+        self._github_max_retries = None
+        self._github_rate_limit = None
+        self._github_rate_period = None
         self._godaddy_api_url = None
         self._github_api_url = None
         self._godaddy_api_key = None
         self._godaddy_api_secret = None
         self._github_token = None
-        self.config = configparser.ConfigParser()
+        self._cache_filename = None
+        self._cache_enabled = None
+        self._godaddy_cache_ttl_available = None
+        self._godaddy_cache_ttl_taken = None
+        self._github_cache_ttl_available = None
+        self._github_cache_ttl_taken = None
+        self._results_db_filename = None
+        self._checkpoint_filename = None
+        self._queue_size = None
+        self._godaddy_stage_workers = None
+        self._github_stage_workers = None
+        self._blocklist_filename = None
+        self._filter_enabled = None
+        self._filter_max_length = None
+        self._metrics_filename = None
+        self._metrics_enabled = None
+        self._github_graphql_url = None
+        self._github_use_graphql = None
+        self._github_graphql_batch_size = None
+        self._dns_enabled = None
+        self._dns_nameserver = None
+        self._dns_port = None
+        self._dns_timeout_ms = None
+        self._dns_max_workers = None
+        self._shard_count = None
+        self._shard_strategy = None
+        self._godaddy_primary_ending = None
+        self._godaddy_short_circuit = None
+        self._priority_enabled = None
+        self._priority_window = None
+        self._priority_stop_after = None
+        self._priority_target_length = None
+        self._priority_length_weight = None
+        self._priority_pronounceability_weight = None
+        self._circuit_enabled = None
+        self._circuit_window = None
+        self._circuit_min_requests = None
+        self._circuit_error_threshold_percent = None
+        self._circuit_open_seconds = None
+        self._circuit_probe_requests = None
+        self._batch_retry_backoff = None
+        self._checkers_enabled = None
+        self._checkers_plugins = None
+        self.validator = _validator
         self.load_config_files()
-        self.validator = Validator(ValidatorType.CONFIG)
-        self.initialize_properties()
 
 
     def load_config_files(self) -> None:
-        root_dir = find_project_root('NameChecker', self.test_mode)
-        config_dir = root_dir / 'cfg'
-        [self.config.read(config_dir / config_file) for config_file in CONFIG_FILES]
+        """Take the shared config snapshot and initialize the properties from it."""
+        self.snapshot = load_snapshot(self.test_mode, self.overrides)
+        self.root_dir = self.snapshot.root_dir
+        self.config_dir = self.snapshot.config_dir
+        self.output_dir = self.root_dir / 'output'
+        self.config = self.snapshot.config
+        self.initialize_properties()
+
+    def reload_if_changed(self) -> bool:
+        """Reload the properties if a config file changed, discarding any values set since."""
+        if not self.snapshot.is_stale():
+            return False
+        self.load_config_files()
+        return True
 
     def initialize_properties(self) -> None:
         self._batch_size = self.config.getint('Batch', 'BATCH_SIZE')
         self._batch_retries = self.config.getint('Batch', 'BATCH_RETRIES')
+        self._pool_connections = self.config.getint('Session', 'POOL_CONNECTIONS')
+        self._pool_maxsize = self.config.getint('Session', 'POOL_MAXSIZE')
         self._seeds_filename = self.config.get('Filename', 'SEEDS')
         self._results_filename = self._results_filename_switch()
         self._godaddy_max_retries = self.config.getint('GoDaddy', 'MAX_RETRIES')
+        self._godaddy_max_workers = self.config.getint('GoDaddy', 'MAX_WORKERS')
+        self._godaddy_bulk_limit = self.config.getint('GoDaddy', 'BULK_LIMIT')
+        self._godaddy_rate_limit = self.config.getint('GoDaddy', 'RATE_LIMIT')
+        self._godaddy_rate_period = self.config.getint('GoDaddy', 'RATE_PERIOD')
+        self._github_max_retries = self.config.getint('GitHub', 'MAX_RETRIES')
+        self._github_rate_limit = self.config.getint('GitHub', 'RATE_LIMIT')
+        self._github_rate_period = self.config.getint('GitHub', 'RATE_PERIOD')
         self._godaddy_api_url = self._godaddy_api_url_switch()
         self._github_api_url = self.config.get('GitHub', 'BASE_API_URL')
         self._godaddy_api_key = self._godaddy_api_key_switch()
         self._godaddy_api_secret = self._godaddy_api_secret_switch()
         self._github_token = self.config.get('GitHub', 'TOKEN')
+        self._cache_filename = self.config.get('Filename', 'CACHE')
+        self._cache_enabled = self.config.getboolean('Cache', 'ENABLED')
+        self._godaddy_cache_ttl_available = self.config.getint('GoDaddy', 'CACHE_TTL_AVAILABLE')
+        self._godaddy_cache_ttl_taken = self.config.getint('GoDaddy', 'CACHE_TTL_TAKEN')
+        self._github_cache_ttl_available = self.config.getint('GitHub', 'CACHE_TTL_AVAILABLE')
+        self._github_cache_ttl_taken = self.config.getint('GitHub', 'CACHE_TTL_TAKEN')
+        self._results_db_filename = self._results_db_filename_switch()
+        self._checkpoint_filename = self._checkpoint_filename_switch()
+        self._queue_size = self.config.getint('Batch', 'QUEUE_SIZE')
+        self._godaddy_stage_workers = self.config.getint('GoDaddy', 'STAGE_WORKERS')
+        self._github_stage_workers = self.config.getint('GitHub', 'STAGE_WORKERS')
+        self._blocklist_filename = self.config.get('Filename', 'BLOCKLIST')
+        self._filter_enabled = self.config.getboolean('Filter', 'ENABLED')
+        self._filter_max_length = self.config.getint('Filter', 'MAX_LENGTH')
+        self._metrics_filename = self.config.get('Filename', 'METRICS')
+        self._metrics_enabled = self.config.getboolean('Metrics', 'ENABLED')
+        self._github_graphql_url = self.config.get('GitHub', 'GRAPHQL_API_URL')
+        self._github_use_graphql = self.config.getboolean('GitHub', 'USE_GRAPHQL')
+        self._github_graphql_batch_size = self.config.getint('GitHub', 'GRAPHQL_BATCH_SIZE')
+        self._dns_enabled = self.config.getboolean('DNS', 'ENABLED')
+        self._dns_nameserver = self.config.get('DNS', 'NAMESERVER')
+        self._dns_port = self.config.getint('DNS', 'PORT')
+        self._dns_timeout_ms = self.config.getint('DNS', 'TIMEOUT_MS')
+        self._dns_max_workers = self.config.getint('DNS', 'MAX_WORKERS')
+        self._shard_count = self.config.getint('Shard', 'COUNT')
+        self._shard_strategy = self.config.get('Shard', 'STRATEGY')
+        self._godaddy_primary_ending = self.config.get('GoDaddy', 'PRIMARY_ENDING')
+        self._godaddy_short_circuit = self.config.getboolean('GoDaddy', 'SHORT_CIRCUIT')
+        self._priority_enabled = self.config.getboolean('Priority', 'ENABLED')
+        self._priority_window = self.config.getint('Priority', 'WINDOW')
+        self._priority_stop_after = self.config.getint('Priority', 'STOP_AFTER')
+        self._priority_target_length = self.config.getint('Priority', 'TARGET_LENGTH')
+        self._priority_length_weight = self.config.getint('Priority', 'LENGTH_WEIGHT')
+        self._priority_pronounceability_weight = self.config.getint(
+            'Priority', 'PRONOUNCEABILITY_WEIGHT'
+        )
+        self._circuit_enabled = self.config.getboolean('CircuitBreaker', 'ENABLED')
+        self._circuit_window = self.config.getint('CircuitBreaker', 'WINDOW')
+        self._circuit_min_requests = self.config.getint('CircuitBreaker', 'MIN_REQUESTS')
+        self._circuit_error_threshold_percent = self.config.getint(
+            'CircuitBreaker', 'ERROR_THRESHOLD_PERCENT'
+        )
+        self._circuit_open_seconds = self.config.getint('CircuitBreaker', 'OPEN_SECONDS')
+        self._circuit_probe_requests = self.config.getint('CircuitBreaker', 'PROBE_REQUESTS')
+        self._batch_retry_backoff = self.config.getint('Batch', 'RETRY_BACKOFF')
+        self._checkers_enabled = self.get_config_list('Checkers', 'ENABLED')
+        self._checkers_plugins = self.get_config_list('Checkers', 'PLUGINS')
         
+    def apply_shard_credentials(self, shard_index: int) -> List[str]:
+        """Switch to the secrets suffixed _<shard_index>; returns the providers that have them."""
+        prefix = 'PRD' if self.env_type == EnvType.PRD else 'DEV'
+        credentials = [
+            ('GoDaddy', f"{prefix}_API_KEY", 'godaddy_api_key'),
+            ('GoDaddy', f"{prefix}_API_SECRET", 'godaddy_api_secret'),
+            ('GitHub', 'TOKEN', 'github_token'),
+        ]
+        providers = []
+        for section, key, attr in credentials:
+            option = f"{key}_{shard_index}"
+            if self.config.has_option(section, option):
+                setattr(self, attr, self.config.get(section, option))
+                if section not in providers:
+                    providers.append(section)
+        return providers
+
     def get_config_val(self, section: str, key: str) -> str:
         return self.config.get(section, key)
 
+    def get_config_list(self, section: str, key: str) -> List[str]:
+        """Get a comma-separated config value as a list, dropping empty items."""
+        items = (item.strip() for item in self.config.get(section, key).split(','))
+        return [item for item in items if item]
+
     @property
     def batch_size(self) -> int:
         return self._batch_size
@@ -77,6 +325,24 @@ class ConfigHelper:
         self.validator.integer(value, min_value=0)
         self._batch_retries = value
 
+    @property
+    def pool_connections(self) -> int:
+        return self._pool_connections
+
+    @pool_connections.setter
+    def pool_connections(self, value: int) -> None:
+        self.validator.integer(value, min_value=1)
+        self._pool_connections = value
+
+    @property
+    def pool_maxsize(self) -> int:
+        return self._pool_maxsize
+
+    @pool_maxsize.setter
+    def pool_maxsize(self, value: int) -> None:
+        self.validator.integer(value, min_value=1)
+        self._pool_maxsize = value
+
     @property
     def seeds_filename(self) -> str:
         return self._seeds_filename
@@ -110,6 +376,42 @@ class ConfigHelper:
         self.validator.integer(value, min_value=0)
         self._godaddy_max_retries = value
 
+    @property
+    def godaddy_max_workers(self) -> int:
+        return self._godaddy_max_workers
+
+    @godaddy_max_workers.setter
+    def godaddy_max_workers(self, value: int) -> None:
+        self.validator.integer(value, min_value=1)
+        self._godaddy_max_workers = value
+
+    @property
+    def godaddy_bulk_limit(self) -> int:
+        return self._godaddy_bulk_limit
+
+    @godaddy_bulk_limit.setter
+    def godaddy_bulk_limit(self, value: int) -> None:
+        self.validator.integer(value, min_value=1, max_value=500)
+        self._godaddy_bulk_limit = value
+
+    @property
+    def godaddy_rate_limit(self) -> int:
+        return self._godaddy_rate_limit
+
+    @godaddy_rate_limit.setter
+    def godaddy_rate_limit(self, value: int) -> None:
+        self.validator.integer(value, min_value=1)
+        self._godaddy_rate_limit = value
+
+    @property
+    def godaddy_rate_period(self) -> int:
+        return self._godaddy_rate_period
+
+    @godaddy_rate_period.setter
+    def godaddy_rate_period(self, value: int) -> None:
+        self.validator.integer(value, min_value=1)
+        self._godaddy_rate_period = value
+
     @property
     def godaddy_api_url(self) -> str:
         return self._godaddy_api_url
@@ -134,6 +436,33 @@ class ConfigHelper:
         self.validator.url(value)
         self._github_api_url = value
 
+    @property
+    def github_max_retries(self) -> int:
+        return self._github_max_retries
+
+    @github_max_retries.setter
+    def github_max_retries(self, value: int) -> None:
+        self.validator.integer(value, min_value=0)
+        self._github_max_retries = value
+
+    @property
+    def github_rate_limit(self) -> int:
+        return self._github_rate_limit
+
+    @github_rate_limit.setter
+    def github_rate_limit(self, value: int) -> None:
+        self.validator.integer(value, min_value=1)
+        self._github_rate_limit = value
+
+    @property
+    def github_rate_period(self) -> int:
+        return self._github_rate_period
+
+    @github_rate_period.setter
+    def github_rate_period(self, value: int) -> None:
+        self.validator.integer(value, min_value=1)
+        self._github_rate_period = value
+
     @property
     def godaddy_api_key(self) -> str:
         return self._godaddy_api_key
@@ -172,3 +501,402 @@ class ConfigHelper:
     def github_token(self, value: str) -> None:
         self.validator.api_token(value, expected_prefix='github_pat_')
         self._github_token = value
+
+    @property
+    def cache_filename(self) -> str:
+        return self._cache_filename
+
+    @cache_filename.setter
+    def cache_filename(self, value: str) -> None:
+        self.validator.filename(value)
+        self._cache_filename = value
+
+    @property
+    def cache_enabled(self) -> bool:
+        return self._cache_enabled
+
+    @cache_enabled.setter
+    def cache_enabled(self, value: bool) -> None:
+        self.validator.boolean(value)
+        self._cache_enabled = value
+
+    @property
+    def godaddy_cache_ttl_available(self) -> int:
+        return self._godaddy_cache_ttl_available
+
+    @godaddy_cache_ttl_available.setter
+    def godaddy_cache_ttl_available(self, value: int) -> None:
+        self.validator.integer(value, min_value=0)
+        self._godaddy_cache_ttl_available = value
+
+    @property
+    def godaddy_cache_ttl_taken(self) -> int:
+        return self._godaddy_cache_ttl_taken
+
+    @godaddy_cache_ttl_taken.setter
+    def godaddy_cache_ttl_taken(self, value: int) -> None:
+        self.validator.integer(value, min_value=0)
+        self._godaddy_cache_ttl_taken = value
+
+    @property
+    def github_cache_ttl_available(self) -> int:
+        return self._github_cache_ttl_available
+
+    @github_cache_ttl_available.setter
+    def github_cache_ttl_available(self, value: int) -> None:
+        self.validator.integer(value, min_value=0)
+        self._github_cache_ttl_available = value
+
+    @property
+    def github_cache_ttl_taken(self) -> int:
+        return self._github_cache_ttl_taken
+
+    @github_cache_ttl_taken.setter
+    def github_cache_ttl_taken(self, value: int) -> None:
+        self.validator.integer(value, min_value=0)
+        self._github_cache_ttl_taken = value
+
+    @property
+    def results_db_filename(self) -> str:
+        return self._results_db_filename
+
+    @results_db_filename.setter
+    def results_db_filename(self, value: str) -> None:
+        self.validator.filename(value)
+        self._results_db_filename = value
+
+    def _results_db_filename_switch(self) -> str:
+        if self.env_type == EnvType.PRD:
+            return self.config.get('Filename', 'RESULTS_DB')
+        else:
+            return self.config.get('Filename', 'TST_RESULTS_DB')
+
+    @property
+    def checkpoint_filename(self) -> str:
+        return self._checkpoint_filename
+
+    @checkpoint_filename.setter
+    def checkpoint_filename(self, value: str) -> None:
+        self.validator.filename(value)
+        self._checkpoint_filename = value
+
+    def _checkpoint_filename_switch(self) -> str:
+        if self.env_type == EnvType.PRD:
+            return self.config.get('Filename', 'CHECKPOINT')
+        else:
+            return self.config.get('Filename', 'TST_CHECKPOINT')
+
+    @property
+    def queue_size(self) -> int:
+        return self._queue_size
+
+    @queue_size.setter
+    def queue_size(self, value: int) -> None:
+        self.validator.integer(value, min_value=1)
+        self._queue_size = value
+
+    @property
+    def godaddy_stage_workers(self) -> int:
+        return self._godaddy_stage_workers
+
+    @godaddy_stage_workers.setter
+    def godaddy_stage_workers(self, value: int) -> None:
+        self.validator.integer(value, min_value=1)
+        self._godaddy_stage_workers = value
+
+    @property
+    def github_stage_workers(self) -> int:
+        return self._github_stage_workers
+
+    @github_stage_workers.setter
+    def github_stage_workers(self, value: int) -> None:
+        self.validator.integer(value, min_value=1)
+        self._github_stage_workers = value
+
+    @property
+    def blocklist_filename(self) -> str:
+        return self._blocklist_filename
+
+    @blocklist_filename.setter
+    def blocklist_filename(self, value: str) -> None:
+        self.validator.filename(value)
+        self._blocklist_filename = value
+
+    @property
+    def filter_enabled(self) -> bool:
+        return self._filter_enabled
+
+    @filter_enabled.setter
+    def filter_enabled(self, value: bool) -> None:
+        self.validator.boolean(value)
+        self._filter_enabled = value
+
+    @property
+    def filter_max_length(self) -> int:
+        return self._filter_max_length
+
+    @filter_max_length.setter
+    def filter_max_length(self, value: int) -> None:
+        self.validator.integer(value, min_value=1, max_value=63)
+        self._filter_max_length = value
+
+    @property
+    def metrics_filename(self) -> str:
+        return self._metrics_filename
+
+    @metrics_filename.setter
+    def metrics_filename(self, value: str) -> None:
+        self.validator.filename(value)
+        self._metrics_filename = value
+
+    @property
+    def metrics_enabled(self) -> bool:
+        return self._metrics_enabled
+
+    @metrics_enabled.setter
+    def metrics_enabled(self, value: bool) -> None:
+        self.validator.boolean(value)
+        self._metrics_enabled = value
+
+    @property
+    def github_graphql_url(self) -> str:
+        return self._github_graphql_url
+
+    @github_graphql_url.setter
+    def github_graphql_url(self, value: str) -> None:
+        self.validator.url(value)
+        self._github_graphql_url = value
+
+    @property
+    def github_use_graphql(self) -> bool:
+        return self._github_use_graphql
+
+    @github_use_graphql.setter
+    def github_use_graphql(self, value: bool) -> None:
+        self.validator.boolean(value)
+        self._github_use_graphql = value
+
+    @property
+    def github_graphql_batch_size(self) -> int:
+        return self._github_graphql_batch_size
+
+    @github_graphql_batch_size.setter
+    def github_graphql_batch_size(self, value: int) -> None:
+        self.validator.integer(value, min_value=1, max_value=100)
+        self._github_graphql_batch_size = value
+
+    @property
+    def dns_enabled(self) -> bool:
+        return self._dns_enabled
+
+    @dns_enabled.setter
+    def dns_enabled(self, value: bool) -> None:
+        self.validator.boolean(value)
+        self._dns_enabled = value
+
+    @property
+    def dns_nameserver(self) -> str:
+        return self._dns_nameserver
+
+    @dns_nameserver.setter
+    def dns_nameserver(self, value: str) -> None:
+        self.validator.hostname(value)
+        self._dns_nameserver = value
+
+    @property
+    def dns_port(self) -> int:
+        return self._dns_port
+
+    @dns_port.setter
+    def dns_port(self, value: int) -> None:
+        self.validator.integer(value, min_value=1, max_value=65535)
+        self._dns_port = value
+
+    @property
+    def dns_timeout_ms(self) -> int:
+        return self._dns_timeout_ms
+
+    @dns_timeout_ms.setter
+    def dns_timeout_ms(self, value: int) -> None:
+        self.validator.integer(value, min_value=1)
+        self._dns_timeout_ms = value
+
+    @property
+    def dns_max_workers(self) -> int:
+        return self._dns_max_workers
+
+    @dns_max_workers.setter
+    def dns_max_workers(self, value: int) -> None:
+        self.validator.integer(value, min_value=1)
+        self._dns_max_workers = value
+
+    @property
+    def shard_count(self) -> int:
+        return self._shard_count
+
+    @shard_count.setter
+    def shard_count(self, value: int) -> None:
+        self.validator.integer(value, min_value=1)
+        self._shard_count = value
+
+    @property
+    def shard_strategy(self) -> str:
+        return self._shard_strategy
+
+    @shard_strategy.setter
+    def shard_strategy(self, value: str) -> None:
+        self.validator.choice(value, ['range', 'hash'])
+        self._shard_strategy = value
+
+    @property
+    def godaddy_primary_ending(self) -> str:
+        return self._godaddy_primary_ending
+
+    @godaddy_primary_ending.setter
+    def godaddy_primary_ending(self, value: str) -> None:
+        self.validator.hostname(value)
+        self._godaddy_primary_ending = value
+
+    @property
+    def godaddy_short_circuit(self) -> bool:
+        return self._godaddy_short_circuit
+
+    @godaddy_short_circuit.setter
+    def godaddy_short_circuit(self, value: bool) -> None:
+        self.validator.boolean(value)
+        self._godaddy_short_circuit = value
+
+    @property
+    def priority_enabled(self) -> bool:
+        return self._priority_enabled
+
+    @priority_enabled.setter
+    def priority_enabled(self, value: bool) -> None:
+        self.validator.boolean(value)
+        self._priority_enabled = value
+
+    @property
+    def priority_window(self) -> int:
+        return self._priority_window
+
+    @priority_window.setter
+    def priority_window(self, value: int) -> None:
+        self.validator.integer(value, min_value=1)
+        self._priority_window = value
+
+    @property
+    def priority_stop_after(self) -> int:
+        return self._priority_stop_after
+
+    @priority_stop_after.setter
+    def priority_stop_after(self, value: int) -> None:
+        self.validator.integer(value, min_value=0)
+        self._priority_stop_after = value
+
+    @property
+    def priority_target_length(self) -> int:
+        return self._priority_target_length
+
+    @priority_target_length.setter
+    def priority_target_length(self, value: int) -> None:
+        self.validator.integer(value, min_value=1, max_value=63)
+        self._priority_target_length = value
+
+    @property
+    def priority_length_weight(self) -> int:
+        return self._priority_length_weight
+
+    @priority_length_weight.setter
+    def priority_length_weight(self, value: int) -> None:
+        self.validator.integer(value, min_value=0)
+        self._priority_length_weight = value
+
+    @property
+    def priority_pronounceability_weight(self) -> int:
+        return self._priority_pronounceability_weight
+
+    @priority_pronounceability_weight.setter
+    def priority_pronounceability_weight(self, value: int) -> None:
+        self.validator.integer(value, min_value=0)
+        self._priority_pronounceability_weight = value
+
+    @property
+    def circuit_enabled(self) -> bool:
+        return self._circuit_enabled
+
+    @circuit_enabled.setter
+    def circuit_enabled(self, value: bool) -> None:
+        self.validator.boolean(value)
+        self._circuit_enabled = value
+
+    @property
+    def circuit_window(self) -> int:
+        return self._circuit_window
+
+    @circuit_window.setter
+    def circuit_window(self, value: int) -> None:
+        self.validator.integer(value, min_value=1)
+        self._circuit_window = value
+
+    @property
+    def circuit_min_requests(self) -> int:
+        return self._circuit_min_requests
+
+    @circuit_min_requests.setter
+    def circuit_min_requests(self, value: int) -> None:
+        self.validator.integer(value, min_value=1)
+        self._circuit_min_requests = value
+
+    @property
+    def circuit_error_threshold_percent(self) -> int:
+        return self._circuit_error_threshold_percent
+
+    @circuit_error_threshold_percent.setter
+    def circuit_error_threshold_percent(self, value: int) -> None:
+        self.validator.integer(value, min_value=1, max_value=100)
+        self._circuit_error_threshold_percent = value
+
+    @property
+    def circuit_open_seconds(self) -> int:
+        return self._circuit_open_seconds
+
+    @circuit_open_seconds.setter
+    def circuit_open_seconds(self, value: int) -> None:
+        self.validator.integer(value, min_value=0)
+        self._circuit_open_seconds = value
+
+    @property
+    def circuit_probe_requests(self) -> int:
+        return self._circuit_probe_requests
+
+    @circuit_probe_requests.setter
+    def circuit_probe_requests(self, value: int) -> None:
+        self.validator.integer(value, min_value=1)
+        self._circuit_probe_requests = value
+
+    @property
+    def batch_retry_backoff(self) -> int:
+        return self._batch_retry_backoff
+
+    @batch_retry_backoff.setter
+    def batch_retry_backoff(self, value: int) -> None:
+        self.validator.integer(value, min_value=0)
+        self._batch_retry_backoff = value
+
+    @property
+    def checkers_enabled(self) -> List[str]:
+        return self._checkers_enabled
+
+    @checkers_enabled.setter
+    def checkers_enabled(self, value: List[str]) -> None:
+        self.validator.string_list(value)
+        self._checkers_enabled = value
+
+    @property
+    def checkers_plugins(self) -> List[str]:
+        return self._checkers_plugins
+
+    @checkers_plugins.setter
+    def checkers_plugins(self, value: List[str]) -> None:
+        self.validator.string_list(value)
+        self._checkers_plugins = value
@@ -0,0 +1,86 @@
+import random
+import socket
+import struct
+from typing import Iterable, Optional
+
+from src.utils.config_helper import ConfigHelper
+
+
+# =============================================================================================== #
+
+NS_RECORD = 2
+IN_CLASS = 1
+RCODE_NOERROR = 0
+RCODE_NXDOMAIN = 3
+
+
+class DnsResolver:
+    """Minimal UDP resolver that asks a nameserver whether a domain is delegated.
+
+    Only the response header is read: a NOERROR answer carrying NS records means the domain is
+    registered. Anything else is inconclusive, since an unregistered-looking domain can still be
+    taken (registered without nameservers, or a resolver error), and is left to the registrar API.
+    """
+
+    def __init__(self, nameserver: str, port: int = 53, timeout: float = 2.0) -> None:
+        self.nameserver = nameserver
+        self.port = port
+        self.timeout = timeout
+
+    @staticmethod
+    def build_query(domain: str, query_id: int) -> bytes:
+        """Build a recursive NS query packet for a domain."""
+        header = struct.pack('>HHHHHH', query_id, 0x0100, 1, 0, 0, 0)
+        labels = b''.join(
+            bytes([len(label)]) + label
+            for label in domain.rstrip('.').encode('idna').split(b'.')
+        )
+        return header + labels + b'\x00' + struct.pack('>HH', NS_RECORD, IN_CLASS)
+
+    @staticmethod
+    def parse_response(packet: bytes, query_id: int) -> Optional[bool]:
+        """Read the header of a response; True if it delegates the domain, None otherwise."""
+        if len(packet) < 12:
+            return None
+        response_id, flags, _, answer_count = struct.unpack('>HHHH', packet[:8])
+        if response_id != query_id or not flags & 0x8000:
+            return None
+        if flags & 0x000F == RCODE_NOERROR and answer_count > 0:
+            return True
+        return None
+
+    def is_registered(self, domain: str) -> Optional[bool]:
+        """Check whether a domain clearly resolves; None when the lookup is inconclusive."""
+        query_id = random.getrandbits(16)
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                sock.settimeout(self.timeout)
+                sock.sendto(self.build_query(domain, query_id), (self.nameserver, self.port))
+                packet, _ = sock.recvfrom(512)
+        except (OSError, UnicodeError):
+            return None
+        return self.parse_response(packet, query_id)
+
+
+class StaticResolver:
+    """Offline stand-in for DnsResolver that treats a fixed set of domains as registered."""
+
+    def __init__(self, registered: Iterable[str] = ()) -> None:
+        self.registered = {domain.lower() for domain in registered}
+        self.lookups = []
+
+    def is_registered(self, domain: str) -> Optional[bool]:
+        """Check whether a domain is in the registered set; None when it is not."""
+        self.lookups.append(domain)
+        return True if domain.lower() in self.registered else None
+
+
+def resolver_from_config(config_helper: ConfigHelper) -> Optional[DnsResolver]:
+    """Create the DNS pre-screen resolver from the [DNS] settings, or None when disabled."""
+    if not config_helper.dns_enabled:
+        return None
+    return DnsResolver(
+        config_helper.dns_nameserver,
+        port=config_helper.dns_port,
+        timeout=config_helper.dns_timeout_ms / 1000,
+    )
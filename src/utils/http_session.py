@@ -0,0 +1,28 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.utils.config_helper import ConfigHelper
+
+
+# =============================================================================================== #
+
+def create_session(pool_connections: int, pool_maxsize: int) -> requests.Session:
+    """Create a keep-alive HTTP session with bounded connection pools.
+
+    pool_connections is the number of per-host pools kept open and pool_maxsize caps the
+    connections to any single host; callers block for a free connection instead of opening more.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=True,
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def session_from_config(config_helper: ConfigHelper) -> requests.Session:
+    """Create an HTTP session sized by the [Session] settings."""
+    return create_session(config_helper.pool_connections, config_helper.pool_maxsize)
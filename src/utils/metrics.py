@@ -0,0 +1,181 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+from src.utils.config_helper import ConfigHelper
+
+
+# =============================================================================================== #
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+_NULL_TIMER = nullcontext()
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+class _Histogram:
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> Iterator[Tuple[str, int]]:
+        total = 0
+        for bound, count in zip((*self.buckets, float('inf')), self.counts):
+            total += count
+            yield ('+Inf' if bound == float('inf') else repr(bound)), total
+
+
+class MetricsRegistry:
+    """Process-wide counters and latency histograms that cost a single check when disabled."""
+
+    def __init__(
+        self, enabled: bool = False, prefix: str = 'namechecker', buckets=DEFAULT_BUCKETS
+    ) -> None:
+        self.enabled = enabled
+        self.prefix = prefix
+        self.buckets = tuple(buckets)
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        """Increment a counter."""
+        if not self.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """Record a value, usually a duration in seconds, in a histogram."""
+        if not self.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            if key not in series:
+                series[key] = _Histogram(self.buckets)
+            series[key].observe(value)
+
+    def timer(self, name: str, **labels):
+        """Context manager that observes the duration of its block."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return self._timer(name, labels)
+
+    @contextmanager
+    def _timer(self, name: str, labels: Dict[str, object]) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def get_counter(self, name: str, **labels) -> float:
+        with self._lock:
+            return self._counters.get(name, {}).get(_label_key(labels), 0)
+
+    def snapshot(self) -> Dict:
+        """Get a JSON-serializable copy of every metric."""
+        with self._lock:
+            return {
+                'timestamp': time.time(),
+                'counters': {
+                    name: [{'labels': dict(key), 'value': value} for key, value in series.items()]
+                    for name, series in self._counters.items()
+                },
+                'histograms': {
+                    name: [
+                        {
+                            'labels': dict(key),
+                            'count': histogram.count,
+                            'sum': histogram.sum,
+                            'buckets': dict(histogram.cumulative()),
+                        }
+                        for key, histogram in series.items()
+                    ]
+                    for name, series in self._histograms.items()
+                },
+            }
+
+    def to_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                metric = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {metric} counter")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{metric}{_format_labels(key)} {value:g}")
+            for name, series in sorted(self._histograms.items()):
+                metric = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {metric} histogram")
+                for key, histogram in sorted(series.items()):
+                    for bound, count in histogram.cumulative():
+                        labels = _format_labels(key + (('le', bound),))
+                        lines.append(f"{metric}_bucket{labels} {count}")
+                    lines.append(f"{metric}_sum{_format_labels(key)} {histogram.sum:g}")
+                    lines.append(f"{metric}_count{_format_labels(key)} {histogram.count}")
+        return '\n'.join(lines) + '\n'
+
+    def write(self, filepath: Union[str, Path]) -> None:
+        """Atomically write a snapshot; .prom files get Prometheus text, anything else JSON."""
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                if filepath.suffix == '.prom':
+                    f.write(self.to_prometheus())
+                else:
+                    json.dump(self.snapshot(), f, indent=4)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def _format_labels(key: LabelKey) -> str:
+    if not key:
+        return ''
+    pairs = ','.join(f'{name}="{_escape(value)}"' for name, value in key)
+    return f"{{{pairs}}}"
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+metrics = MetricsRegistry()
+
+
+def configure_metrics(config_helper: ConfigHelper) -> Optional[Path]:
+    """Enable the shared registry per the [Metrics] settings and return the snapshot path."""
+    metrics.enabled = config_helper.metrics_enabled
+    if not metrics.enabled:
+        return None
+    return config_helper.output_dir / config_helper.metrics_filename
@@ -0,0 +1,62 @@
+import hashlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# =============================================================================================== #
+
+def canonical_name(name: str) -> str:
+    """Get the canonical form of a name: GitHub logins and DNS names are case-insensitive."""
+    return name.casefold()
+
+
+class NameIndex:
+    """Hashed index of canonical names, so each logical name is checked and stored once.
+
+    Each canonical name is keyed by an 8-byte digest and maps to its first spelling, which is
+    the one that is checked; later spellings (e.g. 'redoak' after 'RedOak') are recorded as
+    display aliases of it. Keeping the first spelling means every entry costs a full name string,
+    so memory still grows with the number of distinct names.
+    """
+
+    def __init__(self) -> None:
+        self._digests: Dict[bytes, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+    def __contains__(self, name: str) -> bool:
+        return self._digest(name) in self._digests
+
+    @staticmethod
+    def _digest(name: str) -> bytes:
+        return hashlib.blake2b(canonical_name(name).encode('utf-8'), digest_size=8).digest()
+
+    def add(self, name: str) -> bool:
+        """Index a name, returning False if the same logical name was already indexed."""
+        digest = self._digest(name)
+        if digest in self._digests:
+            return False
+        self._digests[digest] = name
+        return True
+
+    def get(self, name: str) -> Optional[str]:
+        """Get the first spelling indexed for a name, or None if it was never indexed."""
+        return self._digests.get(self._digest(name))
+
+    def update(self, names: Iterable[str]) -> None:
+        for name in names:
+            self.add(name)
+
+    def dedupe(self, names: Iterable[str]) -> Tuple[List[str], List[Tuple[str, str]]]:
+        """Split names into new names and (alias, name) pairs for new spellings of indexed names.
+
+        Exact repeats of an indexed spelling are dropped without an alias.
+        """
+        unique = []
+        aliases = []
+        for name in names:
+            if self.add(name):
+                unique.append(name)
+            elif self.get(name) != name:
+                aliases.append((name, self.get(name)))
+        return unique, aliases
@@ -0,0 +1,142 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Mapping, Optional
+
+from src.utils.config_helper import ConfigHelper
+
+
+# =============================================================================================== #
+
+class RateLimiter:
+    """Thread-safe token bucket shared by every request made to one provider."""
+
+    def __init__(
+        self,
+        rate: int,
+        period: float,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.capacity = float(rate)
+        self.fill_rate = rate / period
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._sleep = sleep
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last refill."""
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.fill_rate)
+        self._updated = now
+
+    def _block_for(self, delay: float) -> None:
+        """Hold back all requests for at least delay seconds."""
+        self._blocked_until = max(self._blocked_until, self._clock() + delay)
+
+    def acquire(self) -> float:
+        """Wait for a token to become available and return the total time waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now < self._blocked_until:
+                    delay = self._blocked_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                else:
+                    delay = (1 - self._tokens) / self.fill_rate
+            self._sleep(delay)
+            waited += delay
+
+    def update(self, headers: Optional[Mapping[str, str]]) -> None:
+        """Sync the bucket with the provider's X-RateLimit-Remaining/X-RateLimit-Reset headers."""
+        if not headers:
+            return
+        remaining = _to_float(headers.get('X-RateLimit-Remaining'))
+        if remaining is None:
+            return
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens = min(self._tokens, remaining)
+            if remaining < 1:
+                reset = _to_float(headers.get('X-RateLimit-Reset'))
+                if reset is not None:
+                    self._block_for(max(0.0, reset - time.time()))
+
+    def backoff(self, attempt: int, headers: Optional[Mapping[str, str]] = None) -> float:
+        """Pause the provider after a rate-limited response and return the pause length.
+
+        Retry-After is honored when present, otherwise the delay grows exponentially with
+        full jitter so concurrent workers do not retry in lockstep.
+        """
+        delay = _retry_after(headers)
+        if delay is None:
+            ceiling = min(self.backoff_max, self.backoff_base * 2 ** attempt)
+            delay = random.uniform(0, ceiling)
+        with self._lock:
+            self._block_for(delay)
+        return delay
+
+
+def _to_float(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_after(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """Parse a Retry-After header given either in seconds or as an HTTP date."""
+    if not headers or headers.get('Retry-After') is None:
+        return None
+    value = headers['Retry-After']
+    seconds = _to_float(value)
+    if seconds is not None:
+        return max(0.0, seconds)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class SimulatedClock:
+    """Clock whose sleep advances time instantly, for running limiters without waiting."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def rate_limiter_from_config(config_helper: ConfigHelper, provider: str) -> RateLimiter:
+    """Create the rate limiter for a provider from its config section."""
+    limits = {
+        'GoDaddy': (config_helper.godaddy_rate_limit, config_helper.godaddy_rate_period),
+        'GitHub': (config_helper.github_rate_limit, config_helper.github_rate_period),
+    }
+    if provider not in limits:
+        raise ValueError(f"Invalid rate limit provider: {provider}")
+    return create_rate_limiter(config_helper, *limits[provider])
+
+
+def create_rate_limiter(config_helper: ConfigHelper, rate: int, period: float) -> RateLimiter:
+    """Create a rate limiter for rate requests per period, on a simulated clock in test mode."""
+    if config_helper.test_mode:
+        clock = SimulatedClock()
+        return RateLimiter(rate, period, sleep=clock.sleep, clock=clock)
+    return RateLimiter(rate, period)
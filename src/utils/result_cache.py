@@ -0,0 +1,117 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from src.utils.config_helper import ConfigHelper
+from src.utils.metrics import metrics
+from src.utils.name_index import canonical_name
+
+
+# =============================================================================================== #
+
+class ResultCache:
+    """On-disk availability cache keyed by (provider, key) with per-provider, per-result TTLs.
+
+    Keys are stored in canonical (case-folded) form, so 'RedOak.com' and 'redoak.com' share an
+    entry just as they share a registration.
+    """
+
+    def __init__(
+        self,
+        filepath: Union[str, Path],
+        ttls: Mapping[str, Tuple[int, int]],
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """ttls maps provider -> (available TTL, taken TTL) in seconds; others are not cached."""
+        self.filepath = Path(filepath)
+        self.ttls = dict(ttls)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.filepath, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS cache ('
+            'provider TEXT NOT NULL, '
+            'key TEXT NOT NULL, '
+            'available INTEGER NOT NULL, '
+            'checked_at REAL NOT NULL, '
+            'PRIMARY KEY (provider, key))'
+        )
+        self._conn.commit()
+
+    def _ttl(self, provider: str, available: bool) -> int:
+        available_ttl, taken_ttl = self.ttls.get(provider, (0, 0))
+        return available_ttl if available else taken_ttl
+
+    def get_many(self, provider: str, keys: Iterable[str]) -> Dict[str, bool]:
+        """Get the unexpired cached results for the given keys."""
+        keys = list(keys)
+        if not keys or provider not in self.ttls:
+            return {}
+        spellings: Dict[str, List[str]] = {}
+        for key in keys:
+            spellings.setdefault(canonical_name(key), []).append(key)
+        canonical_keys = list(spellings)
+        now = self._clock()
+        results = {}
+        with self._lock:
+            for i in range(0, len(canonical_keys), 500):
+                chunk = canonical_keys[i: i + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, available, checked_at FROM cache "
+                    f"WHERE provider = ? AND key IN ({', '.join('?' * len(chunk))})",
+                    [provider, *chunk],
+                ).fetchall()
+                for key, available, checked_at in rows:
+                    if now - checked_at < self._ttl(provider, bool(available)):
+                        results.update(dict.fromkeys(spellings[key], bool(available)))
+        metrics.inc('cache_hits_total', len(results), provider=provider)
+        metrics.inc('cache_misses_total', len(keys) - len(results), provider=provider)
+        return results
+
+    def get(self, provider: str, key: str) -> Optional[bool]:
+        """Get the unexpired cached result for a single key."""
+        return self.get_many(provider, [key]).get(key)
+
+    def set_many(self, provider: str, results: Mapping[str, bool]) -> None:
+        """Store results for a provider, replacing any existing entries."""
+        if not results or provider not in self.ttls:
+            return
+        now = self._clock()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO cache (provider, key, available, checked_at) '
+                'VALUES (?, ?, ?, ?)',
+                [(provider, canonical_name(key), int(available), now)
+                 for key, available in results.items()],
+            )
+
+    def set(self, provider: str, key: str, available: bool) -> None:
+        """Store a single result."""
+        self.set_many(provider, {key: available})
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def cache_from_config(config_helper: ConfigHelper) -> Optional[ResultCache]:
+    """Open the result cache described by the config, or None when caching is disabled."""
+    if not config_helper.cache_enabled:
+        return None
+    return ResultCache(
+        config_helper.output_dir / config_helper.cache_filename,
+        ttls={
+            'GoDaddy': (
+                config_helper.godaddy_cache_ttl_available,
+                config_helper.godaddy_cache_ttl_taken,
+            ),
+            'GitHub': (
+                config_helper.github_cache_ttl_available,
+                config_helper.github_cache_ttl_taken,
+            ),
+        },
+    )
@@ -0,0 +1,266 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from itertools import groupby
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from src.utils.config_helper import ConfigHelper
+
+
+# =============================================================================================== #
+
+class ResultsStore:
+    """SQLite results store indexed on (name, key) so each batch is upserted in place.
+
+    Unknown results are stored as NULL values with the reason they could not be determined.
+    """
+
+    def __init__(self, filepath: Union[str, Path]) -> None:
+        self.filepath = Path(filepath)
+        self._lock = threading.Lock()
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.filepath, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        with self._conn:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS results ('
+                'name TEXT NOT NULL, '
+                'key TEXT NOT NULL, '
+                'value, '
+                'reason TEXT, '
+                'updated_at REAL NOT NULL, '
+                'PRIMARY KEY (name, key))'
+            )
+            columns = [row[1] for row in self._conn.execute('PRAGMA table_info(results)')]
+            if 'reason' not in columns:
+                self._conn.execute('ALTER TABLE results ADD COLUMN reason TEXT')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT)'
+            )
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS rejections ('
+                'name TEXT PRIMARY KEY, '
+                'reason TEXT NOT NULL, '
+                'updated_at REAL NOT NULL)'
+            )
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS aliases ('
+                'alias TEXT PRIMARY KEY, '
+                'name TEXT NOT NULL, '
+                'updated_at REAL NOT NULL)'
+            )
+
+    def upsert(self, results: Iterable[Dict]) -> None:
+        """Insert or update result records of the form {'name': ..., key: value, ...} atomically.
+
+        A record's optional 'reason' is stored with its unknown (None) results.
+        """
+        now = time.time()
+        rows = [
+            (record['name'], key, value, record.get('reason') if value is None else None, now)
+            for record in results if record.get('name')
+            for key, value in record.items() if key not in ('name', 'reason')
+        ]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                'INSERT INTO results (name, key, value, reason, updated_at) '
+                'VALUES (?, ?, ?, ?, ?) '
+                'ON CONFLICT (name, key) DO UPDATE SET '
+                'value = excluded.value, reason = excluded.reason, '
+                'updated_at = excluded.updated_at',
+                rows,
+            )
+
+    def get(self, name: str) -> Optional[Dict]:
+        """Get the merged record for a name, looking it up under its checked spelling if needed."""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT key, value FROM results WHERE name = ? ORDER BY rowid', (name,)
+            ).fetchall()
+        if not rows:
+            checked_as = self.resolve(name)
+            return self.get(checked_as) if checked_as not in (None, name) else None
+        return {'name': name, **{key: _from_db(value) for key, value in rows}}
+
+    def get_reasons(self, name: str) -> Dict[str, str]:
+        """Get the reasons a name's unknown results could not be determined, by key."""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT key, reason FROM results '
+                'WHERE name = ? AND reason IS NOT NULL ORDER BY rowid',
+                (name,)
+            ).fetchall()
+        return dict(rows)
+
+    def iter_unknown(self) -> Iterator[Tuple[str, str]]:
+        """Yield the (name, key) pairs whose stored results are unknown, in stored order."""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT name, key FROM results WHERE value IS NULL ORDER BY rowid'
+            ).fetchall()
+        yield from rows
+
+    def add_aliases(self, aliases: Iterable[Tuple[str, str]]) -> None:
+        """Record (alias, name) pairs: other spellings of a name that was checked as name."""
+        now = time.time()
+        rows = [(alias, name, now) for alias, name in aliases]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO aliases (alias, name, updated_at) VALUES (?, ?, ?)', rows
+            )
+
+    def get_aliases(self, name: str) -> List[str]:
+        """Get the other spellings recorded for a checked name."""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT alias FROM aliases WHERE name = ? ORDER BY rowid', (name,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def resolve(self, name: str) -> Optional[str]:
+        """Get the spelling a name's results are stored under, ignoring case, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT name FROM aliases WHERE alias = ? COLLATE NOCASE LIMIT 1', (name,)
+            ).fetchone()
+            if row is None:
+                row = self._conn.execute(
+                    'SELECT name FROM results WHERE name = ? COLLATE NOCASE LIMIT 1', (name,)
+                ).fetchone()
+        return row[0] if row else None
+
+    def iter_records(self) -> Iterator[Dict]:
+        """Yield one merged record per name, ordered by name."""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT name, key, value FROM results ORDER BY name, rowid'
+            ).fetchall()
+        for name, group in groupby(rows, key=lambda row: row[0]):
+            yield {'name': name, **{key: _from_db(value) for _, key, value in group}}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(DISTINCT name) FROM results').fetchone()[0]
+
+    def reject(self, rejections: Iterable[Tuple[str, str]]) -> None:
+        """Record names that were filtered out before checking, with the reason."""
+        now = time.time()
+        rows = [(name, reason, now) for name, reason in rejections]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO rejections (name, reason, updated_at) VALUES (?, ?, ?)',
+                rows,
+            )
+
+    def get_rejection(self, name: str) -> Optional[str]:
+        """Get the reason a name was rejected, if it was."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT reason FROM rejections WHERE name = ?', (name,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def count_rejections(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM rejections').fetchone()[0]
+
+    def get_metadata(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute('SELECT value FROM metadata WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_metadata(self, key: str, value: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)', (key, value)
+            )
+
+    def migrate_json(self, filepath: Union[str, Path]) -> int:
+        """Import a legacy results JSON file once and return the number of records imported."""
+        filepath = Path(filepath)
+        if self.get_metadata('migrated_json') or not filepath.exists():
+            return 0
+        with open(filepath, 'r') as f:
+            records = [record for record in json.load(f) if record.get('name')]
+        self.upsert(records)
+        self.set_metadata('migrated_json', filepath.name)
+        return len(records)
+
+    def export_json(self, filepath: Union[str, Path]) -> None:
+        """Atomically write all records in the legacy results JSON format."""
+        filepath = Path(filepath)
+        fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(list(self.iter_records()), f, indent=4)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def merge(self, filepath: Union[str, Path], skip_metadata: Iterable[str] = ()) -> int:
+        """Upsert every result, rejection, alias and metadata entry from another results store.
+
+        The other store's migration marker and the metadata keys in skip_metadata are not copied.
+        Returns the number of result rows merged; merging the same file twice is harmless.
+        """
+        skipped = ['migrated_json', *skip_metadata]
+        placeholders = ', '.join('?' * len(skipped))
+        with self._lock:
+            self._conn.execute('ATTACH DATABASE ? AS other', (str(filepath),))
+            try:
+                with self._conn:
+                    merged = self._conn.execute(
+                        'INSERT INTO results (name, key, value, reason, updated_at) '
+                        'SELECT name, key, value, reason, updated_at FROM other.results '
+                        'WHERE true '
+                        'ON CONFLICT (name, key) DO UPDATE SET '
+                        'value = excluded.value, reason = excluded.reason, '
+                        'updated_at = excluded.updated_at'
+                    ).rowcount
+                    self._conn.execute(
+                        'INSERT OR REPLACE INTO rejections (name, reason, updated_at) '
+                        'SELECT name, reason, updated_at FROM other.rejections'
+                    )
+                    self._conn.execute(
+                        'INSERT OR REPLACE INTO aliases (alias, name, updated_at) '
+                        'SELECT alias, name, updated_at FROM other.aliases'
+                    )
+                    self._conn.execute(
+                        'INSERT OR REPLACE INTO metadata (key, value) '
+                        f'SELECT key, value FROM other.metadata WHERE key NOT IN ({placeholders})',
+                        skipped,
+                    )
+            finally:
+                self._conn.execute('DETACH DATABASE other')
+        return merged
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _from_db(value):
+    """Convert SQLite's 0/1 integers back to booleans."""
+    return bool(value) if isinstance(value, int) else value
+
+
+def results_store_from_config(config_helper: ConfigHelper, migrate: bool = True) -> ResultsStore:
+    """Open the results store for the environment, migrating the legacy JSON results once.
+
+    Shard stores pass migrate=False, since the sharded run migrates into the main store.
+    """
+    store = ResultsStore(config_helper.output_dir / config_helper.results_db_filename)
+    if migrate:
+        store.migrate_json(config_helper.output_dir / config_helper.results_filename)
+    return store
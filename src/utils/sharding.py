@@ -0,0 +1,42 @@
+import zlib
+from enum import Enum
+from pathlib import Path
+from typing import Iterable, Iterator, Tuple
+
+from src.utils.name_index import canonical_name
+
+
+# =============================================================================================== #
+
+class ShardStrategy(Enum):
+    RANGE = 'range'
+    HASH = 'hash'
+
+
+def shard_bounds(total: int, shard_index: int, shard_count: int) -> Tuple[int, int]:
+    """Get the [start, stop) name positions of a contiguous range shard.
+
+    The first total % shard_count shards get one extra name so shard sizes differ by at most one.
+    """
+    size, extra = divmod(total, shard_count)
+    start = shard_index * size + min(shard_index, extra)
+    return start, start + size + (1 if shard_index < extra else 0)
+
+
+def hash_shard(name: str, shard_count: int) -> int:
+    """Assign a name to a shard with a hash that is stable across processes and runs.
+
+    The canonical name is hashed, so every spelling of a name lands in the same shard.
+    """
+    return zlib.crc32(canonical_name(name).encode('utf-8')) % shard_count
+
+
+def iter_hash_shard(names: Iterable[str], shard_index: int, shard_count: int) -> Iterator[str]:
+    """Yield the names that hash to a shard."""
+    return (name for name in names if hash_shard(name, shard_count) == shard_index)
+
+
+def shard_filename(filename: str, shard_index: int, shard_count: int) -> str:
+    """Suffix a filename with its shard, e.g. results.sqlite3 -> results.shard0of4.sqlite3."""
+    path = Path(filename)
+    return f"{path.stem}.shard{shard_index}of{shard_count}{path.suffix}"
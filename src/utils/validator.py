@@ -70,6 +70,37 @@ class Validator:
         return True
 
 
+    def boolean(self, value: bool) -> bool:
+        """Validates that the provided value is a boolean."""
+        error_msg_base = f"Value {value} is invalid: boolean value"
+        if value is None:
+            raise self.error_type(f"{error_msg_base} cannot be None.")
+        if not isinstance(value, bool):
+            raise self.error_type(f"{error_msg_base} must be a boolean.")
+        return True
+
+
+    def choice(self, value: str, choices: List[str]) -> bool:
+        """Validates that the provided value is one of a fixed set of strings."""
+        error_msg_base = f"Value {value} is invalid: value"
+        if self._check_string(error_msg_base, value):
+            if value not in choices:
+                raise self.error_type(f"{error_msg_base} must be one of {', '.join(choices)}.")
+        return True
+
+
+    def string_list(self, value: List[str]) -> bool:
+        """Validates that the provided value is a list of non-empty strings (it may be empty)."""
+        error_msg_base = f"Value {value} is invalid: value"
+        if value is None:
+            raise self.error_type(f"{error_msg_base} cannot be None.")
+        if not isinstance(value, list):
+            raise self.error_type(f"{error_msg_base} must be a list.")
+        for item in value:
+            self._check_string(f"Value {item} is invalid: item", item)
+        return True
+
+
     def directory(
         self,
         value: Union[str, Path],
@@ -130,6 +161,15 @@ class Validator:
         return True
 
 
+    def hostname(self, value: str) -> bool:
+        """Validates a hostname or IP address."""
+        error_msg_base = f"Hostname {value} is invalid: hostname"
+        if self._check_string(error_msg_base, value):
+            if any(not (char.isalnum() or char in '.-:') for char in value):
+                raise self.error_type(f"{error_msg_base} contains one or more invalid characters.")
+        return True
+
+
     def api_token(
         self,
         value: str,
@@ -0,0 +1,91 @@
+import json
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from benchmarks.mock_api_server import MockApiServer, is_available
+from benchmarks.run_benchmarks import SCENARIOS, bench_name_checker, main
+from src.name_checker import NameChecker
+
+
+@pytest.fixture
+def server():
+    with MockApiServer(seed=0) as server:
+        yield server
+
+
+# testing the mock API server
+def test_mock_godaddy_get(server):
+    response = requests.get(f"{server.url}/v1/domains/available",
+                            params={'domain': 'TestName.com'})
+    assert response.status_code == 200
+    assert response.json()['available'] == is_available('TestName.com')
+
+def test_mock_godaddy_bulk(server):
+    response = requests.post(f"{server.url}/v1/domains/available",
+                             json=['TestName.com', 'FakeHost.com'])
+    domains = [item['domain'] for item in response.json()['domains']]
+    assert domains == ['testname.com', 'fakehost.com']
+
+def test_mock_github_user(server):
+    response = requests.get(f"{server.url}/users/TestName")
+    assert response.status_code == (404 if is_available('TestName') else 200)
+    assert server.requests[('github', response.status_code)] == 1
+
+def test_mock_github_graphql(server):
+    response = requests.post(f"{server.url}/graphql", json={'variables': {'l0': 'TestName'}})
+    data = response.json()['data']
+    assert (data['u0'] is None) == is_available('TestName')
+    assert server.requests[('github_graphql', 200)] == 1
+
+@pytest.mark.parametrize('path, route', [
+    ('/pypi/testname/json', 'pypi'),
+    ('/npm/testname', 'npm'),
+    ('/v2/users/testname/', 'dockerhub')
+])
+def test_mock_package_registries(server, path, route):
+    response = requests.get(f"{server.url}{path}")
+    assert response.status_code == (404 if is_available('testname') else 200)
+    assert server.requests[(route, response.status_code)] == 1
+
+def test_mock_throttle():
+    with MockApiServer(throttle_rate=1.0, retry_after=7) as server:
+        response = requests.get(f"{server.url}/users/TestName")
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '7'
+
+def test_mock_errors():
+    with MockApiServer(error_rate=1.0) as server:
+        response = requests.get(f"{server.url}/users/TestName")
+    assert response.status_code == 500
+
+
+# testing the benchmark runner
+def test_run_benchmarks_report(tmp_path):
+    output = tmp_path / 'bench.json'
+    main([
+        '--names', '10',
+        '--batch-sizes', '5',
+        '--concurrency', '2',
+        '--latency', '0',
+        '--output', str(output)
+    ])
+    report = json.loads(output.read_text())
+    assert [result['scenario'] for result in report['results']] == list(SCENARIOS)
+    for result in report['results']:
+        assert result['names'] == 10
+        assert result['names_per_sec'] > 0
+        assert result['batch_p99_ms'] >= result['batch_p50_ms']
+        assert result['peak_memory_kb'] > 0
+
+def test_bench_name_checker_disables_circuit_breakers(server):
+    name_checkers = []
+
+    def _create(**kwargs):
+        name_checkers.append(NameChecker(**kwargs))
+        return name_checkers[-1]
+
+    with patch('benchmarks.run_benchmarks.NameChecker', _create):
+        bench_name_checker(server, ['TestName'], batch_size=1, max_workers=1, pipeline=False)
+    assert name_checkers[0].circuit_breakers == {'GoDaddy': None, 'GitHub': None}
@@ -0,0 +1,75 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.base_checker import BaseChecker
+from src.checker_registry import ENTRY_POINT_GROUP, CheckerRegistry, registry_from_config
+from src.package_checkers import PyPIChecker
+from src.utils.config_helper import ConfigHelper
+
+
+class SnapChecker(BaseChecker):
+    """Plugin checker used by the loading tests."""
+
+    provider = 'Snap'
+
+    def check_name(self, name):
+        return name.startswith('Red')
+
+
+def test_registry_from_config_builtins(config_helper):
+    registry = registry_from_config(config_helper)
+    assert registry.providers()[:3] == ['PyPI', 'npm', 'DockerHub']
+    assert registry.get('PyPI') is PyPIChecker
+
+def test_registry_from_config_plugins(env_type):
+    config_helper = ConfigHelper(env_type, test_mode=True, overrides={
+        'Checkers': {'PLUGINS': 'tests.checker_registry_test:SnapChecker'}})
+    assert config_helper.checkers_plugins == ['tests.checker_registry_test:SnapChecker']
+    assert registry_from_config(config_helper).get('Snap') is SnapChecker
+
+def test_register_as_decorator():
+    registry = CheckerRegistry()
+
+    @registry.register
+    class OtherChecker(SnapChecker):
+        provider = 'Other'
+
+    assert 'Other' in registry
+    assert list(registry) == ['Other']
+
+@pytest.mark.parametrize('checker, error', [
+    (object, TypeError),
+    ('PyPI', TypeError),
+    (BaseChecker, ValueError)
+])
+def test_register_invalid(checker, error):
+    with pytest.raises(error):
+        CheckerRegistry().register(checker)
+
+def test_get_unknown():
+    with pytest.raises(ValueError):
+        CheckerRegistry().get('Snap')
+
+def test_load_entry_points():
+    entry_point = MagicMock()
+    entry_point.load.return_value = SnapChecker
+    with patch('src.checker_registry.entry_points',
+               return_value=[entry_point]) as mock_entry_points:
+        registry = CheckerRegistry()
+        assert registry.load_entry_points() == 1
+    mock_entry_points.assert_called_once_with(group=ENTRY_POINT_GROUP)
+    assert registry.get('Snap') is SnapChecker
+
+def test_load_plugin(config_helper):
+    registry = CheckerRegistry()
+    assert registry.load_plugin('tests.checker_registry_test:SnapChecker') is SnapChecker
+    assert registry.get('Snap')(config_helper).check(['RedOak', 'GoldFox']) == [
+        {'name': 'RedOak', 'Snap': True},
+        {'name': 'GoldFox', 'Snap': False}
+    ]
+
+@pytest.mark.parametrize('path', ['tests.checker_registry_test', ':SnapChecker'])
+def test_load_plugin_invalid_path(path):
+    with pytest.raises(ValueError):
+        CheckerRegistry().load_plugin(path)
@@ -0,0 +1,38 @@
+import pytest
+
+from src.utils.checkpoint import Checkpoint, checkpoint_from_config
+
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    return Checkpoint(tmp_path / 'checkpoint.json')
+
+
+def test_load_missing(checkpoint):
+    assert checkpoint.load() is None
+
+def test_save_and_load(checkpoint):
+    checkpoint.save({'batch_index': 3, 'batch_size': 25})
+    state = checkpoint.load()
+    assert state['batch_index'] == 3
+    assert state['batch_size'] == 25
+    assert 'updated_at' in state
+
+def test_save_replaces_state(checkpoint):
+    checkpoint.save({'batch_index': 3})
+    checkpoint.save({'batch_index': 4})
+    assert checkpoint.load()['batch_index'] == 4
+
+def test_save_leaves_no_temp_files(checkpoint, tmp_path):
+    checkpoint.save({'batch_index': 1})
+    assert [path.name for path in tmp_path.iterdir()] == ['checkpoint.json']
+
+def test_clear(checkpoint):
+    checkpoint.save({'batch_index': 1})
+    checkpoint.clear()
+    assert checkpoint.load() is None
+    checkpoint.clear()
+
+def test_checkpoint_from_config(config_helper):
+    checkpoint = checkpoint_from_config(config_helper)
+    assert checkpoint.filepath == config_helper.output_dir / config_helper.checkpoint_filename
@@ -0,0 +1,115 @@
+import pytest
+
+from src.utils.circuit_breaker import CircuitBreaker, CircuitState, circuit_breaker_from_config
+from src.utils.rate_limiter import SimulatedClock
+
+
+@pytest.fixture
+def clock():
+    return SimulatedClock()
+
+@pytest.fixture
+def circuit_breaker(clock):
+    return CircuitBreaker('GoDaddy', window=4, min_requests=4, error_threshold=0.5,
+                          open_seconds=10, probe_requests=1, sleep=clock.sleep, clock=clock)
+
+def _trip(circuit_breaker):
+    for _ in range(4):
+        circuit_breaker.record_failure()
+
+
+# testing the closed state
+def test_starts_closed(circuit_breaker):
+    assert circuit_breaker.state is CircuitState.CLOSED
+    assert circuit_breaker.allow() is True
+    assert circuit_breaker.retry_in() == 0
+
+def test_stays_closed_below_min_requests(circuit_breaker):
+    for _ in range(3):
+        circuit_breaker.record_failure()
+    assert circuit_breaker.state is CircuitState.CLOSED
+
+def test_stays_closed_below_threshold(circuit_breaker):
+    for status_code in (200, 200, 503, 404, 200, 200):
+        circuit_breaker.record_status(status_code)
+    assert circuit_breaker.error_rate() == pytest.approx(0.25)
+    assert circuit_breaker.state is CircuitState.CLOSED
+
+def test_window_slides(circuit_breaker):
+    for _ in range(4):
+        circuit_breaker.record_success()
+    circuit_breaker.record_failure()
+    assert circuit_breaker.error_rate() == pytest.approx(0.25)
+
+
+# testing the open and half-open states
+def test_opens_at_threshold(circuit_breaker):
+    for status_code in (200, 500, 200, 502):
+        circuit_breaker.record_status(status_code)
+    assert circuit_breaker.state is CircuitState.OPEN
+    assert circuit_breaker.allow() is False
+    assert circuit_breaker.retry_in() == pytest.approx(10)
+
+def test_half_open_after_open_seconds(circuit_breaker, clock):
+    _trip(circuit_breaker)
+    clock.sleep(10)
+    assert circuit_breaker.state is CircuitState.HALF_OPEN
+    assert circuit_breaker.retry_in() == 0
+
+def test_half_open_allows_probe_requests(circuit_breaker, clock):
+    _trip(circuit_breaker)
+    clock.sleep(10)
+    assert circuit_breaker.allow() is True
+    assert circuit_breaker.allow() is False
+
+def test_successful_probe_closes(circuit_breaker, clock):
+    _trip(circuit_breaker)
+    clock.sleep(10)
+    circuit_breaker.allow()
+    circuit_breaker.record_success()
+    assert circuit_breaker.state is CircuitState.CLOSED
+    assert circuit_breaker.error_rate() == 0
+
+def test_failed_probe_reopens(circuit_breaker, clock):
+    _trip(circuit_breaker)
+    clock.sleep(10)
+    circuit_breaker.allow()
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state is CircuitState.OPEN
+    assert circuit_breaker.retry_in() == pytest.approx(10)
+
+def test_skipped_probe_is_released(circuit_breaker, clock):
+    _trip(circuit_breaker)
+    clock.sleep(10)
+    assert circuit_breaker.allow() is True
+    circuit_breaker.record_status(429)
+    assert circuit_breaker.state is CircuitState.HALF_OPEN
+    assert circuit_breaker.allow() is True
+    circuit_breaker.record_status(200)
+    assert circuit_breaker.state is CircuitState.CLOSED
+
+def test_rate_limited_status_is_skipped(circuit_breaker):
+    for _ in range(4):
+        circuit_breaker.record_status(429)
+        circuit_breaker.record_status(403, rate_limited=True)
+    assert circuit_breaker.error_rate() == 0
+    assert circuit_breaker.state is CircuitState.CLOSED
+
+def test_wait_pauses_until_half_open(circuit_breaker, clock):
+    assert circuit_breaker.wait() == 0
+    _trip(circuit_breaker)
+    clock.sleep(4)
+    assert circuit_breaker.wait() == pytest.approx(6)
+    assert circuit_breaker.state is CircuitState.HALF_OPEN
+
+
+# testing circuit_breaker_from_config
+def test_circuit_breaker_from_config(config_helper):
+    circuit_breaker = circuit_breaker_from_config(config_helper, 'GitHub')
+    assert circuit_breaker.provider == 'GitHub'
+    assert circuit_breaker.min_requests == config_helper.circuit_min_requests
+    assert circuit_breaker.error_threshold == config_helper.circuit_error_threshold_percent / 100
+
+def test_circuit_breaker_from_config_disabled(config_helper):
+    config_helper.circuit_enabled = False
+    assert circuit_breaker_from_config(config_helper, 'GitHub') is None
@@ -0,0 +1,134 @@
+import csv
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.cli import build_parser, main, parse_override
+from src.utils.checkpoint import Checkpoint
+from src.utils.results_store import ResultsStore
+from tests.name_checker_test import BLOCKLISTED
+
+
+def _check_domains(checker):
+    return [{'name': name, f"{name}.com": name.startswith('Red')} for name in checker.host_names]
+
+def _check_github(checker):
+    return [{'name': name, 'GitHub': name.endswith('Oak')} for name in checker.usernames]
+
+
+@pytest.fixture
+def run_cli(tmp_path, capsys):
+    def _results_store(cfg, migrate):
+        return ResultsStore(tmp_path / 'results.sqlite3')
+
+    def _checkpoint(cfg):
+        return Checkpoint(tmp_path / 'checkpoint.json')
+
+    def _run(*argv):
+        with patch('src.name_checker.DomainChecker.check', _check_domains), \
+                patch('src.name_checker.GitHubChecker.check', _check_github), \
+                patch('src.name_checker.results_store_from_config', _results_store), \
+                patch('src.name_checker.checkpoint_from_config', _checkpoint):
+            exit_code = main(['--test-mode', *argv])
+        assert exit_code == 0
+        return capsys.readouterr()
+    return _run
+
+
+# testing argument parsing
+def test_parse_override():
+    assert parse_override('Batch.BATCH_SIZE=10') == ('Batch', 'BATCH_SIZE', '10')
+
+@pytest.mark.parametrize('value', ['BATCH_SIZE=10', 'Batch.BATCH_SIZE', '.KEY=1'])
+def test_parse_override_invalid(value):
+    with pytest.raises(Exception):
+        parse_override(value)
+
+def test_names_and_seeds_are_exclusive(capsys):
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(['--names', 'RedOak', '--seeds', 'seeds.json'])
+
+
+# testing output formats
+def test_jsonl_output(run_cli):
+    captured = run_cli('--names', 'RedOak', 'BlueFox', 'GoldOak')
+    records = [json.loads(line) for line in captured.out.splitlines()]
+    assert records == [
+        {'name': 'RedOak', 'RedOak.com': True, 'GitHub': True},
+        {'name': 'GoldOak', 'GoldOak.com': False, 'GitHub': True}
+    ]
+    assert 'Processing batch' in captured.err
+
+def test_csv_output(run_cli):
+    captured = run_cli('--names', 'RedOak', '--format', 'csv')
+    assert list(csv.reader(io.StringIO(captured.out))) == [
+        ['name', 'check', 'available', 'reason'],
+        ['RedOak', 'RedOak.com', 'true', ''],
+        ['RedOak', 'GitHub', 'true', '']
+    ]
+
+def test_available_output_from_seeds(run_cli):
+    captured = run_cli('--format', 'available', '--batch-size', '4')
+    assert captured.out.splitlines() == ['RedOak']
+
+def test_pipeline_output(run_cli):
+    captured = run_cli('--pipeline', '--format', 'available', '--batch-size', '2')
+    assert captured.out.splitlines() == ['RedOak']
+
+def test_providers_and_output_file(run_cli, tmp_path):
+    output = tmp_path / 'results.jsonl'
+    captured = run_cli('--names', 'RedOak', 'GoldFox', '--providers', 'GitHub',
+                       '--output', str(output))
+    assert captured.out == ''
+    assert [json.loads(line) for line in output.read_text().splitlines()] == [
+        {'name': 'RedOak', 'GitHub': True},
+        {'name': 'GoldFox', 'GitHub': False}
+    ]
+
+def test_seeds_file_and_overrides(run_cli, tmp_path):
+    seeds = tmp_path / 'seeds.json'
+    seeds.write_text(json.dumps([
+        {'seedPosition': 0, 'seedItems': ['Red', 'Gold']},
+        {'seedPosition': 1, 'seedItems': ['Oak']}
+    ]))
+    captured = run_cli('--seeds', str(seeds), '--set', 'Batch.BATCH_SIZE=1')
+    names = [json.loads(line)['name'] for line in captured.out.splitlines()]
+    assert names == ['RedOak', 'GoldOak']
+    assert captured.err.count('Processing batch') == 2
+
+def test_blocklisted_names_are_not_output(run_cli):
+    captured = run_cli('--names', *BLOCKLISTED)
+    assert captured.out == ''
+
+def test_prioritize_and_stop_after(run_cli):
+    captured = run_cli('--prioritize', '--stop-after', '1', '--batch-size', '1',
+                       '--format', 'available')
+    assert captured.out.splitlines() == ['RedOak']
+    assert 'stopping early' in captured.err
+    assert captured.err.count('Processing batch') < 12
+
+def test_delta_run(run_cli):
+    run_cli('--format', 'available')
+    captured = run_cli('--delta', '--format', 'available')
+    assert captured.out == ''
+    assert 'Checking 0 names' in captured.err
+
+def test_checkers(run_cli):
+    def _check_pypi(checker, names):
+        return [{'name': name, 'PyPI': name.startswith('Gold')} for name in names]
+
+    with patch('src.package_checkers.PyPIChecker.check', _check_pypi):
+        captured = run_cli('--names', 'RedOak', 'GoldFox', '--checkers', 'PyPI',
+                           '--providers', 'GitHub', 'PyPI')
+    assert [json.loads(line) for line in captured.out.splitlines()] == [
+        {'name': 'RedOak', 'GitHub': True, 'PyPI': False},
+        {'name': 'GoldFox', 'GitHub': False, 'PyPI': True}
+    ]
+
+def test_unknown_provider(capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        main(['--test-mode', '--names', 'RedOak', '--providers', 'PyPI'])
+    assert exc_info.value.code == 2
+    assert 'Unknown providers: PyPI' in capsys.readouterr().err
@@ -1,5 +1,10 @@
+import os
+import shutil
+
 import pytest
 
+from src.utils.config_helper import ConfigHelper, EnvType, clear_snapshots, load_snapshot
+
 
 def test_config_helper_init(config_helper, env_type):
     assert config_helper.env_type == env_type
@@ -10,6 +15,9 @@ def test_config_helper_init(config_helper, env_type):
 def test_load_batch_config(config_helper):
     assert 'Batch' in config_helper.config.sections()
 
+def test_load_session_config(config_helper):
+    assert 'Session' in config_helper.config.sections()
+
 def test_load_filename_config(config_helper):
     assert 'Filename' in config_helper.config.sections()
 
@@ -48,6 +56,34 @@ def test_batch_retries_invalid(config_helper):
         config_helper.batch_retries = -1
 
 
+# testing pool_connections property
+def test_pool_connections_default(config_helper):
+    assert config_helper.pool_connections == 4
+
+def test_pool_connections_setter(config_helper):
+    new_val = 8
+    config_helper.pool_connections = new_val
+    assert config_helper.pool_connections == new_val
+
+def test_pool_connections_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.pool_connections = 0
+
+
+# testing pool_maxsize property
+def test_pool_maxsize_default(config_helper):
+    assert config_helper.pool_maxsize == 16
+
+def test_pool_maxsize_setter(config_helper):
+    new_val = 32
+    config_helper.pool_maxsize = new_val
+    assert config_helper.pool_maxsize == new_val
+
+def test_pool_maxsize_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.pool_maxsize = 0
+
+
 # testing seeds_filename property
 def test_seeds_filename_default(config_helper):
     assert config_helper.seeds_filename == 'seeds.json'
@@ -79,6 +115,40 @@ def test_results_filename_invalid(config_helper):
         config_helper.results_filename = ''
 
 
+# testing results_db_filename property
+def test_results_db_filename_default(config_helper):
+    if config_helper.env_type.name == 'PRD':
+        assert config_helper.results_db_filename == 'results.sqlite3'
+    else:
+        assert config_helper.results_db_filename == 'test_results.sqlite3'
+
+def test_results_db_filename_setter(config_helper):
+    new_filename = 'bad_results.db'
+    config_helper.results_db_filename = new_filename
+    assert config_helper.results_db_filename == new_filename
+
+def test_results_db_filename_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.results_db_filename = ''
+
+
+# testing checkpoint_filename property
+def test_checkpoint_filename_default(config_helper):
+    if config_helper.env_type.name == 'PRD':
+        assert config_helper.checkpoint_filename == 'checkpoint.json'
+    else:
+        assert config_helper.checkpoint_filename == 'test_checkpoint.json'
+
+def test_checkpoint_filename_setter(config_helper):
+    new_filename = 'bad_checkpoint.txt'
+    config_helper.checkpoint_filename = new_filename
+    assert config_helper.checkpoint_filename == new_filename
+
+def test_checkpoint_filename_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.checkpoint_filename = ''
+
+
 # testing godaddy_max_retries property
 def test_godaddy_max_retries_default(config_helper):
     assert config_helper.godaddy_max_retries == 3
@@ -93,6 +163,63 @@ def test_godaddy_max_retries_invalid(config_helper):
         config_helper.godaddy_max_retries = -1
 
 
+# testing godaddy_max_workers property
+def test_godaddy_max_workers_default(config_helper):
+    assert config_helper.godaddy_max_workers == 16
+
+def test_godaddy_max_workers_setter(config_helper):
+    new_val = 4
+    config_helper.godaddy_max_workers = new_val
+    assert config_helper.godaddy_max_workers == new_val
+
+def test_godaddy_max_workers_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.godaddy_max_workers = 0
+
+
+# testing godaddy_bulk_limit property
+def test_godaddy_bulk_limit_default(config_helper):
+    assert config_helper.godaddy_bulk_limit == 500
+
+def test_godaddy_bulk_limit_setter(config_helper):
+    new_val = 50
+    config_helper.godaddy_bulk_limit = new_val
+    assert config_helper.godaddy_bulk_limit == new_val
+
+@pytest.mark.parametrize('new_val', [0, 501])
+def test_godaddy_bulk_limit_invalid(config_helper, new_val):
+    with pytest.raises(ValueError):
+        config_helper.godaddy_bulk_limit = new_val
+
+
+# testing godaddy_rate_limit property
+def test_godaddy_rate_limit_default(config_helper):
+    assert config_helper.godaddy_rate_limit == 60
+
+def test_godaddy_rate_limit_setter(config_helper):
+    new_val = 120
+    config_helper.godaddy_rate_limit = new_val
+    assert config_helper.godaddy_rate_limit == new_val
+
+def test_godaddy_rate_limit_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.godaddy_rate_limit = 0
+
+
+# testing godaddy_rate_period property
+def test_godaddy_rate_period_default(config_helper):
+    assert config_helper.godaddy_rate_period == 60
+
+def test_godaddy_rate_period_setter(config_helper):
+    new_val = 30
+    config_helper.godaddy_rate_period = new_val
+    assert config_helper.godaddy_rate_period == new_val
+
+def test_godaddy_rate_period_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.godaddy_rate_period = 0
+
+
 # testing godaddy_api_url property
 def test_godaddy_api_url_default(config_helper):
     if config_helper.env_type.name == 'PRD':
@@ -124,6 +251,48 @@ def test_github_api_url_invalid(config_helper):
         config_helper.github_api_url = ''
 
 
+# testing github_max_retries property
+def test_github_max_retries_default(config_helper):
+    assert config_helper.github_max_retries == 3
+
+def test_github_max_retries_setter(config_helper):
+    new_val = 5
+    config_helper.github_max_retries = new_val
+    assert config_helper.github_max_retries == new_val
+
+def test_github_max_retries_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.github_max_retries = -1
+
+
+# testing github_rate_limit property
+def test_github_rate_limit_default(config_helper):
+    assert config_helper.github_rate_limit == 5000
+
+def test_github_rate_limit_setter(config_helper):
+    new_val = 1000
+    config_helper.github_rate_limit = new_val
+    assert config_helper.github_rate_limit == new_val
+
+def test_github_rate_limit_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.github_rate_limit = 0
+
+
+# testing github_rate_period property
+def test_github_rate_period_default(config_helper):
+    assert config_helper.github_rate_period == 3600
+
+def test_github_rate_period_setter(config_helper):
+    new_val = 60
+    config_helper.github_rate_period = new_val
+    assert config_helper.github_rate_period == new_val
+
+def test_github_rate_period_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.github_rate_period = 0
+
+
 # testing godaddy_api_key property
 def test_godaddy_api_key_default(config_helper):
     if config_helper.env_type.name == 'PRD':
@@ -172,6 +341,643 @@ def test_github_token_invalid(config_helper):
         config_helper.github_token = ''
 
 
+# testing cache_filename property
+def test_cache_filename_default(config_helper):
+    assert config_helper.cache_filename == 'cache.sqlite3'
+
+def test_cache_filename_setter(config_helper):
+    new_val = 'other_cache.db'
+    config_helper.cache_filename = new_val
+    assert config_helper.cache_filename == new_val
+
+def test_cache_filename_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.cache_filename = ''
+
+
+# testing cache_enabled property
+def test_cache_enabled_default(config_helper):
+    assert config_helper.cache_enabled == True
+
+def test_cache_enabled_setter(config_helper):
+    new_val = False
+    config_helper.cache_enabled = new_val
+    assert config_helper.cache_enabled == new_val
+
+def test_cache_enabled_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.cache_enabled = 'yes'
+
+
+# testing godaddy_cache_ttl_available property
+def test_godaddy_cache_ttl_available_default(config_helper):
+    assert config_helper.godaddy_cache_ttl_available == 3600
+
+def test_godaddy_cache_ttl_available_setter(config_helper):
+    new_val = 60
+    config_helper.godaddy_cache_ttl_available = new_val
+    assert config_helper.godaddy_cache_ttl_available == new_val
+
+def test_godaddy_cache_ttl_available_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.godaddy_cache_ttl_available = -1
+
+
+# testing godaddy_cache_ttl_taken property
+def test_godaddy_cache_ttl_taken_default(config_helper):
+    assert config_helper.godaddy_cache_ttl_taken == 604800
+
+def test_godaddy_cache_ttl_taken_setter(config_helper):
+    new_val = 86400
+    config_helper.godaddy_cache_ttl_taken = new_val
+    assert config_helper.godaddy_cache_ttl_taken == new_val
+
+def test_godaddy_cache_ttl_taken_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.godaddy_cache_ttl_taken = -1
+
+
+# testing github_cache_ttl_available property
+def test_github_cache_ttl_available_default(config_helper):
+    assert config_helper.github_cache_ttl_available == 3600
+
+def test_github_cache_ttl_available_setter(config_helper):
+    new_val = 60
+    config_helper.github_cache_ttl_available = new_val
+    assert config_helper.github_cache_ttl_available == new_val
+
+def test_github_cache_ttl_available_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.github_cache_ttl_available = -1
+
+
+# testing github_cache_ttl_taken property
+def test_github_cache_ttl_taken_default(config_helper):
+    assert config_helper.github_cache_ttl_taken == 604800
+
+def test_github_cache_ttl_taken_setter(config_helper):
+    new_val = 86400
+    config_helper.github_cache_ttl_taken = new_val
+    assert config_helper.github_cache_ttl_taken == new_val
+
+def test_github_cache_ttl_taken_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.github_cache_ttl_taken = -1
+
+
+# testing queue_size property
+def test_queue_size_default(config_helper):
+    assert config_helper.queue_size == 4
+
+def test_queue_size_setter(config_helper):
+    new_val = 8
+    config_helper.queue_size = new_val
+    assert config_helper.queue_size == new_val
+
+def test_queue_size_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.queue_size = 0
+
+
+# testing godaddy_stage_workers property
+def test_godaddy_stage_workers_default(config_helper):
+    assert config_helper.godaddy_stage_workers == 2
+
+def test_godaddy_stage_workers_setter(config_helper):
+    new_val = 3
+    config_helper.godaddy_stage_workers = new_val
+    assert config_helper.godaddy_stage_workers == new_val
+
+def test_godaddy_stage_workers_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.godaddy_stage_workers = 0
+
+
+# testing github_stage_workers property
+def test_github_stage_workers_default(config_helper):
+    assert config_helper.github_stage_workers == 4
+
+def test_github_stage_workers_setter(config_helper):
+    new_val = 3
+    config_helper.github_stage_workers = new_val
+    assert config_helper.github_stage_workers == new_val
+
+def test_github_stage_workers_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.github_stage_workers = 0
+
+
+# testing blocklist_filename property
+def test_blocklist_filename_default(config_helper):
+    assert config_helper.blocklist_filename == 'blocklist.txt'
+
+def test_blocklist_filename_setter(config_helper):
+    new_val = 'words.txt'
+    config_helper.blocklist_filename = new_val
+    assert config_helper.blocklist_filename == new_val
+
+def test_blocklist_filename_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.blocklist_filename = ''
+
+
+# testing filter_enabled property
+def test_filter_enabled_default(config_helper):
+    assert config_helper.filter_enabled == True
+
+def test_filter_enabled_setter(config_helper):
+    new_val = False
+    config_helper.filter_enabled = new_val
+    assert config_helper.filter_enabled == new_val
+
+def test_filter_enabled_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.filter_enabled = 'no'
+
+
+# testing filter_max_length property
+def test_filter_max_length_default(config_helper):
+    assert config_helper.filter_max_length == 39
+
+def test_filter_max_length_setter(config_helper):
+    new_val = 63
+    config_helper.filter_max_length = new_val
+    assert config_helper.filter_max_length == new_val
+
+def test_filter_max_length_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.filter_max_length = 64
+
+
+# testing metrics_filename property
+def test_metrics_filename_default(config_helper):
+    assert config_helper.metrics_filename == 'metrics.json'
+
+def test_metrics_filename_setter(config_helper):
+    new_val = 'metrics.prom'
+    config_helper.metrics_filename = new_val
+    assert config_helper.metrics_filename == new_val
+
+def test_metrics_filename_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.metrics_filename = ''
+
+
+# testing metrics_enabled property
+def test_metrics_enabled_default(config_helper):
+    assert config_helper.metrics_enabled == False
+
+def test_metrics_enabled_setter(config_helper):
+    new_val = True
+    config_helper.metrics_enabled = new_val
+    assert config_helper.metrics_enabled == new_val
+
+def test_metrics_enabled_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.metrics_enabled = 0
+
+
+# testing github_graphql_url property
+def test_github_graphql_url_default(config_helper):
+    assert config_helper.github_graphql_url == 'https://api.github.com/graphql'
+
+def test_github_graphql_url_setter(config_helper):
+    new_val = 'https://youtu.be/dQw4w9WgXcQ'
+    config_helper.github_graphql_url = new_val
+    assert config_helper.github_graphql_url == new_val
+
+def test_github_graphql_url_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.github_graphql_url = ''
+
+
+# testing github_use_graphql property
+def test_github_use_graphql_default(config_helper):
+    assert config_helper.github_use_graphql == True
+
+def test_github_use_graphql_setter(config_helper):
+    new_val = False
+    config_helper.github_use_graphql = new_val
+    assert config_helper.github_use_graphql == new_val
+
+def test_github_use_graphql_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.github_use_graphql = None
+
+
+# testing github_graphql_batch_size property
+def test_github_graphql_batch_size_default(config_helper):
+    assert config_helper.github_graphql_batch_size == 50
+
+def test_github_graphql_batch_size_setter(config_helper):
+    new_val = 25
+    config_helper.github_graphql_batch_size = new_val
+    assert config_helper.github_graphql_batch_size == new_val
+
+def test_github_graphql_batch_size_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.github_graphql_batch_size = 0
+
+
+# testing dns_enabled property
+def test_dns_enabled_default(config_helper):
+    assert config_helper.dns_enabled == False
+
+def test_dns_enabled_setter(config_helper):
+    new_val = True
+    config_helper.dns_enabled = new_val
+    assert config_helper.dns_enabled == new_val
+
+def test_dns_enabled_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.dns_enabled = None
+
+
+# testing dns_nameserver property
+def test_dns_nameserver_default(config_helper):
+    assert config_helper.dns_nameserver == '1.1.1.1'
+
+def test_dns_nameserver_setter(config_helper):
+    new_val = '8.8.8.8'
+    config_helper.dns_nameserver = new_val
+    assert config_helper.dns_nameserver == new_val
+
+def test_dns_nameserver_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.dns_nameserver = ''
+
+
+# testing dns_port property
+def test_dns_port_default(config_helper):
+    assert config_helper.dns_port == 53
+
+def test_dns_port_setter(config_helper):
+    new_val = 5353
+    config_helper.dns_port = new_val
+    assert config_helper.dns_port == new_val
+
+def test_dns_port_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.dns_port = 0
+
+
+# testing dns_timeout_ms property
+def test_dns_timeout_ms_default(config_helper):
+    assert config_helper.dns_timeout_ms == 2000
+
+def test_dns_timeout_ms_setter(config_helper):
+    new_val = 500
+    config_helper.dns_timeout_ms = new_val
+    assert config_helper.dns_timeout_ms == new_val
+
+def test_dns_timeout_ms_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.dns_timeout_ms = 0
+
+
+# testing dns_max_workers property
+def test_dns_max_workers_default(config_helper):
+    assert config_helper.dns_max_workers == 64
+
+def test_dns_max_workers_setter(config_helper):
+    new_val = 8
+    config_helper.dns_max_workers = new_val
+    assert config_helper.dns_max_workers == new_val
+
+def test_dns_max_workers_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.dns_max_workers = 0
+
+
+# testing shard_count property
+def test_shard_count_default(config_helper):
+    assert config_helper.shard_count == 1
+
+def test_shard_count_setter(config_helper):
+    new_val = 4
+    config_helper.shard_count = new_val
+    assert config_helper.shard_count == new_val
+
+def test_shard_count_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.shard_count = 0
+
+
+# testing shard_strategy property
+def test_shard_strategy_default(config_helper):
+    assert config_helper.shard_strategy == 'range'
+
+def test_shard_strategy_setter(config_helper):
+    new_val = 'hash'
+    config_helper.shard_strategy = new_val
+    assert config_helper.shard_strategy == new_val
+
+def test_shard_strategy_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.shard_strategy = 'modulo'
+
+
+# testing apply_shard_credentials
+def test_apply_shard_credentials(config_helper):
+    if config_helper.env_type == EnvType.PRD:
+        assert config_helper.apply_shard_credentials(1) == ['GitHub']
+        assert config_helper.godaddy_api_key == 'TEST_prd_api_key_456'
+    else:
+        assert config_helper.apply_shard_credentials(1) == ['GoDaddy', 'GitHub']
+        assert config_helper.godaddy_api_key == 'TEST_dev_api_key_shard_1'
+        assert config_helper.godaddy_api_secret == 'TEST_dev_api_secret_shard_1'
+    assert config_helper.github_token == 'github_pat_TEST_token_shard_1'
+
+def test_apply_shard_credentials_missing(config_helper):
+    assert config_helper.apply_shard_credentials(3) == []
+    assert config_helper.github_token == 'github_pat_TEST_token_123'
+
+
+# testing godaddy_primary_ending property
+def test_godaddy_primary_ending_default(config_helper):
+    assert config_helper.godaddy_primary_ending == 'com'
+
+def test_godaddy_primary_ending_setter(config_helper):
+    new_val = 'io'
+    config_helper.godaddy_primary_ending = new_val
+    assert config_helper.godaddy_primary_ending == new_val
+
+def test_godaddy_primary_ending_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.godaddy_primary_ending = ''
+
+
+# testing godaddy_short_circuit property
+def test_godaddy_short_circuit_default(config_helper):
+    assert config_helper.godaddy_short_circuit == False
+
+def test_godaddy_short_circuit_setter(config_helper):
+    new_val = True
+    config_helper.godaddy_short_circuit = new_val
+    assert config_helper.godaddy_short_circuit == new_val
+
+def test_godaddy_short_circuit_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.godaddy_short_circuit = None
+
+
+# testing the shared config snapshot
+def test_snapshot_is_shared(env_type, config_helper):
+    other = ConfigHelper(env_type, test_mode=True)
+    assert other.config is config_helper.config
+    assert other.snapshot is load_snapshot(test_mode=True)
+
+def test_snapshot_is_read_only(config_helper):
+    with pytest.raises(TypeError):
+        config_helper.config.set('Batch', 'BATCH_SIZE', '1')
+    with pytest.raises(TypeError):
+        config_helper.config.remove_section('Batch')
+
+def test_setters_do_not_leak_between_helpers(env_type, config_helper):
+    config_helper.batch_size = 7
+    assert ConfigHelper(env_type, test_mode=True).batch_size == 25
+
+def test_env_var_override(env_type, monkeypatch):
+    monkeypatch.setenv('NAMECHECKER_BATCH_BATCH_SIZE', '10')
+    monkeypatch.setenv('NAMECHECKER_GITHUB_USE_GRAPHQL', 'False')
+    config_helper = ConfigHelper(env_type, test_mode=True)
+    assert config_helper.batch_size == 10
+    assert config_helper.github_use_graphql is False
+
+def test_explicit_override_beats_env_var(env_type, monkeypatch):
+    monkeypatch.setenv('NAMECHECKER_BATCH_BATCH_SIZE', '10')
+    config_helper = ConfigHelper(env_type, test_mode=True,
+                                 overrides={'Batch': {'BATCH_SIZE': '12'}})
+    assert config_helper.batch_size == 12
+    assert ConfigHelper(env_type, test_mode=True).batch_size == 10
+
+def test_reload_if_changed(env_type, project_root, tmp_path, monkeypatch):
+    cfg_dir = tmp_path / 'NameChecker' / 'tests' / 'cfg'
+    shutil.copytree(project_root / 'cfg', cfg_dir)
+    monkeypatch.chdir(tmp_path / 'NameChecker')
+    config_helper = ConfigHelper(env_type, test_mode=True)
+    assert config_helper.reload_if_changed() is False
+
+    config_file = cfg_dir / 'config.ini'
+    config_file.write_text(config_file.read_text().replace('BATCH_SIZE = 25', 'BATCH_SIZE = 30'))
+    mtime = config_file.stat().st_mtime_ns + 1_000_000_000
+    os.utime(config_file, ns=(mtime, mtime))
+    assert config_helper.reload_if_changed() is True
+    assert config_helper.batch_size == 30
+    assert ConfigHelper(env_type, test_mode=True).batch_size == 30
+    clear_snapshots()
+
+
+# testing priority_enabled property
+def test_priority_enabled_default(config_helper):
+    assert config_helper.priority_enabled == False
+
+def test_priority_enabled_setter(config_helper):
+    new_val = True
+    config_helper.priority_enabled = new_val
+    assert config_helper.priority_enabled == new_val
+
+def test_priority_enabled_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.priority_enabled = None
+
+
+# testing priority_window property
+def test_priority_window_default(config_helper):
+    assert config_helper.priority_window == 1000
+
+def test_priority_window_setter(config_helper):
+    new_val = 50
+    config_helper.priority_window = new_val
+    assert config_helper.priority_window == new_val
+
+def test_priority_window_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.priority_window = 0
+
+
+# testing priority_stop_after property
+def test_priority_stop_after_default(config_helper):
+    assert config_helper.priority_stop_after == 0
+
+def test_priority_stop_after_setter(config_helper):
+    new_val = 10
+    config_helper.priority_stop_after = new_val
+    assert config_helper.priority_stop_after == new_val
+
+def test_priority_stop_after_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.priority_stop_after = -1
+
+
+# testing priority_target_length property
+def test_priority_target_length_default(config_helper):
+    assert config_helper.priority_target_length == 8
+
+def test_priority_target_length_setter(config_helper):
+    new_val = 6
+    config_helper.priority_target_length = new_val
+    assert config_helper.priority_target_length == new_val
+
+def test_priority_target_length_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.priority_target_length = 0
+
+
+# testing priority_length_weight property
+def test_priority_length_weight_default(config_helper):
+    assert config_helper.priority_length_weight == 1
+
+def test_priority_length_weight_setter(config_helper):
+    new_val = 2
+    config_helper.priority_length_weight = new_val
+    assert config_helper.priority_length_weight == new_val
+
+def test_priority_length_weight_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.priority_length_weight = -1
+
+
+# testing priority_pronounceability_weight property
+def test_priority_pronounceability_weight_default(config_helper):
+    assert config_helper.priority_pronounceability_weight == 4
+
+def test_priority_pronounceability_weight_setter(config_helper):
+    new_val = 0
+    config_helper.priority_pronounceability_weight = new_val
+    assert config_helper.priority_pronounceability_weight == new_val
+
+def test_priority_pronounceability_weight_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.priority_pronounceability_weight = -1
+
+
+# testing circuit_enabled property
+def test_circuit_enabled_default(config_helper):
+    assert config_helper.circuit_enabled == True
+
+def test_circuit_enabled_setter(config_helper):
+    new_val = False
+    config_helper.circuit_enabled = new_val
+    assert config_helper.circuit_enabled == new_val
+
+def test_circuit_enabled_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.circuit_enabled = None
+
+
+# testing circuit_window property
+def test_circuit_window_default(config_helper):
+    assert config_helper.circuit_window == 20
+
+def test_circuit_window_setter(config_helper):
+    new_val = 50
+    config_helper.circuit_window = new_val
+    assert config_helper.circuit_window == new_val
+
+def test_circuit_window_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.circuit_window = 0
+
+
+# testing circuit_min_requests property
+def test_circuit_min_requests_default(config_helper):
+    assert config_helper.circuit_min_requests == 10
+
+def test_circuit_min_requests_setter(config_helper):
+    new_val = 5
+    config_helper.circuit_min_requests = new_val
+    assert config_helper.circuit_min_requests == new_val
+
+def test_circuit_min_requests_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.circuit_min_requests = 0
+
+
+# testing circuit_error_threshold_percent property
+def test_circuit_error_threshold_percent_default(config_helper):
+    assert config_helper.circuit_error_threshold_percent == 50
+
+def test_circuit_error_threshold_percent_setter(config_helper):
+    new_val = 75
+    config_helper.circuit_error_threshold_percent = new_val
+    assert config_helper.circuit_error_threshold_percent == new_val
+
+def test_circuit_error_threshold_percent_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.circuit_error_threshold_percent = 101
+
+
+# testing circuit_open_seconds property
+def test_circuit_open_seconds_default(config_helper):
+    assert config_helper.circuit_open_seconds == 30
+
+def test_circuit_open_seconds_setter(config_helper):
+    new_val = 60
+    config_helper.circuit_open_seconds = new_val
+    assert config_helper.circuit_open_seconds == new_val
+
+def test_circuit_open_seconds_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.circuit_open_seconds = -1
+
+
+# testing circuit_probe_requests property
+def test_circuit_probe_requests_default(config_helper):
+    assert config_helper.circuit_probe_requests == 1
+
+def test_circuit_probe_requests_setter(config_helper):
+    new_val = 3
+    config_helper.circuit_probe_requests = new_val
+    assert config_helper.circuit_probe_requests == new_val
+
+def test_circuit_probe_requests_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.circuit_probe_requests = 0
+
+
+# testing batch_retry_backoff property
+def test_batch_retry_backoff_default(config_helper):
+    assert config_helper.batch_retry_backoff == 0
+
+def test_batch_retry_backoff_setter(config_helper):
+    new_val = 5
+    config_helper.batch_retry_backoff = new_val
+    assert config_helper.batch_retry_backoff == new_val
+
+def test_batch_retry_backoff_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.batch_retry_backoff = -1
+
+
+# testing checkers_enabled property
+def test_checkers_enabled_default(config_helper):
+    assert config_helper.checkers_enabled == []
+
+def test_checkers_enabled_setter(config_helper):
+    new_val = ['PyPI', 'npm']
+    config_helper.checkers_enabled = new_val
+    assert config_helper.checkers_enabled == new_val
+
+def test_checkers_enabled_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.checkers_enabled = None
+
+
+# testing checkers_plugins property
+def test_checkers_plugins_default(config_helper):
+    assert config_helper.checkers_plugins == []
+
+def test_checkers_plugins_setter(config_helper):
+    new_val = ['my_package.checkers:SnapChecker']
+    config_helper.checkers_plugins = new_val
+    assert config_helper.checkers_plugins == new_val
+
+def test_checkers_plugins_invalid(config_helper):
+    with pytest.raises(ValueError):
+        config_helper.checkers_plugins = 'my_package.checkers:SnapChecker'
+
+
 @pytest.mark.parametrize('section, key', [
         ('Batch', 'BATCH_SIZE'),
         ('Filename', 'SEEDS'),
@@ -2,6 +2,8 @@ import pytest
 
 import src.utils.toad_utils as ToadUtils
 from src.domain_checker import DomainChecker
+from src.github_checker import GitHubChecker
+from src.name_checker import NameChecker
 from src.utils.config_helper import ConfigHelper, EnvType
 from src.utils.validator import ValidatorType, Validator
 
@@ -36,4 +38,10 @@ def domain_checker(env_type):
         test_mode=True
     )
 
+@pytest.fixture
+def github_checker(config_helper):
+    return GitHubChecker(usernames=['TestName'], config_helper=config_helper)
 
+@pytest.fixture
+def name_checker(env_type):
+    return NameChecker(env_type=env_type, batch_size=5, test_mode=True)
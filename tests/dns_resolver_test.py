@@ -0,0 +1,91 @@
+import socket
+import struct
+import threading
+
+import pytest
+
+from src.utils.dns_resolver import DnsResolver, StaticResolver, resolver_from_config
+
+
+def _response(query: bytes, rcode: int = 0, answer_count: int = 1) -> bytes:
+    query_id = struct.unpack('>H', query[:2])[0]
+    return struct.pack('>HHHHHH', query_id, 0x8180 | rcode, 1, answer_count, 0, 0) + query[12:]
+
+
+@pytest.fixture
+def nameserver():
+    """Local UDP nameserver that answers NOERROR with records only for registered.com."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(('127.0.0.1', 0))
+
+    def _serve():
+        while True:
+            try:
+                query, address = sock.recvfrom(512)
+            except OSError:
+                return
+            if b'\x0aregistered\x03com' in query:
+                sock.sendto(_response(query), address)
+            else:
+                sock.sendto(_response(query, rcode=3, answer_count=0), address)
+
+    thread = threading.Thread(target=_serve, daemon=True)
+    thread.start()
+    yield sock.getsockname()
+    sock.close()
+
+
+# testing DnsResolver
+def test_build_query():
+    query = DnsResolver.build_query('TestName.com', 0x1234)
+    assert query[:2] == b'\x12\x34'
+    assert query[12:] == b'\x08TestName\x03com\x00\x00\x02\x00\x01'
+
+@pytest.mark.parametrize('rcode, answer_count, expected', [
+    (0, 2, True),
+    (0, 0, None),
+    (3, 0, None),
+    (2, 0, None)
+])
+def test_parse_response(rcode, answer_count, expected):
+    query = DnsResolver.build_query('TestName.com', 7)
+    assert DnsResolver.parse_response(_response(query, rcode, answer_count), 7) is expected
+
+def test_parse_response_wrong_id():
+    query = DnsResolver.build_query('TestName.com', 7)
+    assert DnsResolver.parse_response(_response(query), 8) is None
+
+def test_parse_response_truncated():
+    assert DnsResolver.parse_response(b'\x00\x07', 7) is None
+
+def test_is_registered(nameserver):
+    host, port = nameserver
+    resolver = DnsResolver(host, port=port, timeout=1.0)
+    assert resolver.is_registered('registered.com') is True
+    assert resolver.is_registered('FakeHost.com') is None
+
+def test_is_registered_timeout():
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as silent:
+        silent.bind(('127.0.0.1', 0))
+        host, port = silent.getsockname()
+        assert DnsResolver(host, port=port, timeout=0.05).is_registered('TestName.com') is None
+
+
+# testing StaticResolver
+def test_static_resolver():
+    resolver = StaticResolver(['TestName.com'])
+    assert resolver.is_registered('testname.com') is True
+    assert resolver.is_registered('FakeHost.com') is None
+    assert resolver.lookups == ['testname.com', 'FakeHost.com']
+
+
+# testing resolver_from_config
+def test_resolver_from_config_disabled(config_helper):
+    assert resolver_from_config(config_helper) is None
+
+def test_resolver_from_config(config_helper):
+    config_helper.dns_enabled = True
+    resolver = resolver_from_config(config_helper)
+    assert resolver.nameserver == config_helper.dns_nameserver
+    assert resolver.port == 53
+    assert resolver.timeout == 2.0
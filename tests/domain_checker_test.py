@@ -1,14 +1,22 @@
-from unittest.mock import patch
+import random
+import re
+import time
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from src.domain_checker import DomainChecker
+from src.utils.circuit_breaker import CircuitBreaker, CircuitState
+from src.utils.dns_resolver import StaticResolver
+from src.utils.rate_limiter import SimulatedClock
+from src.utils.result_cache import ResultCache
 
 class MockResponse:
-    def __init__(self, json_data, status_code, text):
+    def __init__(self, json_data, status_code, text, headers=None):
         self.json_data = json_data
         self.status_code = status_code
         self.text = text
+        self.headers = headers or {}
 
     def json(self):
         return self.json_data
@@ -22,10 +30,25 @@ def test_domain_checker_init_env_type(domain_checker, env_type):
 def test_domain_checker_init_endings(domain_checker, env_type):
     assert domain_checker.endings == ['com']
 
+def test_domain_checker_shared_session(env_type, config_helper):
+    session = MagicMock()
+    domain_checker = DomainChecker(
+        host_names=['TestName'],
+        env_type=env_type,
+        config_helper=config_helper,
+        session=session
+    )
+    assert domain_checker.session is session
+    assert domain_checker.cfg is config_helper
+
 def test_set_max_retries(domain_checker):
     domain_checker._set_max_retries(5)
     assert domain_checker.cfg.godaddy_max_retries == 5
 
+def test_set_max_workers(domain_checker):
+    domain_checker._set_max_workers(4)
+    assert domain_checker.cfg.godaddy_max_workers == 4
+
 def test_get_api_headers_authorization(domain_checker):
     headers = domain_checker.get_api_headers()
     assert "Authorization" in headers
@@ -60,16 +83,356 @@ def test_get_domains_(env_type, host_names, endings):
             domains.append(f"{hostname}.{ending}")
     assert sorted(domain_checker.get_domains()) == sorted(domains)
 
-@patch('requests.get', return_value=MockResponse({"available": True}, 200, ""))
+@patch('requests.Session.get', return_value=MockResponse({"available": True}, 200, ""))
 def test_check_domain_success(mock_get, domain_checker):
     assert domain_checker.check_domain('TestName.com') is True
     mock_get.assert_called_once()
 
-@patch('requests.get', return_value=MockResponse({}, 429, "TOO_MANY_REQUESTS"))
+@patch('requests.Session.get', return_value=MockResponse({}, 429, "TOO_MANY_REQUESTS"))
 def test_check_domain_too_many_requests(mock_get, domain_checker):
-    assert domain_checker.check_domain('TestName.com') is False
+    assert domain_checker.check_domain('TestName.com') is None
+    assert domain_checker.failures == {'TestName.com': 'retries exhausted'}
     assert mock_get.call_count == 3
 
-@patch('requests.get', return_value=MockResponse({"available": True}, 200, ""))
-def test_check_domains():
-    pass
\ No newline at end of file
+@pytest.mark.parametrize('max_workers', [1, 4, 16])
+def test_check_preserves_input_order(env_type, max_workers):
+    host_names = [f"Name{i}" for i in range(20)]
+    domain_checker = DomainChecker(
+        host_names=host_names,
+        env_type=env_type,
+        max_workers=max_workers,
+        test_mode=True
+    )
+
+    def _mock_get(url, headers):
+        time.sleep(random.random() / 100)
+        index = int(re.search(r"Name(\d+)\.com", url).group(1))
+        return MockResponse({"available": index % 2 == 0}, 200, "")
+
+    bulk_errors = MockResponse({"domains": [], "errors": []}, 203, "")
+    with patch('requests.Session.post', return_value=bulk_errors), \
+            patch('requests.Session.get', side_effect=_mock_get):
+        results = domain_checker.check()
+    assert [result["name"] for result in results] == host_names
+    assert [result[f"{name}.com"] for name, result in zip(host_names, results)] == [
+        i % 2 == 0 for i in range(20)
+    ]
+
+def _bulk_response(domains, errored=()):
+    return MockResponse({
+        "domains": [
+            {"domain": domain.lower(), "available": i % 2 == 0}
+            for i, domain in enumerate(domains) if domain not in errored
+        ],
+        "errors": [
+            {"domain": domain, "code": "UNSUPPORTED_TLD", "message": "error"}
+            for domain in errored
+        ]
+    }, 203 if errored else 200, "")
+
+def _post_bulk(*args, json, **kwargs):
+    return _bulk_response(json)
+
+def test_check_domains_bulk(domain_checker):
+    domains = ['TestName.com', 'FakeHost.com']
+    with patch('requests.Session.post', return_value=_bulk_response(domains)) as mock_post:
+        assert domain_checker.check_domains_bulk(domains) == {
+            'TestName.com': True,
+            'FakeHost.com': False
+        }
+    mock_post.assert_called_once()
+    assert mock_post.call_args.kwargs['json'] == domains
+
+def test_check_domains_bulk_omits_errors(domain_checker):
+    domains = ['TestName.com', 'FakeHost.com']
+    response = _bulk_response(domains, errored=['FakeHost.com'])
+    with patch('requests.Session.post', return_value=response):
+        assert domain_checker.check_domains_bulk(domains) == {'TestName.com': True}
+
+@patch('requests.Session.post', return_value=MockResponse({}, 429, "TOO_MANY_REQUESTS"))
+def test_check_domains_bulk_too_many_requests(mock_post, domain_checker):
+    assert domain_checker.check_domains_bulk(['TestName.com']) == {'TestName.com': None}
+    assert mock_post.call_count == 3
+    assert domain_checker.failures == {'TestName.com': 'retries exhausted'}
+
+@patch('requests.Session.post', return_value=MockResponse({}, 503, "ERROR"))
+def test_failed_bulk_request_is_not_checked_one_by_one(mock_post, env_type):
+    domain_checker = DomainChecker(
+        host_names=['TestName', 'FakeHost'], env_type=env_type, test_mode=True
+    )
+    with patch('requests.Session.get') as mock_get:
+        assert domain_checker.check() == [
+            {"name": "TestName", "TestName.com": None, "reason": "HTTP 503"},
+            {"name": "FakeHost", "FakeHost.com": None, "reason": "HTTP 503"}
+        ]
+    mock_get.assert_not_called()
+
+def test_check_chunks_bulk_requests(env_type):
+    host_names = [f"Name{i}" for i in range(7)]
+    domain_checker = DomainChecker(host_names=host_names, env_type=env_type, test_mode=True)
+    domain_checker.cfg.godaddy_bulk_limit = 3
+
+    with patch('requests.Session.post', side_effect=_post_bulk) as mock_post, \
+            patch('requests.Session.get') as mock_get:
+        results = domain_checker.check()
+    assert [len(call.kwargs['json']) for call in mock_post.call_args_list] == [3, 3, 1]
+    mock_get.assert_not_called()
+    assert [result["name"] for result in results] == host_names
+
+def test_check_falls_back_for_bulk_errors(env_type):
+    domain_checker = DomainChecker(
+        host_names=['TestName', 'FakeHost'],
+        env_type=env_type,
+        test_mode=True
+    )
+    response = _bulk_response(domain_checker.domains, errored=['FakeHost.com'])
+    with patch('requests.Session.post', return_value=response), \
+            patch('requests.Session.get',
+                  return_value=MockResponse({"available": True}, 200, "")) as mock_get:
+        results = domain_checker.check()
+    mock_get.assert_called_once()
+    assert "FakeHost.com" in mock_get.call_args.args[0]
+    assert results == [
+        {"name": "TestName", "TestName.com": True},
+        {"name": "FakeHost", "FakeHost.com": True}
+    ]
+
+def test_check_domain_honors_retry_after(domain_checker):
+    responses = [
+        MockResponse({}, 429, "TOO_MANY_REQUESTS", headers={'Retry-After': '12'}),
+        MockResponse({"available": True}, 200, "")
+    ]
+    with patch('requests.Session.get', side_effect=responses), \
+            patch.object(domain_checker.rate_limiter, 'backoff',
+                         wraps=domain_checker.rate_limiter.backoff) as mock_backoff:
+        assert domain_checker.check_domain('TestName.com') is True
+    assert mock_backoff.call_args.args[1] == {'Retry-After': '12'}
+
+def test_check_uses_cache(env_type, tmp_path):
+    cache = ResultCache(tmp_path / 'cache.sqlite3', ttls={'GoDaddy': (60, 60)})
+    cache.set('GoDaddy', 'TestName.com', False)
+    domain_checker = DomainChecker(
+        host_names=['TestName', 'FakeHost'],
+        env_type=env_type,
+        test_mode=True,
+        cache=cache
+    )
+    with patch('requests.Session.post', side_effect=_post_bulk) as mock_post:
+        results = domain_checker.check()
+    assert mock_post.call_args.kwargs['json'] == ['FakeHost.com']
+    assert results == [
+        {"name": "TestName", "TestName.com": False},
+        {"name": "FakeHost", "FakeHost.com": True}
+    ]
+    assert cache.get('GoDaddy', 'FakeHost.com') is True
+    cache.close()
+
+def test_check_does_not_cache_failures(env_type, tmp_path):
+    cache = ResultCache(tmp_path / 'cache.sqlite3', ttls={'GoDaddy': (60, 60)})
+    domain_checker = DomainChecker(
+        host_names=['TestName'],
+        env_type=env_type,
+        test_mode=True,
+        cache=cache
+    )
+    with patch('requests.Session.post', return_value=MockResponse({}, 500, "ERROR")), \
+            patch('requests.Session.get', return_value=MockResponse({}, 500, "ERROR")):
+        assert domain_checker.check() == [
+            {"name": "TestName", "TestName.com": None, "reason": "HTTP 500"}
+        ]
+    assert domain_checker.failures == {'TestName.com': 'HTTP 500'}
+    assert cache.get('GoDaddy', 'TestName.com') is None
+    cache.close()
+
+def test_open_circuit_skips_requests(env_type, config_helper):
+    circuit_breaker = CircuitBreaker('GoDaddy', min_requests=1, open_seconds=60)
+    circuit_breaker.record_failure()
+    domain_checker = DomainChecker(
+        host_names=['TestName'],
+        env_type=env_type,
+        config_helper=config_helper,
+        circuit_breaker=circuit_breaker
+    )
+    with patch('requests.Session.post') as mock_post, patch('requests.Session.get') as mock_get:
+        assert domain_checker.check() == [
+            {"name": "TestName", "TestName.com": None, "reason": "circuit open"}
+        ]
+    mock_post.assert_not_called()
+    mock_get.assert_not_called()
+    assert domain_checker.failures == {'TestName.com': 'circuit open'}
+
+def test_server_errors_open_circuit(env_type, config_helper):
+    circuit_breaker = CircuitBreaker('GoDaddy', window=2, min_requests=2, open_seconds=60)
+    domain_checker = DomainChecker(
+        host_names=['TestName', 'OtherName'],
+        env_type=env_type,
+        config_helper=config_helper,
+        max_workers=1,
+        circuit_breaker=circuit_breaker
+    )
+    response = _bulk_response(domain_checker.domains, errored=domain_checker.domains)
+    with patch('requests.Session.post', return_value=response), \
+            patch('requests.Session.get', return_value=MockResponse({}, 503, "ERROR")) as mock_get:
+        domain_checker.check()
+    assert circuit_breaker.state is CircuitState.OPEN
+    assert mock_get.call_count == 1
+    assert domain_checker.failures['OtherName.com'] == 'circuit open'
+
+def test_bulk_request_errors_are_unknown(env_type, config_helper):
+    domain_checker = DomainChecker(
+        host_names=['TestName'],
+        env_type=env_type,
+        config_helper=config_helper
+    )
+    with patch('requests.Session.post',
+               side_effect=ConnectionError("connection refused")) as mock_post, \
+            patch('requests.Session.get') as mock_get:
+        assert domain_checker.check() == [
+            {"name": "TestName", "TestName.com": None, "reason": "connection refused"}
+        ]
+    mock_post.assert_called_once()
+    mock_get.assert_not_called()
+
+def test_request_errors_are_unknown(env_type, config_helper):
+    domain_checker = DomainChecker(
+        host_names=['TestName'],
+        env_type=env_type,
+        config_helper=config_helper
+    )
+    response = _bulk_response(domain_checker.domains, errored=domain_checker.domains)
+    with patch('requests.Session.post', return_value=response), \
+            patch('requests.Session.get',
+                  side_effect=ConnectionError("connection refused")) as mock_get:
+        assert domain_checker.check() == [
+            {"name": "TestName", "TestName.com": None, "reason": "connection refused"}
+        ]
+    mock_get.assert_called_once()
+
+def test_request_errors_open_circuit(env_type, config_helper):
+    circuit_breaker = CircuitBreaker('GoDaddy', window=2, min_requests=2, open_seconds=60)
+    domain_checker = DomainChecker(
+        host_names=['TestName', 'OtherName'],
+        env_type=env_type,
+        config_helper=config_helper,
+        max_workers=1,
+        circuit_breaker=circuit_breaker
+    )
+    response = _bulk_response(domain_checker.domains, errored=domain_checker.domains)
+    with patch('requests.Session.post', return_value=response), \
+            patch('requests.Session.get',
+                  side_effect=ConnectionError("connection refused")) as mock_get:
+        domain_checker.check()
+    assert circuit_breaker.state is CircuitState.OPEN
+    assert mock_get.call_count == 1
+    assert domain_checker.failures['OtherName.com'] == 'circuit open'
+
+def test_throttled_probe_does_not_stick_half_open(env_type, config_helper):
+    clock = SimulatedClock()
+    circuit_breaker = CircuitBreaker('GoDaddy', min_requests=1, open_seconds=60,
+                                     sleep=clock.sleep, clock=clock)
+    circuit_breaker.record_failure()
+    clock.sleep(60)
+    domain_checker = DomainChecker(
+        host_names=['TestName'],
+        env_type=env_type,
+        config_helper=config_helper,
+        circuit_breaker=circuit_breaker
+    )
+    responses = [
+        MockResponse({}, 429, "", {'Retry-After': '0'}),
+        MockResponse({'available': True}, 200, "")
+    ]
+    with patch('requests.Session.get', side_effect=responses):
+        assert domain_checker.check_domain('TestName.com') is True
+    assert circuit_breaker.state is CircuitState.CLOSED
+
+def test_prescreen_without_resolver(domain_checker):
+    assert domain_checker.prescreen(domain_checker.domains) == []
+
+def test_check_skips_registered_domains(env_type, tmp_path):
+    cache = ResultCache(tmp_path / 'cache.sqlite3', ttls={'GoDaddy': (60, 60)})
+    resolver = StaticResolver(['testname.com'])
+    domain_checker = DomainChecker(
+        host_names=['TestName', 'FakeHost'],
+        env_type=env_type,
+        test_mode=True,
+        cache=cache,
+        resolver=resolver
+    )
+    with patch('requests.Session.post', side_effect=_post_bulk) as mock_post:
+        results = domain_checker.check()
+    assert sorted(resolver.lookups) == ['FakeHost.com', 'TestName.com']
+    assert mock_post.call_args.kwargs['json'] == ['FakeHost.com']
+    assert results == [
+        {"name": "TestName", "TestName.com": False},
+        {"name": "FakeHost", "FakeHost.com": True}
+    ]
+    assert cache.get('GoDaddy', 'TestName.com') is False
+    cache.close()
+
+def test_check_all_registered_skips_godaddy(env_type):
+    domain_checker = DomainChecker(
+        host_names=['TestName'],
+        env_type=env_type,
+        test_mode=True,
+        resolver=StaticResolver(['TestName.com'])
+    )
+    with patch('requests.Session.post') as mock_post, patch('requests.Session.get') as mock_get:
+        assert domain_checker.check() == [{"name": "TestName", "TestName.com": False}]
+    mock_post.assert_not_called()
+    mock_get.assert_not_called()
+
+def test_check_groups_bulk_requests_by_ending(env_type):
+    domain_checker = DomainChecker(
+        host_names=['TestName', 'FakeHost'],
+        env_type=env_type,
+        endings=['io', 'com'],
+        test_mode=True
+    )
+    with patch('requests.Session.post', side_effect=_post_bulk) as mock_post:
+        results = domain_checker.check()
+    assert [call.kwargs['json'] for call in mock_post.call_args_list] == [
+        ['TestName.com', 'FakeHost.com'],
+        ['TestName.io', 'FakeHost.io']
+    ]
+    assert [list(result)[1] for result in results] == [
+        'TestName.io', 'TestName.com', 'FakeHost.io', 'FakeHost.com'
+    ]
+
+def test_check_short_circuit_skips_taken_primary(env_type):
+    domain_checker = DomainChecker(
+        host_names=['TestName', 'FakeHost'],
+        env_type=env_type,
+        endings=['com', 'io'],
+        test_mode=True,
+        short_circuit=True
+    )
+    with patch('requests.Session.post', side_effect=_post_bulk) as mock_post:
+        results = domain_checker.check()
+    assert mock_post.call_args.kwargs['json'] == ['TestName.io']
+    assert results == [
+        {"name": "TestName", "TestName.com": True},
+        {"name": "TestName", "TestName.io": True},
+        {"name": "FakeHost", "FakeHost.com": False}
+    ]
+
+def test_check_short_circuit_ignores_failures(env_type):
+    domain_checker = DomainChecker(
+        host_names=['TestName'],
+        env_type=env_type,
+        endings=['com', 'io'],
+        test_mode=True,
+        short_circuit=True
+    )
+    with patch('requests.Session.post',
+               return_value=MockResponse({}, 500, "ERROR")) as mock_post, \
+            patch('requests.Session.get') as mock_get:
+        results = domain_checker.check()
+    assert len(results) == 2
+    assert mock_post.call_count == 2
+    mock_get.assert_not_called()
+
+@patch('requests.Session.get', return_value=MockResponse({"available": True}, 200, ""))
+def test_check_domains(mock_get, domain_checker):
+    assert domain_checker.check_domains(['TestName.com', 'FakeHost.com']) == [True, True]
+    assert mock_get.call_count == 2
\ No newline at end of file
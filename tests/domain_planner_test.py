@@ -0,0 +1,40 @@
+import pytest
+
+from src.domain_planner import DomainPlanner
+
+
+def _never_taken(domain):
+    return False
+
+
+@pytest.mark.parametrize('endings, primary_ending, expected', [
+    (['io', 'com', 'dev'], 'com', ['com', 'io', 'dev']),
+    (['io', 'dev'], 'com', ['io', 'dev']),
+    (['io', 'io', 'com'], None, ['io', 'com'])
+])
+def test_ordered_endings(endings, primary_ending, expected):
+    assert DomainPlanner(endings, primary_ending).ordered_endings() == expected
+
+def test_plan_groups_by_ending():
+    planner = DomainPlanner(['io', 'com'], primary_ending='com')
+    assert list(planner.plan(['RedOak', 'RedFox'], _never_taken)) == [
+        ('com', ['RedOak.com', 'RedFox.com']),
+        ('io', ['RedOak.io', 'RedFox.io'])
+    ]
+
+def test_plan_short_circuit():
+    planner = DomainPlanner(['com', 'io', 'dev'], primary_ending='com', short_circuit=True)
+    groups = list(planner.plan(['RedOak', 'RedFox'], lambda domain: domain == 'RedOak.com'))
+    assert groups == [
+        ('com', ['RedOak.com', 'RedFox.com']),
+        ('io', ['RedFox.io']),
+        ('dev', ['RedFox.dev'])
+    ]
+
+def test_plan_short_circuit_without_primary():
+    planner = DomainPlanner(['io', 'dev'], primary_ending='com', short_circuit=True)
+    assert planner.short_circuit is False
+    assert [domains for _, domains in planner.plan(['RedOak'], lambda domain: True)] == [
+        ['RedOak.io'],
+        ['RedOak.dev']
+    ]
@@ -0,0 +1,219 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.github_checker import GitHubChecker
+from src.utils.circuit_breaker import CircuitBreaker, CircuitState
+from src.utils.rate_limiter import SimulatedClock
+from src.utils.result_cache import ResultCache
+from tests.domain_checker_test import MockResponse
+
+
+def test_github_checker_init_usernames(github_checker):
+    assert github_checker.usernames == ['TestName']
+
+def test_github_checker_shared_session(config_helper):
+    session = MagicMock()
+    github_checker = GitHubChecker(['TestName'], config_helper, session=session)
+    assert github_checker.session is session
+
+@pytest.mark.parametrize('status_code, expected', [
+    (404, True),
+    (200, False),
+    (500, None)
+])
+def test_check_username(github_checker, status_code, expected):
+    with patch('requests.Session.get', return_value=MockResponse({}, status_code, "")) as mock_get:
+        assert github_checker.check_username('TestName') is expected
+    mock_get.assert_called_once()
+
+@pytest.mark.parametrize('status_code, headers', [
+    (429, {}),
+    (403, {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '0'}),
+    (403, {'Retry-After': '60'})
+])
+def test_check_username_rate_limited(github_checker, status_code, headers):
+    response = MockResponse({}, status_code, "", headers)
+    with patch('requests.Session.get', return_value=response) as mock_get:
+        assert github_checker.check_username('TestName') is None
+    assert mock_get.call_count == github_checker.cfg.github_max_retries
+    assert github_checker.failures == {'TestName': 'retries exhausted'}
+
+def test_check_username_retries_after_rate_limit(github_checker):
+    responses = [MockResponse({}, 429, ""), MockResponse({}, 404, "")]
+    with patch('requests.Session.get', side_effect=responses) as mock_get:
+        assert github_checker.check_username('TestName') is True
+    assert mock_get.call_count == 2
+
+def test_check_username_forbidden_not_rate_limited(github_checker):
+    response = MockResponse({}, 403, "", {'X-RateLimit-Remaining': '12'})
+    with patch('requests.Session.get', return_value=response) as mock_get:
+        assert github_checker.check_username('TestName') is None
+    mock_get.assert_called_once()
+
+@patch('requests.Session.get', side_effect=ConnectionError("connection reset"))
+def test_check_username_exception(mock_get, github_checker):
+    assert github_checker.check_username('TestName') is None
+    assert github_checker.failures == {'TestName': 'connection reset'}
+
+@patch('requests.Session.get', return_value=MockResponse({}, 404, ""))
+def test_check(mock_get, github_checker):
+    github_checker.use_graphql = False
+    assert github_checker.check() == [{'name': 'TestName', 'GitHub': True}]
+
+def test_check_uses_cache(config_helper, tmp_path):
+    cache = ResultCache(tmp_path / 'cache.sqlite3', ttls={'GitHub': (60, 60)})
+    cache.set('GitHub', 'TestName', False)
+    github_checker = GitHubChecker(['TestName', 'FakeUser'], config_helper,
+                                   cache=cache, use_graphql=False)
+    with patch('requests.Session.get', return_value=MockResponse({}, 404, "")) as mock_get:
+        assert github_checker.check() == [
+            {'name': 'TestName', 'GitHub': False},
+            {'name': 'FakeUser', 'GitHub': True}
+        ]
+    mock_get.assert_called_once()
+    assert cache.get('GitHub', 'FakeUser') is True
+    cache.close()
+
+def test_open_circuit_skips_requests(config_helper):
+    circuit_breaker = CircuitBreaker('GitHub', min_requests=1, open_seconds=60)
+    circuit_breaker.record_failure()
+    github_checker = GitHubChecker(['TestName'], config_helper, circuit_breaker=circuit_breaker)
+    with patch('requests.Session.post') as mock_post, patch('requests.Session.get') as mock_get:
+        assert github_checker.check() == [
+            {'name': 'TestName', 'GitHub': None, 'reason': 'circuit open'}
+        ]
+    mock_post.assert_not_called()
+    mock_get.assert_not_called()
+    assert github_checker.failures == {'TestName': 'circuit open'}
+
+def test_request_errors_open_circuit(config_helper):
+    circuit_breaker = CircuitBreaker('GitHub', window=2, min_requests=2, open_seconds=60)
+    github_checker = GitHubChecker(['TestName', 'OtherName', 'ThirdName'], config_helper,
+                                   use_graphql=False, circuit_breaker=circuit_breaker)
+    with patch('requests.Session.get', side_effect=ConnectionError('refused')) as mock_get:
+        github_checker.check()
+    assert mock_get.call_count == 2
+    assert github_checker.failures['ThirdName'] == 'circuit open'
+
+def test_rate_limits_do_not_open_circuit(config_helper):
+    circuit_breaker = CircuitBreaker('GitHub', window=2, min_requests=2, open_seconds=60)
+    github_checker = GitHubChecker(['TestName'], config_helper, circuit_breaker=circuit_breaker)
+    response = MockResponse({}, 429, "", {'Retry-After': '0'})
+    with patch('requests.Session.get', return_value=response):
+        github_checker.check_username('TestName')
+    assert circuit_breaker.state is CircuitState.CLOSED
+
+def test_rate_limited_probe_does_not_stick_half_open(config_helper):
+    clock = SimulatedClock()
+    circuit_breaker = CircuitBreaker('GitHub', min_requests=1, open_seconds=60,
+                                     sleep=clock.sleep, clock=clock)
+    circuit_breaker.record_failure()
+    clock.sleep(60)
+    github_checker = GitHubChecker(['TestName'], config_helper, use_graphql=False,
+                                   circuit_breaker=circuit_breaker)
+    responses = [
+        MockResponse({}, 403, "", {'X-RateLimit-Remaining': '0'}),
+        MockResponse({}, 404, "")
+    ]
+    with patch('requests.Session.get', side_effect=responses):
+        assert github_checker.check_username('TestName') is True
+    assert circuit_breaker.state is CircuitState.CLOSED
+
+@patch('requests.Session.get', return_value=MockResponse({}, 500, "ERROR"))
+def test_check_does_not_cache_failures(mock_get, config_helper, tmp_path):
+    cache = ResultCache(tmp_path / 'cache.sqlite3', ttls={'GitHub': (60, 60)})
+    github_checker = GitHubChecker(['TestName'], config_helper, cache=cache, use_graphql=False)
+    github_checker.check()
+    assert github_checker.failures == {'TestName': 'HTTP 500'}
+    assert cache.get('GitHub', 'TestName') is None
+    cache.close()
+
+
+# testing GraphQL batch lookups
+def _graphql_body(taken, errors=None):
+    data = {}
+    for i, login in enumerate(taken):
+        data[f"u{i}"] = {'login': login} if login else None
+        data[f"o{i}"] = None
+    return {'data': data, 'errors': errors or []}
+
+def test_build_graphql_query():
+    query = GitHubChecker.build_graphql_query(['TestName', 'FakeUser'])
+    assert query['variables'] == {'l0': 'TestName', 'l1': 'FakeUser'}
+    assert query['query'].startswith('query($l0: String!, $l1: String!)')
+    assert 'u1: user(login: $l1)' in query['query']
+    assert 'o1: organization(login: $l1)' in query['query']
+
+def test_parse_graphql_response():
+    body = _graphql_body(['TestName', None], errors=[
+        {'type': 'NOT_FOUND', 'path': ['u1']},
+        {'type': 'NOT_FOUND', 'path': ['o1']},
+        {'type': 'NOT_FOUND', 'path': ['o0']}
+    ])
+    assert GitHubChecker.parse_graphql_response(['TestName', 'FakeUser'], body) == {
+        'TestName': False,
+        'FakeUser': True
+    }
+
+def test_parse_graphql_response_taken_by_organization():
+    body = {'data': {'u0': None, 'o0': {'login': 'TestOrg'}}}
+    assert GitHubChecker.parse_graphql_response(['TestOrg'], body) == {'TestOrg': False}
+
+def test_parse_graphql_response_skips_unexpected_errors():
+    body = _graphql_body([None, None], errors=[{'type': 'INTERNAL', 'path': ['u0']}])
+    availability = GitHubChecker.parse_graphql_response(['TestName', 'FakeUser'], body)
+    assert availability == {'FakeUser': True}
+
+def test_parse_graphql_response_query_error():
+    body = {'errors': [{'message': 'Parse error'}]}
+    assert GitHubChecker.parse_graphql_response(['TestName'], body) == {}
+
+def test_check_usernames_graphql(github_checker):
+    response = MockResponse(_graphql_body(['TestName']), 200, "")
+    with patch('requests.Session.post', return_value=response) as mock_post:
+        assert github_checker.check_usernames_graphql(['TestName']) == {'TestName': False}
+    mock_post.assert_called_once()
+    assert mock_post.call_args.kwargs['url'] == github_checker.cfg.github_graphql_url
+    assert mock_post.call_args.kwargs['headers']['Authorization'].startswith('bearer ')
+
+def test_check_usernames_graphql_rate_limited(github_checker):
+    responses = [
+        MockResponse({}, 403, "", {'X-RateLimit-Remaining': '0'}),
+        MockResponse(_graphql_body([None]), 200, "")
+    ]
+    with patch('requests.Session.post', side_effect=responses) as mock_post:
+        assert github_checker.check_usernames_graphql(['TestName']) == {'TestName': True}
+    assert mock_post.call_count == 2
+
+def test_check_usernames_graphql_error(github_checker):
+    with patch('requests.Session.post', return_value=MockResponse({}, 502, "ERROR")):
+        assert github_checker.check_usernames_graphql(['TestName']) == {}
+
+def test_check_graphql_batches(config_helper):
+    config_helper.github_graphql_batch_size = 2
+    github_checker = GitHubChecker(['TestName', 'FakeUser', 'OtherUser'], config_helper)
+    responses = [
+        MockResponse(_graphql_body(['TestName', None]), 200, ""),
+        MockResponse(_graphql_body([None]), 200, "")
+    ]
+    with patch('requests.Session.post', side_effect=responses) as mock_post, \
+            patch('requests.Session.get') as mock_get:
+        assert github_checker.check() == [
+            {'name': 'TestName', 'GitHub': False},
+            {'name': 'FakeUser', 'GitHub': True},
+            {'name': 'OtherUser', 'GitHub': True}
+        ]
+    assert mock_post.call_count == 2
+    mock_get.assert_not_called()
+
+def test_check_graphql_falls_back_to_rest(config_helper):
+    github_checker = GitHubChecker(['TestName', 'FakeUser'], config_helper)
+    body = _graphql_body([None, None], errors=[{'type': 'INTERNAL', 'path': ['u1']}])
+    with patch('requests.Session.post', return_value=MockResponse(body, 200, "")), \
+            patch('requests.Session.get', return_value=MockResponse({}, 200, "")) as mock_get:
+        assert github_checker.check() == [
+            {'name': 'TestName', 'GitHub': True},
+            {'name': 'FakeUser', 'GitHub': False}
+        ]
+    mock_get.assert_called_once()
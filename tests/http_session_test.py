@@ -0,0 +1,33 @@
+import pytest
+import requests
+
+from src.utils.http_session import create_session, session_from_config
+
+
+@pytest.fixture
+def session():
+    session = create_session(pool_connections=2, pool_maxsize=8)
+    yield session
+    session.close()
+
+
+def test_create_session_type(session):
+    assert isinstance(session, requests.Session)
+
+@pytest.mark.parametrize('prefix', ['https://', 'http://'])
+def test_create_session_adapter_pool_sizes(session, prefix):
+    adapter = session.get_adapter(f"{prefix}api.github.com")
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 8
+    assert adapter._pool_block is True
+
+def test_create_session_shared_adapter(session):
+    adapter = session.get_adapter('https://api.godaddy.com')
+    assert adapter is session.get_adapter('https://api.github.com')
+
+def test_session_from_config(config_helper):
+    session = session_from_config(config_helper)
+    adapter = session.get_adapter('https://api.godaddy.com')
+    assert adapter._pool_connections == config_helper.pool_connections
+    assert adapter._pool_maxsize == config_helper.pool_maxsize
+    session.close()
@@ -0,0 +1,128 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.metrics import MetricsRegistry, configure_metrics, metrics
+from src.utils.result_cache import ResultCache
+from tests.domain_checker_test import MockResponse
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry(enabled=True, buckets=(0.1, 1.0))
+
+@pytest.fixture
+def shared_metrics():
+    metrics.enabled = True
+    metrics.reset()
+    yield metrics
+    metrics.enabled = False
+    metrics.reset()
+
+
+# testing counters and histograms
+def test_inc(registry):
+    registry.inc('requests_total', provider='GitHub', status=200)
+    registry.inc('requests_total', 2, provider='GitHub', status=200)
+    registry.inc('requests_total', provider='GitHub', status=404)
+    assert registry.get_counter('requests_total', provider='GitHub', status=200) == 3
+    assert registry.get_counter('requests_total', status=404, provider='GitHub') == 1
+
+def test_disabled_registry_records_nothing():
+    registry = MetricsRegistry(enabled=False)
+    registry.inc('requests_total')
+    registry.observe('request_seconds', 0.5)
+    with registry.timer('request_seconds'):
+        pass
+    assert registry.snapshot()['counters'] == {}
+    assert registry.snapshot()['histograms'] == {}
+
+def test_observe_buckets(registry):
+    for value in (0.05, 0.5, 5.0):
+        registry.observe('request_seconds', value, provider='GoDaddy')
+    histogram = registry.snapshot()['histograms']['request_seconds'][0]
+    assert histogram['labels'] == {'provider': 'GoDaddy'}
+    assert histogram['count'] == 3
+    assert histogram['sum'] == pytest.approx(5.55)
+    assert histogram['buckets'] == {'0.1': 1, '1.0': 2, '+Inf': 3}
+
+def test_timer(registry):
+    with registry.timer('batch_seconds'):
+        pass
+    assert registry.snapshot()['histograms']['batch_seconds'][0]['count'] == 1
+
+def test_reset(registry):
+    registry.inc('requests_total')
+    registry.reset()
+    assert registry.get_counter('requests_total') == 0
+
+
+# testing exports
+def test_to_prometheus(registry):
+    registry.inc('requests_total', provider='GitHub', status=404)
+    registry.observe('request_seconds', 0.5, provider='GitHub')
+    text = registry.to_prometheus()
+    assert '# TYPE namechecker_requests_total counter' in text
+    assert 'namechecker_requests_total{provider="GitHub",status="404"} 1' in text
+    assert '# TYPE namechecker_request_seconds histogram' in text
+    assert 'namechecker_request_seconds_bucket{provider="GitHub",le="0.1"} 0' in text
+    assert 'namechecker_request_seconds_bucket{provider="GitHub",le="+Inf"} 1' in text
+    assert 'namechecker_request_seconds_count{provider="GitHub"} 1' in text
+
+def test_to_prometheus_escapes_labels(registry):
+    registry.inc('errors_total', reason='bad "quote"')
+    assert 'reason="bad \\"quote\\""' in registry.to_prometheus()
+
+@pytest.mark.parametrize('filename', ['metrics.json', 'metrics.prom'])
+def test_write(registry, tmp_path, filename):
+    registry.inc('requests_total')
+    registry.write(tmp_path / filename)
+    content = (tmp_path / filename).read_text()
+    if filename.endswith('.json'):
+        assert json.loads(content)['counters']['requests_total'][0]['value'] == 1
+    else:
+        assert 'namechecker_requests_total 1' in content
+
+
+# testing the shared registry
+def test_configure_metrics_disabled(config_helper):
+    assert configure_metrics(config_helper) is None
+    assert metrics.enabled is False
+
+def test_configure_metrics_enabled(config_helper):
+    config_helper.metrics_enabled = True
+    metrics_path = config_helper.output_dir / config_helper.metrics_filename
+    assert configure_metrics(config_helper) == metrics_path
+    assert metrics.enabled is True
+    metrics.enabled = False
+
+def test_checker_instrumentation(shared_metrics, domain_checker):
+    responses = [MockResponse({}, 429, ""), MockResponse({"available": True}, 200, "")]
+    with patch('requests.Session.get', side_effect=responses):
+        domain_checker.check_domain('TestName.com')
+    for status in (429, 200):
+        assert shared_metrics.get_counter('requests_total', provider='GoDaddy',
+                                          endpoint='available', status=status) == 1
+    assert shared_metrics.get_counter('rate_limited_total', provider='GoDaddy') == 1
+    histogram = shared_metrics.snapshot()['histograms']['request_seconds'][0]
+    assert histogram['count'] == 2
+
+def test_cache_hit_rate(shared_metrics, tmp_path):
+    cache = ResultCache(tmp_path / 'cache.sqlite3', ttls={'GitHub': (60, 60)})
+    cache.set('GitHub', 'TestName', True)
+    cache.get_many('GitHub', ['TestName', 'FakeUser'])
+    assert shared_metrics.get_counter('cache_hits_total', provider='GitHub') == 1
+    assert shared_metrics.get_counter('cache_misses_total', provider='GitHub') == 1
+    cache.close()
+
+def test_name_checker_write_metrics(name_checker, shared_metrics, tmp_path):
+    name_checker.metrics_path = tmp_path / 'metrics.json'
+    with patch('src.name_checker.DomainChecker.check', lambda checker: []), \
+            patch('src.name_checker.GitHubChecker.check', lambda checker: []):
+        name_checker.process_batch(['RedOak'])
+    name_checker.write_metrics()
+    snapshot = json.loads((tmp_path / 'metrics.json').read_text())
+    assert snapshot['counters']['batches_total'][0]['value'] == 1
+    providers = {item['labels']['provider'] for item in snapshot['histograms']['stage_seconds']}
+    assert providers == {'GoDaddy', 'GitHub'}
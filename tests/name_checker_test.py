@@ -0,0 +1,697 @@
+import json
+import threading
+import types
+from unittest.mock import patch
+
+import pytest
+
+from src.name_checker import NameChecker
+from src.name_filter import NameFilter, allowed_chars_rule, max_length_rule
+from src.name_scorer import NameScorer, length_heuristic
+from src.result_table import ResultTable
+from src.utils.checkpoint import Checkpoint, CheckpointMismatchError
+from src.utils.results_store import ResultsStore
+
+# names rejected by tests/cfg/blocklist.txt
+BLOCKLISTED = ['BlueFox']
+
+
+def test_name_checker_init_test_mode(name_checker):
+    assert name_checker.cfg.test_mode == True
+
+def test_name_checker_config_overrides(env_type):
+    name_checker = NameChecker(env_type=env_type, test_mode=True,
+                               config_overrides={'Batch': {'BATCH_SIZE': '4'}})
+    assert name_checker.batch_size == 4
+    assert name_checker.batch_count == 3
+
+def test_get_seed_items_deduplicates(name_checker):
+    assert name_checker.get_seed_items(1) == ['Oak', 'Fox', 'Star', 'Bud']
+
+def test_get_seed_items_ignores_case(name_checker):
+    name_checker.seeds = [{'seedPosition': 0, 'seedItems': ['Oak', 'Fox', 'OAK', 'oak']}]
+    assert name_checker.get_seed_items(0) == ['Oak', 'Fox']
+
+def test_get_seed_item_lists(name_checker):
+    assert name_checker.get_seed_item_lists() == [
+        ['Red', 'Blue', 'Gold'],
+        ['Oak', 'Fox', 'Star', 'Bud']
+    ]
+
+
+# testing lazy name generation
+def test_get_names_is_generator(name_checker):
+    assert isinstance(name_checker.get_names(), types.GeneratorType)
+
+def test_get_names_order(name_checker):
+    names = list(name_checker.get_names())
+    assert names[:4] == ['RedOak', 'RedFox', 'RedStar', 'RedBud']
+    assert names[-1] == 'GoldBud'
+
+def test_get_name_count(name_checker):
+    assert name_checker.name_count == 12
+    assert name_checker.name_count == len(list(name_checker.get_names()))
+
+def test_get_names_explicit_names(env_type):
+    name_checker = NameChecker(env_type=env_type, names=['Foo', 'Bar'], test_mode=True)
+    assert list(name_checker.get_names()) == ['Foo', 'Bar']
+    assert name_checker.name_count == 2
+
+
+# testing shards
+@pytest.mark.parametrize('shard_strategy', ['range', 'hash'])
+def test_shards_partition_names(env_type, name_checker, shard_strategy):
+    shards = [
+        NameChecker(env_type=env_type, test_mode=True, shard_index=index, shard_count=3,
+                    shard_strategy=shard_strategy)
+        for index in range(3)
+    ]
+    shard_names = [list(shard.get_names()) for shard in shards]
+    assert sorted(sum(shard_names, [])) == sorted(name_checker.get_names())
+    assert [shard.name_count for shard in shards] == [len(names) for names in shard_names]
+
+def test_range_shard_names(env_type):
+    name_checker = NameChecker(env_type=env_type, test_mode=True, shard_index=1, shard_count=3)
+    assert list(name_checker.get_names()) == ['BlueOak', 'BlueFox', 'BlueStar', 'BlueBud']
+    assert list(name_checker.get_names(start=2)) == ['BlueStar', 'BlueBud']
+
+def test_shard_output_files(env_type, config_helper):
+    name_checker = NameChecker(env_type=env_type, test_mode=True, shard_index=1, shard_count=2)
+    results_db = config_helper.results_db_filename.replace('.sqlite3', '.shard1of2.sqlite3')
+    assert name_checker.cfg.results_db_filename == results_db
+    checkpoint_filename = config_helper.checkpoint_filename.replace('.json', '.shard1of2.json')
+    assert name_checker.cfg.checkpoint_filename == checkpoint_filename
+    assert name_checker.results_store.filepath.name == results_db
+    name_checker.results_store.close()
+    name_checker.results_store.filepath.unlink()
+
+def test_shard_credentials_and_rate_limits(env_type, config_helper):
+    name_checker = NameChecker(env_type=env_type, test_mode=True, shard_index=2, shard_count=4)
+    assert name_checker.cfg.github_token == 'github_pat_TEST_token_shard_2'
+    assert name_checker.cfg.github_rate_limit == config_helper.github_rate_limit
+    assert name_checker.cfg.godaddy_api_key == config_helper.godaddy_api_key
+    assert name_checker.cfg.godaddy_rate_limit == config_helper.godaddy_rate_limit // 4
+
+def test_shard_fingerprint_differs(env_type, name_checker):
+    shard = NameChecker(env_type=env_type, test_mode=True, shard_index=0, shard_count=2)
+    assert shard.get_seeds_fingerprint() != name_checker.get_seeds_fingerprint()
+
+def test_shard_index_out_of_range(env_type):
+    with pytest.raises(ValueError):
+        NameChecker(env_type=env_type, test_mode=True, shard_index=2, shard_count=2)
+
+
+# testing batching
+def test_batch_count(name_checker):
+    assert name_checker.batch_count == 3
+
+def test_create_batches(name_checker):
+    batches = list(name_checker.create_batches())
+    assert [len(batch) for batch in batches] == [5, 4, 2]
+
+def test_create_batches_is_repeatable(name_checker):
+    assert list(name_checker.create_batches()) == list(name_checker.create_batches())
+
+@pytest.mark.parametrize('batch_limit, expected', [
+    (None, 3),
+    (0, 3),
+    (1, 1),
+    (2, 2),
+    (10, 3)
+])
+def test_create_batches_limit(env_type, batch_limit, expected):
+    name_checker = NameChecker(
+        env_type=env_type,
+        batch_size=5,
+        batch_limit=batch_limit,
+        test_mode=True
+    )
+    assert name_checker.batch_count == expected
+    assert len(list(name_checker.create_batches())) == expected
+
+def test_iter_batches(name_checker):
+    batches = name_checker.iter_batches(iter(['a', 'b', 'c']), 2)
+    assert list(batches) == [['a', 'b'], ['c']]
+
+
+# testing the name filter
+def test_default_name_filter(name_checker):
+    assert name_checker.name_filter is not None
+
+def test_create_batches_records_rejections(name_checker, results_store):
+    names = [name for batch in name_checker.create_batches() for name in batch]
+    assert 'BlueFox' not in names
+    assert results_store.get_rejection('BlueFox') == 'blocklisted: bluefox'
+    assert results_store.count_rejections() == 1
+
+def test_create_batches_custom_filter(env_type, tmp_path):
+    name_checker = NameChecker(
+        env_type=env_type,
+        names=['RedOak', 'Red Oak', 'R' * 40],
+        name_filter=NameFilter([max_length_rule(39), allowed_chars_rule()]),
+        test_mode=True
+    )
+    name_checker.results_store = ResultsStore(tmp_path / 'results.sqlite3')
+    assert list(name_checker.create_batches()) == [['RedOak']]
+    assert name_checker.results_store.get_rejection('Red Oak') == 'contains invalid characters'
+    assert name_checker.results_store.get_rejection('R' * 40) == 'longer than 39 characters'
+    name_checker.results_store.close()
+
+def test_create_batches_filter_disabled(env_type, tmp_path):
+    name_checker = NameChecker(env_type=env_type, batch_size=5, test_mode=True)
+    name_checker.name_filter = None
+    assert [len(batch) for batch in name_checker.create_batches()] == [5, 5, 2]
+
+
+# testing shared session
+def test_process_batch_shares_session(name_checker):
+    sessions = []
+
+    def _record_session(checker):
+        sessions.append((checker.session, checker.cfg))
+        return []
+
+    with patch('src.name_checker.DomainChecker.check', _record_session), \
+            patch('src.name_checker.GitHubChecker.check', _record_session):
+        name_checker.process_batch(['RedOak'])
+        name_checker.process_batch(['RedFox'])
+    assert all(session is name_checker.session for session, _ in sessions)
+    assert all(cfg is name_checker.cfg for _, cfg in sessions)
+
+
+def test_process_batch_checks_providers_concurrently(name_checker):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _wait_for_other_stage(checker):
+        barrier.wait()
+        return []
+
+    with patch('src.name_checker.DomainChecker.check', _wait_for_other_stage), \
+            patch('src.name_checker.GitHubChecker.check', _wait_for_other_stage):
+        name_checker.process_batch(['RedOak'])
+
+
+# testing checker plugins
+@pytest.fixture
+def plugin_name_checker(env_type):
+    return NameChecker(env_type=env_type, names=['RedOak', 'GoldFox'], test_mode=True,
+                       config_overrides={'Checkers': {'ENABLED': 'PyPI, npm'}})
+
+def test_enabled_checkers_add_stages(plugin_name_checker):
+    assert list(plugin_name_checker.get_stages()) == ['GoDaddy', 'GitHub', 'PyPI', 'npm']
+    assert set(plugin_name_checker.rate_limiters) == {'GoDaddy', 'GitHub', 'PyPI', 'npm'}
+    if plugin_name_checker.cache is not None:
+        assert plugin_name_checker.cache.ttls['npm'] == (3600, 604800)
+
+def test_unknown_checker_enabled(env_type):
+    with pytest.raises(ValueError):
+        NameChecker(env_type=env_type, test_mode=True,
+                    config_overrides={'Checkers': {'ENABLED': 'Snap'}})
+
+def test_process_batch_runs_checker_plugins(plugin_name_checker):
+    plugin_name_checker.providers = ['GitHub', 'PyPI']
+
+    def _check_pypi(checker, names):
+        assert checker.rate_limiter is plugin_name_checker.rate_limiters['PyPI']
+        return [{'name': name, 'PyPI': name.startswith('Gold')} for name in names]
+
+    with patch('src.name_checker.GitHubChecker.check', _check_github), \
+            patch('src.package_checkers.PyPIChecker.check', _check_pypi):
+        results = plugin_name_checker.process_batch(['RedOak', 'GoldFox'])
+    assert list(results.iter_rows()) == [
+        {'name': 'RedOak', 'GitHub': True, 'PyPI': False},
+        {'name': 'GoldFox', 'GitHub': True, 'PyPI': True}
+    ]
+
+
+# testing results storage
+@pytest.fixture
+def results_store(name_checker, tmp_path):
+    name_checker.results_store = ResultsStore(tmp_path / 'results.sqlite3')
+    yield name_checker.results_store
+    name_checker.results_store.close()
+
+def test_save_results(name_checker, results_store):
+    name_checker.save_results([
+        {'name': 'RedOak', 'RedOak.com': True},
+        {'name': 'RedOak', 'GitHub': False}
+    ])
+    name_checker.save_results([{'name': 'RedOak', 'GitHub': True}])
+    assert results_store.get('RedOak') == {'name': 'RedOak', 'RedOak.com': True, 'GitHub': True}
+
+def test_save_results_table(name_checker, results_store):
+    table = name_checker.aggregate_results(
+        [{'name': 'RedOak', 'RedOak.com': True}], [{'name': 'RedOak', 'GitHub': False}])
+    assert isinstance(table, ResultTable)
+    name_checker.save_results(table)
+    assert results_store.get('RedOak') == {'name': 'RedOak', 'RedOak.com': True, 'GitHub': False}
+
+def test_export_results(name_checker, results_store, tmp_path):
+    name_checker.cfg.output_dir = tmp_path
+    name_checker.save_results([{'name': 'RedOak', 'GitHub': True}])
+    name_checker.export_results()
+    with open(tmp_path / name_checker.cfg.results_filename) as f:
+        assert json.load(f) == [{'name': 'RedOak', 'GitHub': True}]
+
+@pytest.fixture
+def checkpoint(name_checker, tmp_path):
+    name_checker.cfg.output_dir = tmp_path
+    name_checker.checkpoint = Checkpoint(tmp_path / 'checkpoint.json')
+    return name_checker.checkpoint
+
+def _check_github(checker):
+    return [{'name': name, 'GitHub': True} for name in checker.usernames]
+
+def _run(name_checker, resume=False, checked=None):
+    def _record_github(checker):
+        if checked is not None:
+            checked.extend(checker.usernames)
+        return _check_github(checker)
+
+    with patch('src.name_checker.DomainChecker.check', lambda checker: []), \
+            patch('src.name_checker.GitHubChecker.check', _record_github):
+        name_checker.run(resume=resume)
+
+def test_iter_results_streams_batches(name_checker, results_store, checkpoint):
+    with patch('src.name_checker.DomainChecker.check', lambda checker: []), \
+            patch('src.name_checker.GitHubChecker.check', _check_github):
+        results = name_checker.iter_results()
+        first = next(results)
+        assert first.names == ['RedOak', 'RedFox', 'RedStar', 'RedBud', 'BlueOak']
+        assert checkpoint.load()['batch_index'] == 1
+        remaining = name_checker.name_count - 5 - len(BLOCKLISTED)
+        assert sum(len(batch.names) for batch in results) == remaining
+    assert checkpoint.load()['completed'] is True
+
+def test_stage_pauses_while_circuit_open(name_checker):
+    circuit_breaker = name_checker.circuit_breakers['GitHub']
+    for _ in range(name_checker.cfg.circuit_min_requests):
+        circuit_breaker.record_failure()
+    with patch('src.name_checker.GitHubChecker.check', _check_github):
+        results = name_checker.get_stages()['GitHub'](['RedOak'])
+    assert results == [{'name': 'RedOak', 'GitHub': True}]
+    assert circuit_breaker.retry_in() == 0
+
+def test_get_stages_providers(env_type):
+    name_checker = NameChecker(env_type=env_type, test_mode=True, providers=['GitHub'])
+    assert list(name_checker.get_stages()) == ['GitHub']
+    name_checker.providers = ['PyPI']
+    with pytest.raises(ValueError):
+        name_checker.get_stages()
+
+def test_run_saves_each_batch(name_checker, results_store, checkpoint):
+    with patch.object(name_checker, 'save_results', wraps=name_checker.save_results) as mock_save:
+        _run(name_checker)
+    assert mock_save.call_count == name_checker.batch_count
+    assert len(results_store) == name_checker.name_count - len(BLOCKLISTED)
+
+
+# testing case-insensitive deduplication
+def test_create_batches_dedupes_names(env_type, results_store):
+    names = ['RedOak', 'redoak', 'RedFox', 'REDOAK', 'RedFox']
+    name_checker = NameChecker(env_type=env_type, names=names, batch_size=2, test_mode=True)
+    name_checker.results_store = results_store
+    assert list(name_checker.create_batches()) == [['RedOak'], ['RedFox'], []]
+    assert results_store.get_aliases('RedOak') == ['redoak', 'REDOAK']
+
+def test_create_batches_dedupes_across_seed_combinations(env_type, tmp_path):
+    name_checker = NameChecker(env_type=env_type, batch_size=5, test_mode=True)
+    name_checker.results_store = ResultsStore(tmp_path / 'results.sqlite3')
+    name_checker.seeds = [{'seedPosition': 0, 'seedItems': ['Red', 'RedO']},
+                          {'seedPosition': 1, 'seedItems': ['Oak', 'ak']}]
+    assert list(name_checker.create_batches()) == [['RedOak', 'Redak', 'RedOOak']]
+
+def test_create_batches_resume_remembers_duplicates(env_type, results_store):
+    name_checker = NameChecker(env_type=env_type, names=['RedOak', 'RedFox', 'redoak'],
+                               batch_size=2, test_mode=True)
+    name_checker.results_store = results_store
+    assert list(name_checker.create_batches(1)) == [[]]
+    assert results_store.get_aliases('RedOak') == ['redoak']
+
+
+# testing checkpoint and resume
+def test_get_names_start(name_checker):
+    assert list(name_checker.get_names(10)) == ['GoldStar', 'GoldBud']
+
+def test_create_batches_start(name_checker):
+    assert list(name_checker.create_batches(2)) == [['GoldStar', 'GoldBud']]
+    assert list(name_checker.create_batches(3)) == []
+
+def test_seeds_fingerprint_stable(name_checker):
+    assert name_checker.get_seeds_fingerprint() == name_checker.get_seeds_fingerprint()
+
+def test_seeds_fingerprint_changes_with_names(env_type):
+    a = NameChecker(env_type=env_type, names=['Foo'], test_mode=True)
+    b = NameChecker(env_type=env_type, names=['Bar'], test_mode=True)
+    assert a.get_seeds_fingerprint() != b.get_seeds_fingerprint()
+
+def test_run_writes_checkpoint(name_checker, results_store, checkpoint):
+    _run(name_checker)
+    state = checkpoint.load()
+    assert state['batch_index'] == name_checker.batch_count
+    assert state['name_position'] == name_checker.name_count
+    assert state['results_saved'] == name_checker.name_count - len(BLOCKLISTED)
+    assert state['completed'] is True
+
+def test_run_resume_skips_completed_batches(name_checker, results_store, checkpoint):
+    name_checker.save_checkpoint(batch_index=2, results_saved=10)
+    checked = []
+    _run(name_checker, resume=True, checked=checked)
+    assert checked == ['GoldStar', 'GoldBud']
+    assert checkpoint.load()['results_saved'] == 12
+
+def test_run_resume_after_interrupt(name_checker, results_store, checkpoint):
+    calls = []
+
+    def _interrupt_second_batch(checker):
+        calls.append(checker.usernames)
+        if len(calls) == 2:
+            raise KeyboardInterrupt
+        return _check_github(checker)
+
+    with patch('src.name_checker.DomainChecker.check', lambda checker: []), \
+            patch('src.name_checker.GitHubChecker.check', _interrupt_second_batch), \
+            pytest.raises(KeyboardInterrupt):
+        name_checker.run()
+    assert checkpoint.load()['batch_index'] == 1
+
+    checked = []
+    _run(name_checker, resume=True, checked=checked)
+    assert checked == calls[1] + ['GoldStar', 'GoldBud']
+    assert len(results_store) == name_checker.name_count - len(BLOCKLISTED)
+
+def test_run_resume_without_checkpoint(name_checker, results_store, checkpoint):
+    checked = []
+    _run(name_checker, resume=True, checked=checked)
+    assert len(checked) == name_checker.name_count - len(BLOCKLISTED)
+
+def test_run_resume_completed(name_checker, results_store, checkpoint):
+    _run(name_checker)
+    checked = []
+    _run(name_checker, resume=True, checked=checked)
+    assert checked == []
+
+def test_resume_batch_size_mismatch(name_checker, checkpoint):
+    name_checker.save_checkpoint(batch_index=1, results_saved=5)
+    name_checker.batch_size = 4
+    with pytest.raises(CheckpointMismatchError, match='batch size'):
+        name_checker.load_resume_state()
+
+def test_resume_fingerprint_mismatch(name_checker, checkpoint):
+    name_checker.save_checkpoint(batch_index=1, results_saved=5)
+    name_checker.names = ['Foo']
+    with pytest.raises(CheckpointMismatchError, match='different set of names'):
+        name_checker.load_resume_state()
+
+
+# testing the async pipeline
+def _run_pipeline(name_checker, resume=False, checked=None):
+    def _record_github(checker):
+        if checked is not None:
+            checked.extend(checker.usernames)
+        return _check_github(checker)
+
+    with patch('src.name_checker.DomainChecker.check', lambda checker: []), \
+            patch('src.name_checker.GitHubChecker.check', _record_github):
+        name_checker.run_pipeline(resume=resume)
+
+def test_run_pipeline(name_checker, results_store, checkpoint):
+    _run_pipeline(name_checker)
+    assert len(results_store) == name_checker.name_count - len(BLOCKLISTED)
+    state = checkpoint.load()
+    assert state['batch_index'] == name_checker.batch_count
+    assert state['results_saved'] == name_checker.name_count - len(BLOCKLISTED)
+    assert state['completed'] is True
+
+@pytest.mark.parametrize('run', [_run, _run_pipeline])
+def test_run_exports_results(name_checker, results_store, checkpoint, run):
+    run(name_checker)
+    with open(name_checker.cfg.output_dir / name_checker.cfg.results_filename) as f:
+        results = json.load(f)
+    assert len(results) == name_checker.name_count - len(BLOCKLISTED)
+    assert {'name': 'GoldBud', 'GitHub': True} in results
+
+def test_shard_does_not_export_results(env_type, tmp_path):
+    name_checker = NameChecker(env_type=env_type, test_mode=True, shard_index=0, shard_count=2)
+    name_checker.cfg.output_dir = tmp_path
+    name_checker.export_results()
+    assert not (tmp_path / name_checker.cfg.results_filename).exists()
+    name_checker.results_store.close()
+
+@pytest.mark.parametrize('run', [_run, _run_pipeline])
+def test_run_reloads_config_between_batches(name_checker, results_store, checkpoint, run):
+    with patch.object(name_checker, 'reload_config') as mock_reload:
+        run(name_checker)
+    assert mock_reload.call_count == name_checker.batch_count
+
+def test_reload_config_keeps_shard_settings(env_type, tmp_path):
+    name_checker = NameChecker(env_type=env_type, test_mode=True, shard_index=1, shard_count=2)
+    name_checker.cfg.output_dir = tmp_path
+    results_db = name_checker.cfg.results_db_filename
+    assert name_checker.reload_config() is False
+    with patch('src.utils.config_helper.ConfigSnapshot.is_stale', return_value=True):
+        assert name_checker.reload_config() is True
+    assert name_checker.cfg.results_db_filename == results_db
+    assert name_checker.cfg.output_dir == tmp_path
+    name_checker.results_store.close()
+
+def test_run_pipeline_resume(name_checker, results_store, checkpoint):
+    name_checker.save_checkpoint(batch_index=2, results_saved=10)
+    checked = []
+    _run_pipeline(name_checker, resume=True, checked=checked)
+    assert checked == ['GoldStar', 'GoldBud']
+    assert checkpoint.load()['results_saved'] == 12
+
+
+# testing priority scheduling
+@pytest.fixture
+def prioritized_checker(env_type):
+    scorer = NameScorer([('length', length_heuristic(6), 1)])
+    return NameChecker(env_type=env_type, batch_size=5, test_mode=True, name_scorer=scorer)
+
+def test_name_scorer_disabled_by_default(name_checker):
+    assert name_checker.name_scorer is None
+    assert name_checker.stop_after == 0
+
+def test_name_scorer_from_config(env_type):
+    name_checker = NameChecker(env_type=env_type, test_mode=True,
+                               config_overrides={'Priority': {'ENABLED': 'True'}})
+    assert name_checker.name_scorer is not None
+
+def test_get_seed_weights(name_checker):
+    name_checker.seeds = [{'seedPosition': 0, 'seedItems': ['Red'], 'seedWeights': {'Red': 2}},
+                          {'seedPosition': 1, 'seedItems': ['Oak']}]
+    assert name_checker.get_seed_weights() == {'Red': 2}
+
+def test_create_batches_prioritized(prioritized_checker):
+    batches = list(prioritized_checker.create_batches())
+    names = [name for batch in batches for name in batch]
+    scores = [prioritized_checker.name_scorer.score(name) for name in names]
+    assert scores == sorted(scores, reverse=True)
+    assert sorted(names) == sorted(set(prioritized_checker.get_names()) - set(BLOCKLISTED))
+
+def test_create_batches_prioritized_start(prioritized_checker):
+    names = [name for batch in prioritized_checker.create_batches(0) for name in batch]
+    resumed = [name for batch in prioritized_checker.create_batches(1) for name in batch]
+    assert resumed == names[-len(resumed):]
+
+def test_prioritized_fingerprint_differs(name_checker, prioritized_checker):
+    assert name_checker.get_seeds_fingerprint() != prioritized_checker.get_seeds_fingerprint()
+
+def test_run_stops_after_available(name_checker, results_store, checkpoint):
+    name_checker.stop_after = 3
+    checked = []
+    _run(name_checker, checked=checked)
+    assert len(checked) == 5
+    state = checkpoint.load()
+    assert state['batch_index'] == 1
+    assert state['completed'] is False
+
+def test_run_resume_after_stop(name_checker, results_store, checkpoint):
+    name_checker.stop_after = 3
+    _run(name_checker)
+    name_checker.stop_after = 0
+    checked = []
+    _run(name_checker, resume=True, checked=checked)
+    assert len(checked) == name_checker.name_count - 5 - len(BLOCKLISTED)
+    assert checkpoint.load()['completed'] is True
+
+def test_run_pipeline_stops_after_available(name_checker, results_store, checkpoint):
+    name_checker.batch_size = 1
+    name_checker.batch_count = name_checker.get_batch_count()
+    name_checker.stop_after = 2
+    _run_pipeline(name_checker)
+    state = checkpoint.load()
+    assert state['completed'] is False
+    assert 2 <= state['batch_index'] < name_checker.batch_count
+    assert len(results_store) <= state['batch_index']
+
+
+# testing delta runs
+def test_run_records_seed_items(name_checker, results_store, checkpoint):
+    _run(name_checker)
+    assert name_checker.get_previous_seed_item_lists() == name_checker.get_seed_item_lists()
+
+def test_limited_run_does_not_record_seed_items(env_type, results_store, checkpoint):
+    name_checker = NameChecker(env_type=env_type, batch_size=5, batch_limit=1, test_mode=True)
+    name_checker.results_store = results_store
+    name_checker.checkpoint = checkpoint
+    _run(name_checker)
+    assert name_checker.get_previous_seed_item_lists() is None
+
+def test_delta_without_previous_seeds(env_type):
+    name_checker = NameChecker(env_type=env_type, test_mode=True, delta=True)
+    assert name_checker.seed_delta is None
+
+def test_delta_run_checks_new_combinations(env_type, name_checker, results_store, checkpoint):
+    _run(name_checker)
+    with patch.object(NameChecker, 'get_seeds', lambda self: [
+        {'seedPosition': 0, 'seedItems': ['Red', 'Blue', 'Gold', 'Jade']},
+        {'seedPosition': 1, 'seedItems': ['Oak', 'Fox', 'Star', 'Bud', 'Elm']},
+    ]), patch('src.name_checker.results_store_from_config', lambda cfg, migrate: results_store):
+        delta_checker = NameChecker(env_type=env_type, batch_size=5, test_mode=True, delta=True)
+    delta_checker.checkpoint = checkpoint
+    assert delta_checker.name_count == 1 * 5 + 3 * 1
+    assert delta_checker.get_seeds_fingerprint() != name_checker.get_seeds_fingerprint()
+    checked = []
+    _run(delta_checker, checked=checked)
+    assert checked == [
+        'JadeOak', 'JadeFox', 'JadeStar', 'JadeBud', 'JadeElm', 'RedElm', 'BlueElm', 'GoldElm'
+    ]
+    assert delta_checker.get_previous_seed_item_lists()[0] == ['Red', 'Blue', 'Gold', 'Jade']
+
+
+# testing the deferred retry queue
+def _flaky_github(failures):
+    """GitHub check that leaves every name unknown for the first failures calls."""
+    calls = []
+
+    def _check(checker):
+        calls.append(list(checker.usernames))
+        if len(calls) <= failures:
+            return [
+                {'name': name, 'GitHub': None, 'reason': 'HTTP 502'} for name in checker.usernames
+            ]
+        return _check_github(checker)
+    return _check, calls
+
+def test_get_provider():
+    assert NameChecker.get_provider('.com') == 'GoDaddy'
+    assert NameChecker.get_provider('GitHub') == 'GitHub'
+
+def test_run_retries_unknown_results(env_type, results_store, checkpoint):
+    name_checker = NameChecker(env_type=env_type, names=['RedOak', 'RedFox'], batch_size=1,
+                               test_mode=True)
+    name_checker.results_store = results_store
+    name_checker.checkpoint = checkpoint
+    check, calls = _flaky_github(failures=2)
+    with patch('src.name_checker.DomainChecker.check', lambda checker: []), \
+            patch('src.name_checker.GitHubChecker.check', check):
+        tables = list(name_checker.iter_results())
+    assert calls == [['RedOak'], ['RedFox'], ['RedOak'], ['RedFox']]
+    assert len(tables) == 3
+    assert tables[-1].to_records() == [
+        {'name': 'RedOak', 'GitHub': True},
+        {'name': 'RedFox', 'GitHub': True}
+    ]
+    assert results_store.get('RedFox') == {'name': 'RedFox', 'GitHub': True}
+    assert results_store.get_reasons('RedFox') == {}
+    assert len(name_checker.retry_queue) == 0
+
+def test_retries_exhausted_leave_results_unknown(env_type, results_store, checkpoint):
+    name_checker = NameChecker(env_type=env_type, names=['RedOak'], batch_retries=2,
+                               test_mode=True)
+    name_checker.results_store = results_store
+    name_checker.checkpoint = checkpoint
+    check, calls = _flaky_github(failures=10)
+    with patch('src.name_checker.DomainChecker.check', lambda checker: []), \
+            patch('src.name_checker.GitHubChecker.check', check):
+        name_checker.run()
+    assert len(calls) == 1 + 2
+    assert results_store.get('RedOak') == {'name': 'RedOak', 'GitHub': None}
+    assert results_store.get_reasons('RedOak') == {'GitHub': 'HTTP 502'}
+    assert len(name_checker.retry_queue) == 1
+
+def test_retry_unknown_requeues_stored_results_after_resume(env_type, results_store, checkpoint):
+    name_checker = NameChecker(env_type=env_type, names=['RedOak', 'RedFox'], batch_size=1,
+                               test_mode=True)
+    name_checker.results_store = results_store
+    name_checker.checkpoint = checkpoint
+    name_checker.save_checkpoint(1, 1)
+    # unknown results of the batch finished before the crash, of a provider not in this run, and
+    # of a name from an earlier run
+    results_store.upsert([
+        {'name': 'RedOak', 'GitHub': None, 'reason': 'HTTP 502'},
+        {'name': 'RedOak', 'PyPI': None, 'reason': 'HTTP 502'},
+        {'name': 'GoldFox', 'GitHub': None, 'reason': 'HTTP 502'}
+    ])
+    check, calls = _flaky_github(failures=0)
+    with patch('src.name_checker.DomainChecker.check', lambda checker: []), \
+            patch('src.name_checker.GitHubChecker.check', check):
+        name_checker.run(resume=True)
+    assert calls == [['RedFox'], ['RedOak']]
+    assert results_store.get('RedOak') == {'name': 'RedOak', 'GitHub': True, 'PyPI': None}
+    assert results_store.get('GoldFox') == {'name': 'GoldFox', 'GitHub': None}
+
+def test_retry_stored_includes_other_names(env_type, results_store, checkpoint):
+    name_checker = NameChecker(env_type=env_type, names=['RedOak'], test_mode=True,
+                               retry_stored=True)
+    name_checker.results_store = results_store
+    name_checker.checkpoint = checkpoint
+    results_store.upsert([{'name': 'GoldFox', 'GitHub': None, 'reason': 'HTTP 502'}])
+    check, calls = _flaky_github(failures=0)
+    with patch('src.name_checker.DomainChecker.check', lambda checker: []), \
+            patch('src.name_checker.GitHubChecker.check', check):
+        name_checker.run()
+    assert calls == [['RedOak'], ['GoldFox']]
+    assert results_store.get('GoldFox') == {'name': 'GoldFox', 'GitHub': True}
+
+def test_stored_unknown_domains_retry_their_own_ending(env_type, results_store, checkpoint):
+    name_checker = NameChecker(env_type=env_type, names=['RedOak'], domain_endings=['com'],
+                               test_mode=True)
+    name_checker.results_store = results_store
+    name_checker.checkpoint = checkpoint
+    results_store.upsert([{'name': 'RedOak', 'RedOak.net': None, 'reason': 'HTTP 502'}])
+    endings = []
+
+    def _check_domains(checker):
+        endings.append(checker.endings)
+        return [
+            {'name': name, f"{name}.{ending}": True}
+            for name in checker.host_names for ending in checker.endings
+        ]
+
+    with patch('src.name_checker.DomainChecker.check', _check_domains), \
+            patch('src.name_checker.GitHubChecker.check', _check_github):
+        name_checker.run()
+    assert endings == [['com'], ['net']]
+    assert results_store.get('RedOak') == {
+        'name': 'RedOak', 'RedOak.net': True, 'RedOak.com': True, 'GitHub': True
+    }
+
+def test_retry_backoff_doubles(env_type, results_store, checkpoint):
+    name_checker = NameChecker(env_type=env_type, names=['RedOak'], batch_retries=3,
+                               test_mode=True)
+    name_checker.results_store = results_store
+    name_checker.checkpoint = checkpoint
+    name_checker.cfg.batch_retry_backoff = 2
+    check, _ = _flaky_github(failures=10)
+    with patch('src.name_checker.DomainChecker.check', lambda checker: []), \
+            patch('src.name_checker.GitHubChecker.check', check), \
+            patch('src.name_checker.time.sleep') as mock_sleep:
+        name_checker.run()
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [2, 4, 8]
+
+def test_run_pipeline_retries_unknown_results(env_type, results_store, checkpoint):
+    name_checker = NameChecker(env_type=env_type, names=['RedOak', 'RedFox'], batch_size=1,
+                               test_mode=True)
+    name_checker.results_store = results_store
+    name_checker.checkpoint = checkpoint
+    check, calls = _flaky_github(failures=2)
+    written = []
+    with patch('src.name_checker.DomainChecker.check', lambda checker: []), \
+            patch('src.name_checker.GitHubChecker.check', check):
+        name_checker.run_pipeline(on_batch=written.append)
+    assert len(written) == 3
+    assert calls[-2:] == [['RedOak'], ['RedFox']]
+    assert results_store.get('RedOak') == {'name': 'RedOak', 'GitHub': True}
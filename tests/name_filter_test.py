@@ -0,0 +1,74 @@
+import pytest
+
+from src.name_filter import (
+    NameFilter,
+    allowed_chars_rule,
+    blocklist_rule,
+    load_blocklist,
+    max_length_rule,
+    name_filter_from_config
+)
+
+
+@pytest.fixture
+def name_filter():
+    return NameFilter([max_length_rule(10), allowed_chars_rule(), blocklist_rule(['bad'])])
+
+
+def test_name_filter_no_rules():
+    assert NameFilter().filter(['Any Name']) == (['Any Name'], [])
+
+def test_add_rule():
+    name_filter = NameFilter()
+    name_filter.add_rule(max_length_rule(3))
+    assert name_filter.reason('Long') == 'longer than 3 characters'
+
+@pytest.mark.parametrize('name, reason', [
+    ('RedOak', None),
+    ('Red-Oak', None),
+    ('RedOakTree1', 'longer than 10 characters'),
+    ('Red Oak', 'contains invalid characters'),
+    ('-RedOak', 'contains invalid characters'),
+    ('RedOak-', 'contains invalid characters'),
+    ('Café', 'contains invalid characters'),
+    ('', 'contains invalid characters'),
+    ('BadOak', 'blocklisted: bad')
+])
+def test_reason(name_filter, name, reason):
+    assert name_filter.reason(name) == reason
+
+def test_first_rule_wins(name_filter):
+    assert name_filter.reason('Bad Name Too Long') == 'longer than 10 characters'
+
+def test_filter(name_filter):
+    accepted, rejected = name_filter.filter(['RedOak', 'Red Oak', 'BlueFox'])
+    assert accepted == ['RedOak', 'BlueFox']
+    assert rejected == [('Red Oak', 'contains invalid characters')]
+
+
+# testing blocklist_rule
+def test_blocklist_rule_case_insensitive():
+    assert blocklist_rule(['OAK'])('RedOak') == 'blocklisted: oak'
+
+def test_blocklist_rule_empty():
+    rule = blocklist_rule(['', '  '])
+    assert rule('RedOak') is None
+
+def test_load_blocklist(config_helper):
+    assert load_blocklist(config_helper) == ['BlueFox']
+
+def test_load_blocklist_missing_file(config_helper):
+    config_helper.blocklist_filename = 'missing.txt'
+    assert load_blocklist(config_helper) == []
+
+
+# testing name_filter_from_config
+def test_name_filter_from_config(config_helper):
+    name_filter = name_filter_from_config(config_helper)
+    assert name_filter.reason('R' * 40) == 'longer than 39 characters'
+    assert name_filter.reason('BlueFox') == 'blocklisted: bluefox'
+    assert name_filter.reason('RedOak') is None
+
+def test_name_filter_from_config_disabled(config_helper):
+    config_helper.filter_enabled = False
+    assert name_filter_from_config(config_helper) is None
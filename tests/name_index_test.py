@@ -0,0 +1,37 @@
+import pytest
+
+from src.utils.name_index import NameIndex, canonical_name
+
+
+@pytest.mark.parametrize('name, expected', [
+    ('RedOak', 'redoak'),
+    ('REDOAK', 'redoak'),
+    ('red-oak', 'red-oak'),
+])
+def test_canonical_name(name, expected):
+    assert canonical_name(name) == expected
+
+def test_add_ignores_case():
+    index = NameIndex()
+    assert index.add('RedOak') is True
+    assert index.add('redoak') is False
+    assert len(index) == 1
+    assert 'REDOAK' in index
+    assert 'RedFox' not in index
+
+def test_get_returns_first_spelling():
+    index = NameIndex()
+    index.update(['RedOak', 'REDOAK'])
+    assert index.get('redoak') == 'RedOak'
+    assert index.get('RedFox') is None
+
+def test_dedupe():
+    index = NameIndex()
+    unique, aliases = index.dedupe(['RedOak', 'RedFox', 'redoak', 'RedOak', 'REDFOX'])
+    assert unique == ['RedOak', 'RedFox']
+    assert aliases == [('redoak', 'RedOak'), ('REDFOX', 'RedFox')]
+
+def test_dedupe_across_calls():
+    index = NameIndex()
+    index.dedupe(['RedOak'])
+    assert index.dedupe(['Redoak', 'BlueOak']) == (['BlueOak'], [('Redoak', 'RedOak')])
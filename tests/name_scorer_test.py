@@ -0,0 +1,77 @@
+import pytest
+
+from src.name_scorer import (
+    NameScorer,
+    length_heuristic,
+    name_scorer_from_config,
+    pronounceability_heuristic,
+    seed_weight_heuristic
+)
+
+
+def test_name_scorer_no_heuristics():
+    assert NameScorer().score('RedOak') == 0
+
+def test_score_is_weighted_sum():
+    scorer = NameScorer([('one', lambda name: 1, 2), ('length', len, 0.5)])
+    assert scorer.score('RedOak') == 5
+
+def test_add_heuristic_describe():
+    scorer = NameScorer()
+    scorer.add_heuristic('length', length_heuristic(6), 3)
+    assert scorer.describe() == [('length', 3)]
+
+@pytest.mark.parametrize('name, expected', [
+    ('RedOak', 0),
+    ('Red', -3),
+    ('RedOakTree', -4),
+])
+def test_length_heuristic(name, expected):
+    assert length_heuristic(6)(name) == expected
+
+@pytest.mark.parametrize('name, expected', [
+    ('Banana', 1.0),
+    ('Strk', 0.0),
+    ('A', 1.0),
+    ('Red-Oak', 0.8),
+])
+def test_pronounceability_heuristic(name, expected):
+    assert pronounceability_heuristic(name) == pytest.approx(expected)
+
+def test_seed_weight_heuristic_ignores_case():
+    heuristic = seed_weight_heuristic({'Red': 2, 'oak': 1})
+    assert heuristic('RedOak') == 3
+    assert heuristic('BlueFox') == 0
+
+def test_prioritize_orders_best_first():
+    scorer = NameScorer([('length', length_heuristic(4), 1)])
+    names = scorer.prioritize(['ab', 'abcd', 'abcdef', 'abc'], window=10)
+    assert list(names) == ['abcd', 'abc', 'ab', 'abcdef']
+
+def test_prioritize_ties_keep_order():
+    scorer = NameScorer()
+    assert list(scorer.prioritize(['b', 'a', 'c'], window=2)) == ['b', 'a', 'c']
+
+def test_prioritize_window_is_bounded():
+    scorer = NameScorer([('length', len, 1)])
+    names = ['a', 'bb', 'ccc', 'dddd']
+    # with a window of 2, 'ccc' is emitted before 'dddd' has been seen
+    assert list(scorer.prioritize(names, window=2)) == ['ccc', 'dddd', 'bb', 'a']
+    assert sorted(scorer.prioritize(names, window=1)) == sorted(names)
+
+def test_prioritize_is_lazy():
+    scorer = NameScorer()
+    names = iter(['a', 'b', 'c', 'd'])
+    ordered = scorer.prioritize(names, window=2)
+    assert next(ordered) == 'a'
+    assert list(names) == ['d']
+
+def test_name_scorer_from_config_disabled(config_helper):
+    assert name_scorer_from_config(config_helper) is None
+
+def test_name_scorer_from_config(config_helper):
+    config_helper.priority_enabled = True
+    scorer = name_scorer_from_config(config_helper, {'Red': 1})
+    labels = [label for label, _ in scorer.describe()]
+    assert labels == ['length', 'pronounceability', 'seed_weights']
+    assert scorer.score('RedOakRd') > scorer.score('Xyzzyq')
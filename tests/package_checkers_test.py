@@ -0,0 +1,148 @@
+from collections import Counter
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.mock_api_server import MockApiServer, is_available
+from src.package_checkers import DockerHubChecker, NpmChecker, PyPIChecker
+from src.utils.circuit_breaker import CircuitBreaker, CircuitState
+from src.utils.config_helper import ConfigHelper
+from src.utils.rate_limiter import SimulatedClock
+from src.utils.result_cache import ResultCache
+from tests.domain_checker_test import MockResponse
+
+
+@pytest.fixture
+def server():
+    with MockApiServer(seed=0) as server:
+        yield server
+
+@pytest.fixture
+def stub_config(env_type, server):
+    return ConfigHelper(env_type, test_mode=True, overrides={
+        'PyPI': {'API_URL': f"{server.url}/pypi/{{name}}/json"},
+        'npm': {'API_URL': f"{server.url}/npm/{{name}}"},
+        'DockerHub': {'API_URL': f"{server.url}/v2/users/{{name}}/"},
+    })
+
+
+# testing against the local registry stubs
+@pytest.mark.parametrize('checker_class, route', [
+    (PyPIChecker, 'pypi'),
+    (NpmChecker, 'npm'),
+    (DockerHubChecker, 'dockerhub')
+])
+def test_check_against_stub(server, stub_config, checker_class, route):
+    checker = checker_class(stub_config)
+    assert checker.check(['TestName', 'GoldFox']) == [
+        {'name': 'TestName', checker_class.provider: is_available('testname')},
+        {'name': 'GoldFox', checker_class.provider: is_available('goldfox')}
+    ]
+    assert server.requests == Counter({(route, 404): 1, (route, 200): 1})
+
+def test_injected_faults_are_unknown(env_type):
+    with MockApiServer(error_rate=1.0) as server:
+        config_helper = ConfigHelper(env_type, test_mode=True, overrides={
+            'PyPI': {'API_URL': f"{server.url}/pypi/{{name}}/json"}})
+        assert PyPIChecker(config_helper).check(['TestName']) == [
+            {'name': 'TestName', 'PyPI': None, 'reason': 'HTTP 500'}
+        ]
+
+
+# testing names and settings
+@pytest.mark.parametrize('checker_class, name, key', [
+    (PyPIChecker, 'Red_Oak.py', 'red-oak-py'),
+    (PyPIChecker, 'red--oak', 'red-oak'),
+    (NpmChecker, 'RedOak', 'redoak'),
+    (DockerHubChecker, 'RedOak', 'redoak')
+])
+def test_cache_key(config_helper, checker_class, name, key):
+    assert checker_class(config_helper).cache_key(name) == key
+
+def test_request_url(config_helper):
+    url = PyPIChecker(config_helper).request_url('Red_Oak')
+    assert url == 'https://pypi.org/pypi/red-oak/json'
+
+def test_get_setting(env_type):
+    config_helper = ConfigHelper(env_type, test_mode=True,
+                                 overrides={'PyPI': {'MAX_WORKERS': '3'}})
+    assert PyPIChecker.get_setting(config_helper, 'max_workers') == 3
+    assert PyPIChecker.get_setting(config_helper, 'max_retries') == PyPIChecker.max_retries
+    assert PyPIChecker.get_cache_ttls(config_helper) == (3600, 604800)
+
+def test_create_rate_limiter_share(config_helper):
+    rate_limiter = PyPIChecker.create_rate_limiter(config_helper, share=4)
+    assert rate_limiter.capacity == PyPIChecker.get_setting(config_helper, 'rate_limit') // 4
+
+def test_dockerhub_invalid_namespace_not_requested(config_helper):
+    with patch('requests.Session.get') as mock_get:
+        assert DockerHubChecker(config_helper).check_name('Red-Oak') is False
+    mock_get.assert_not_called()
+
+
+# testing failures
+def test_check_name_retries_after_rate_limit(config_helper):
+    responses = [MockResponse({}, 429, "", {'Retry-After': '0'}), MockResponse({}, 404, "")]
+    with patch('requests.Session.get', side_effect=responses) as mock_get:
+        assert NpmChecker(config_helper).check_name('RedOak') is True
+    assert mock_get.call_count == 2
+
+def test_check_name_retries_exhausted(config_helper):
+    checker = NpmChecker(config_helper)
+    response = MockResponse({}, 429, "", {'Retry-After': '0'})
+    with patch('requests.Session.get', return_value=response) as mock_get:
+        assert checker.check_name('RedOak') is None
+    assert mock_get.call_count == NpmChecker.max_retries
+    assert checker.failures == {'RedOak': 'retries exhausted'}
+
+@patch('requests.Session.get', side_effect=ConnectionError("connection reset"))
+def test_check_name_exception(mock_get, config_helper):
+    checker = NpmChecker(config_helper)
+    assert checker.check_name('RedOak') is None
+    assert checker.failures == {'RedOak': 'connection reset'}
+
+def test_open_circuit_skips_requests(config_helper):
+    circuit_breaker = CircuitBreaker('PyPI', min_requests=1, open_seconds=60)
+    circuit_breaker.record_failure()
+    checker = PyPIChecker(config_helper, circuit_breaker=circuit_breaker)
+    with patch('requests.Session.get') as mock_get:
+        assert checker.check(['RedOak']) == [
+            {'name': 'RedOak', 'PyPI': None, 'reason': 'circuit open'}
+        ]
+    mock_get.assert_not_called()
+
+
+def test_rate_limited_probe_does_not_stick_half_open(config_helper):
+    clock = SimulatedClock()
+    circuit_breaker = CircuitBreaker('npm', min_requests=1, open_seconds=60,
+                                     sleep=clock.sleep, clock=clock)
+    circuit_breaker.record_failure()
+    clock.sleep(60)
+    checker = NpmChecker(config_helper, circuit_breaker=circuit_breaker)
+    responses = [MockResponse({}, 429, "", {'Retry-After': '0'}), MockResponse({}, 404, "")]
+    with patch('requests.Session.get', side_effect=responses):
+        assert checker.check_name('RedOak') is True
+    assert circuit_breaker.state is CircuitState.CLOSED
+
+
+# testing the cache
+def test_check_uses_cache(config_helper, tmp_path):
+    cache = ResultCache(tmp_path / 'cache.sqlite3', ttls={'PyPI': (60, 60)})
+    cache.set('PyPI', 'red-oak', False)
+    checker = PyPIChecker(config_helper, cache=cache)
+    with patch('requests.Session.get', return_value=MockResponse({}, 404, "")) as mock_get:
+        assert checker.check(['Red_Oak', 'GoldFox']) == [
+            {'name': 'Red_Oak', 'PyPI': False},
+            {'name': 'GoldFox', 'PyPI': True}
+        ]
+    mock_get.assert_called_once()
+    assert cache.get('PyPI', 'goldfox') is True
+    cache.close()
+
+@patch('requests.Session.get', return_value=MockResponse({}, 500, "ERROR"))
+def test_check_does_not_cache_failures(mock_get, config_helper, tmp_path):
+    cache = ResultCache(tmp_path / 'cache.sqlite3', ttls={'npm': (60, 60)})
+    checker = NpmChecker(config_helper, cache=cache)
+    assert checker.check(['RedOak']) == [{'name': 'RedOak', 'npm': None, 'reason': 'HTTP 500'}]
+    assert cache.get('npm', 'redoak') is None
+    cache.close()
@@ -0,0 +1,146 @@
+import random
+import threading
+import time
+
+import pytest
+
+from src.pipeline import BatchPipeline
+
+
+def _stage(provider, delay=0.0):
+    def _check(batch):
+        time.sleep(random.random() * delay)
+        return [{'name': name, provider: True} for name in batch]
+    return _check
+
+def _batches(count, size=2):
+    return [[f"Name{i}-{j}" for j in range(size)] for i in range(count)]
+
+
+def test_pipeline_writes_batches_in_order():
+    written = []
+    pipeline = BatchPipeline(
+        batches=_batches(10),
+        stages={'GoDaddy': _stage('GoDaddy', 0.01), 'GitHub': _stage('GitHub', 0.01)},
+        writer=lambda index, results: written.append((index, results)),
+        stage_workers={'GoDaddy': 3, 'GitHub': 3},
+        queue_size=2
+    )
+    pipeline.run()
+    assert [index for index, _ in written] == list(range(10))
+
+def test_pipeline_merges_results_in_stage_order():
+    written = []
+    pipeline = BatchPipeline(
+        batches=[['TestName']],
+        stages={'GoDaddy': _stage('GoDaddy'), 'GitHub': _stage('GitHub')},
+        writer=lambda index, results: written.append(results),
+        stage_workers={}
+    )
+    pipeline.run()
+    assert written == [
+        [{'name': 'TestName', 'GoDaddy': True}, {'name': 'TestName', 'GitHub': True}]
+    ]
+
+def test_pipeline_start_index():
+    written = []
+    pipeline = BatchPipeline(
+        batches=_batches(2),
+        stages={'GitHub': _stage('GitHub')},
+        writer=lambda index, results: written.append(index),
+        stage_workers={'GitHub': 1},
+        start_index=5
+    )
+    pipeline.run()
+    assert written == [5, 6]
+
+def test_pipeline_runs_stages_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _meet(provider):
+        def _check(batch):
+            barrier.wait()
+            return [{'name': name, provider: True} for name in batch]
+        return _check
+
+    written = []
+    pipeline = BatchPipeline(
+        batches=_batches(3),
+        stages={'GoDaddy': _meet('GoDaddy'), 'GitHub': _meet('GitHub')},
+        writer=lambda index, results: written.append(index),
+        stage_workers={'GoDaddy': 1, 'GitHub': 1}
+    )
+    pipeline.run()
+    assert written == [0, 1, 2]
+
+def test_pipeline_respects_stage_workers():
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def _check(batch):
+        with lock:
+            in_flight.append(1)
+            peak.append(len(in_flight))
+        time.sleep(0.01)
+        with lock:
+            in_flight.pop()
+        return []
+
+    pipeline = BatchPipeline(
+        batches=_batches(12),
+        stages={'GitHub': _check},
+        writer=lambda index, results: None,
+        stage_workers={'GitHub': 3}
+    )
+    pipeline.run()
+    assert max(peak) == 3
+
+def test_pipeline_backpressure():
+    produced = []
+    written = []
+
+    def _produce():
+        for i, batch in enumerate(_batches(20)):
+            produced.append(i)
+            yield batch
+
+    def _write(index, results):
+        written.append(index)
+        assert len(produced) - len(written) <= 2 * 2 + 1 + 1
+
+    pipeline = BatchPipeline(
+        batches=_produce(),
+        stages={'GitHub': _stage('GitHub', 0.005)},
+        writer=_write,
+        stage_workers={'GitHub': 1},
+        queue_size=2
+    )
+    pipeline.run()
+    assert written == list(range(20))
+
+def test_pipeline_stage_error_propagates():
+    def _fail(batch):
+        raise RuntimeError("stage failed")
+
+    pipeline = BatchPipeline(
+        batches=_batches(5),
+        stages={'GoDaddy': _stage('GoDaddy'), 'GitHub': _fail},
+        writer=lambda index, results: None,
+        stage_workers={'GoDaddy': 1, 'GitHub': 1}
+    )
+    with pytest.raises(RuntimeError, match='stage failed'):
+        pipeline.run()
+
+def test_pipeline_stop():
+    written = []
+    pipeline = BatchPipeline(
+        batches=_batches(20),
+        stages={'GitHub': _stage('GitHub')},
+        writer=lambda index, results: (written.append(index), index == 1 and pipeline.stop()),
+        stage_workers={'GitHub': 1},
+        queue_size=1
+    )
+    pipeline.run()
+    assert written == list(range(len(written)))
+    assert 2 <= len(written) < 20
@@ -0,0 +1,84 @@
+import random
+import time
+from email.utils import formatdate
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.rate_limiter import RateLimiter, SimulatedClock, rate_limiter_from_config
+
+
+@pytest.fixture
+def clock():
+    return SimulatedClock()
+
+@pytest.fixture
+def rate_limiter(clock):
+    return RateLimiter(rate=2, period=1, backoff_base=1, backoff_max=8,
+                       sleep=clock.sleep, clock=clock)
+
+
+# testing token bucket pacing
+def test_acquire_burst_without_waiting(rate_limiter):
+    assert rate_limiter.acquire() == 0
+    assert rate_limiter.acquire() == 0
+
+def test_acquire_waits_for_refill(rate_limiter, clock):
+    rate_limiter.acquire()
+    rate_limiter.acquire()
+    assert rate_limiter.acquire() == pytest.approx(0.5)
+    assert clock.now == pytest.approx(0.5)
+
+def test_acquire_sustained_rate(rate_limiter, clock):
+    for _ in range(12):
+        rate_limiter.acquire()
+    assert clock.now == pytest.approx(5.0)
+
+
+# testing rate limit headers
+def test_update_remaining_caps_tokens(rate_limiter):
+    rate_limiter.update({'X-RateLimit-Remaining': '1'})
+    assert rate_limiter.acquire() == 0
+    assert rate_limiter.acquire() == pytest.approx(0.5)
+
+def test_update_exhausted_blocks_until_reset(rate_limiter):
+    reset = time.time() + 30
+    rate_limiter.update({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(reset)})
+    assert rate_limiter.acquire() == pytest.approx(30, abs=1)
+
+@pytest.mark.parametrize('headers', [None, {}, {'X-RateLimit-Remaining': 'bad'}])
+def test_update_ignores_missing_headers(rate_limiter, headers):
+    rate_limiter.update(headers)
+    assert rate_limiter.acquire() == 0
+
+
+# testing backoff
+def test_backoff_retry_after_seconds(rate_limiter):
+    assert rate_limiter.backoff(0, {'Retry-After': '7'}) == 7
+    assert rate_limiter.acquire() == pytest.approx(7)
+
+def test_backoff_retry_after_http_date(rate_limiter):
+    retry_at = formatdate(time.time() + 20, usegmt=True)
+    assert rate_limiter.backoff(0, {'Retry-After': retry_at}) == pytest.approx(20, abs=1.5)
+
+@pytest.mark.parametrize('attempt, ceiling', [(0, 1), (1, 2), (2, 4), (3, 8), (10, 8)])
+def test_backoff_exponential_with_full_jitter(rate_limiter, attempt, ceiling):
+    with patch('random.uniform', wraps=random.uniform) as mock_uniform:
+        delay = rate_limiter.backoff(attempt)
+    mock_uniform.assert_called_once_with(0, ceiling)
+    assert 0 <= delay <= ceiling
+    assert rate_limiter.acquire() == pytest.approx(delay)
+
+
+# testing rate_limiter_from_config
+@pytest.mark.parametrize('provider', ['GoDaddy', 'GitHub'])
+def test_rate_limiter_from_config(config_helper, provider):
+    rate_limiter = rate_limiter_from_config(config_helper, provider)
+    rate = getattr(config_helper, f"{provider.lower()}_rate_limit")
+    period = getattr(config_helper, f"{provider.lower()}_rate_period")
+    assert rate_limiter.capacity == rate
+    assert rate_limiter.fill_rate == pytest.approx(rate / period)
+
+def test_rate_limiter_from_config_invalid_provider(config_helper):
+    with pytest.raises(ValueError):
+        rate_limiter_from_config(config_helper, 'AOL')
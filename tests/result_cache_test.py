@@ -0,0 +1,89 @@
+import pytest
+
+from src.utils.result_cache import ResultCache, cache_from_config
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def result_cache(tmp_path, clock):
+    cache = ResultCache(
+        tmp_path / 'cache.sqlite3',
+        ttls={'GoDaddy': (60, 3600), 'GitHub': (10, 100)},
+        clock=clock
+    )
+    yield cache
+    cache.close()
+
+
+def test_result_cache_creates_file(result_cache):
+    assert result_cache.filepath.exists()
+
+def test_get_missing(result_cache):
+    assert result_cache.get('GoDaddy', 'TestName.com') is None
+
+@pytest.mark.parametrize('available', [True, False])
+def test_set_and_get(result_cache, available):
+    result_cache.set('GoDaddy', 'TestName.com', available)
+    assert result_cache.get('GoDaddy', 'TestName.com') is available
+
+def test_keys_ignore_case(result_cache):
+    result_cache.set('GoDaddy', 'TestName.com', True)
+    assert result_cache.get_many('GoDaddy', ['testname.com', 'TESTNAME.COM', 'Other.com']) == {
+        'testname.com': True, 'TESTNAME.COM': True
+    }
+
+def test_keys_are_per_provider(result_cache):
+    result_cache.set('GoDaddy', 'TestName', True)
+    assert result_cache.get('GitHub', 'TestName') is None
+
+@pytest.mark.parametrize('available, age, expected', [
+    (True, 59, True),
+    (True, 60, None),
+    (False, 3599, False),
+    (False, 3600, None)
+])
+def test_ttl_per_result_type(result_cache, clock, available, age, expected):
+    result_cache.set('GoDaddy', 'TestName.com', available)
+    clock.now += age
+    assert result_cache.get('GoDaddy', 'TestName.com') is expected
+
+def test_unconfigured_provider_not_cached(result_cache):
+    result_cache.set('AOL', 'TestName', True)
+    assert result_cache.get('AOL', 'TestName') is None
+
+def test_set_many_and_get_many(result_cache):
+    results = {f"Name{i}.com": i % 2 == 0 for i in range(1200)}
+    result_cache.set_many('GoDaddy', results)
+    assert result_cache.get_many('GoDaddy', list(results) + ['Missing.com']) == results
+
+def test_cache_persists(tmp_path, clock, result_cache):
+    result_cache.set('GitHub', 'TestName', False)
+    result_cache.close()
+    reopened = ResultCache(tmp_path / 'cache.sqlite3', ttls={'GitHub': (10, 100)}, clock=clock)
+    assert reopened.get('GitHub', 'TestName') is False
+    reopened.close()
+
+def test_cache_from_config_disabled(config_helper):
+    config_helper.cache_enabled = False
+    assert cache_from_config(config_helper) is None
+
+def test_cache_from_config(config_helper, tmp_path):
+    config_helper.output_dir = tmp_path
+    cache = cache_from_config(config_helper)
+    assert cache.filepath == tmp_path / config_helper.cache_filename
+    assert cache.ttls['GoDaddy'] == (
+        config_helper.godaddy_cache_ttl_available,
+        config_helper.godaddy_cache_ttl_taken
+    )
+    cache.close()
@@ -0,0 +1,134 @@
+import pytest
+
+from src.result_table import Availability, ResultTable
+
+DOMAIN_RESULTS = [
+    {'name': 'RedOak', 'RedOak.com': True},
+    {'name': 'RedFox', 'RedFox.com': False},
+    {'name': 'RedBud', 'RedBud.com': True}
+]
+GITHUB_RESULTS = [
+    {'name': 'RedOak', 'GitHub': True},
+    {'name': 'RedFox', 'GitHub': True},
+    {'name': 'RedBud', 'GitHub': None}
+]
+
+
+@pytest.fixture
+def table():
+    return ResultTable.from_records(DOMAIN_RESULTS, GITHUB_RESULTS)
+
+
+# testing Availability
+@pytest.mark.parametrize('value, state', [
+    (True, Availability.AVAILABLE),
+    (False, Availability.TAKEN),
+    (None, Availability.UNKNOWN)
+])
+def test_availability_round_trip(value, state):
+    assert Availability.from_value(value) is state
+    assert state.to_value() is value
+
+
+# testing ResultTable
+def test_from_records(table):
+    assert table.names == ['RedOak', 'RedFox', 'RedBud']
+    assert table.columns == {'.com': bytearray([1, 2, 1]), 'GitHub': bytearray([1, 1, 0])}
+    assert len(table) == 6
+
+def test_round_trip_preserves_order(table):
+    assert table.to_records() == DOMAIN_RESULTS + GITHUB_RESULTS
+
+def test_iter_rows(table):
+    assert list(table.iter_rows()) == [
+        {'name': 'RedOak', 'RedOak.com': True, 'GitHub': True},
+        {'name': 'RedFox', 'RedFox.com': False, 'GitHub': True},
+        {'name': 'RedBud', 'RedBud.com': True, 'GitHub': None}
+    ]
+
+def test_multiple_endings_order():
+    records = [
+        {'name': 'RedOak', 'RedOak.com': True},
+        {'name': 'RedOak', 'RedOak.io': False},
+        {'name': 'RedFox', 'RedFox.com': False},
+        {'name': 'RedFox', 'RedFox.io': True}
+    ]
+    assert ResultTable.from_records(records).to_records() == records
+
+def test_unset_cells_are_omitted():
+    records = [
+        {'name': 'RedOak', 'RedOak.com': False},
+        {'name': 'RedFox', 'RedFox.com': True},
+        {'name': 'RedFox', 'RedFox.io': None}
+    ]
+    table = ResultTable.from_records(records)
+    assert len(table) == 3
+    assert table.get('RedOak', 'RedOak.io') is None
+    assert table.to_records() == records
+    assert table.summary()['.io'] == {'unknown': 1, 'available': 0, 'taken': 0}
+
+def test_get_and_set(table):
+    assert table.get('RedFox', 'RedFox.com') is False
+    assert table.get('RedBud', 'GitHub') is None
+    assert table.get('GoldOak', 'GitHub') is None
+    table.set('GoldOak', 'GitHub', True)
+    assert table.get('GoldOak', 'GitHub') is True
+    assert table.get('GoldOak', 'GoldOak.com') is None
+
+def test_column_key():
+    assert ResultTable.column_key('RedOak', 'RedOak.com') == '.com'
+    assert ResultTable.column_key('RedOak', 'GitHub') == 'GitHub'
+
+def test_count(table):
+    assert table.count('.com', Availability.AVAILABLE) == 2
+    assert table.count('GitHub', Availability.UNKNOWN) == 1
+    assert table.count('.io', Availability.TAKEN) == 0
+
+def test_summary(table):
+    assert table.summary() == {
+        '.com': {'unknown': 0, 'available': 2, 'taken': 1},
+        'GitHub': {'unknown': 1, 'available': 2, 'taken': 0}
+    }
+
+def test_available_names(table):
+    assert table.available_names() == ['RedOak']
+    assert table.available_names(['GitHub']) == ['RedOak', 'RedFox']
+    assert table.available_names(['.io']) == []
+
+def test_available_names_empty():
+    assert ResultTable().available_names() == []
+
+
+# testing unknown results and reasons
+def test_reasons_round_trip():
+    records = [
+        {'name': 'RedOak', 'RedOak.com': None, 'reason': 'HTTP 503'},
+        {'name': 'RedOak', 'GitHub': True}
+    ]
+    table = ResultTable.from_records(records)
+    assert table.get_reason('RedOak', 'RedOak.com') == 'HTTP 503'
+    assert table.get_reason('RedOak', 'GitHub') is None
+    assert table.to_records() == records
+
+def test_reason_ignored_for_known_results():
+    table = ResultTable()
+    table.set('RedOak', 'GitHub', True, reason='HTTP 503')
+    assert table.reasons == {}
+
+def test_set_known_clears_reason():
+    table = ResultTable()
+    table.set('RedOak', 'GitHub', None, reason='HTTP 503')
+    table.set('RedOak', 'GitHub', False)
+    assert table.get_reason('RedOak', 'GitHub') is None
+
+def test_iter_rows_reasons():
+    table = ResultTable.from_records([
+        {'name': 'RedOak', 'RedOak.com': None, 'reason': 'circuit open'}
+    ])
+    assert list(table.iter_rows()) == [
+        {'name': 'RedOak', 'RedOak.com': None, 'reasons': {'RedOak.com': 'circuit open'}}
+    ]
+
+def test_unknown(table):
+    table.set('RedFox', 'RedFox.com', None)
+    assert list(table.unknown()) == [('RedFox', '.com'), ('RedBud', 'GitHub')]
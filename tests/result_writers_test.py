@@ -0,0 +1,43 @@
+import io
+
+from src.result_table import ResultTable
+from src.result_writers import AvailableWriter, CsvWriter, JsonlWriter
+
+RESULTS = ResultTable.from_records(
+    [{'name': 'RedOak', 'RedOak.com': True}, {'name': 'RedFox', 'RedFox.com': False}],
+    [{'name': 'RedOak', 'GitHub': True}, {'name': 'RedFox', 'GitHub': None, 'reason': 'HTTP 502'}]
+)
+
+
+def test_jsonl_writer():
+    stream = io.StringIO()
+    writer = JsonlWriter(stream)
+    writer.write(RESULTS)
+    assert stream.getvalue().splitlines() == [
+        '{"name": "RedOak", "RedOak.com": true, "GitHub": true}',
+        '{"name": "RedFox", "RedFox.com": false, "GitHub": null, '
+        '"reasons": {"GitHub": "HTTP 502"}}'
+    ]
+    assert writer.count == 2
+
+def test_csv_writer_header_written_once():
+    stream = io.StringIO()
+    writer = CsvWriter(stream)
+    writer.write(RESULTS)
+    writer.write(RESULTS)
+    lines = stream.getvalue().splitlines()
+    assert lines[:5] == [
+        'name,check,available,reason',
+        'RedOak,RedOak.com,true,',
+        'RedFox,RedFox.com,false,',
+        'RedOak,GitHub,true,',
+        'RedFox,GitHub,,HTTP 502'
+    ]
+    assert len(lines) == 9
+    assert writer.count == 8
+
+def test_available_writer():
+    stream = io.StringIO()
+    writer = AvailableWriter(stream)
+    writer.write(RESULTS)
+    assert stream.getvalue() == 'RedOak\n'
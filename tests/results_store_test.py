@@ -0,0 +1,198 @@
+import json
+import sqlite3
+
+import pytest
+
+from src.utils.results_store import ResultsStore, results_store_from_config
+
+
+@pytest.fixture
+def results_store(tmp_path):
+    store = ResultsStore(tmp_path / 'results.sqlite3')
+    yield store
+    store.close()
+
+
+def test_results_store_creates_file(results_store):
+    assert results_store.filepath.exists()
+
+def test_get_missing(results_store):
+    assert results_store.get('TestName') is None
+
+def test_upsert_merges_by_name(results_store):
+    results_store.upsert([
+        {'name': 'TestName', 'TestName.com': True},
+        {'name': 'TestName', 'GitHub': False}
+    ])
+    assert results_store.get('TestName') == {
+        'name': 'TestName', 'TestName.com': True, 'GitHub': False
+    }
+    assert len(results_store) == 1
+
+def test_upsert_updates_existing(results_store):
+    results_store.upsert([{'name': 'TestName', 'GitHub': False}])
+    results_store.upsert([{'name': 'TestName', 'GitHub': True}])
+    assert results_store.get('TestName') == {'name': 'TestName', 'GitHub': True}
+
+def test_upsert_skips_records_without_name(results_store):
+    results_store.upsert([{}, {'GitHub': True}])
+    assert len(results_store) == 0
+
+def test_iter_records(results_store):
+    results_store.upsert([
+        {'name': 'Beta', 'GitHub': True},
+        {'name': 'Alpha', 'GitHub': False},
+        {'name': 'Beta', 'Beta.com': False}
+    ])
+    assert list(results_store.iter_records()) == [
+        {'name': 'Alpha', 'GitHub': False},
+        {'name': 'Beta', 'GitHub': True, 'Beta.com': False}
+    ]
+
+def test_metadata(results_store):
+    assert results_store.get_metadata('version') is None
+    results_store.set_metadata('version', '1')
+    assert results_store.get_metadata('version') == '1'
+
+
+# testing migration and export
+def test_migrate_json(results_store, tmp_path):
+    legacy = tmp_path / 'results.json'
+    legacy.write_text(json.dumps([{}, {'name': 'TestName', 'GitHub': True}]))
+    assert results_store.migrate_json(legacy) == 1
+    assert results_store.get('TestName') == {'name': 'TestName', 'GitHub': True}
+
+def test_migrate_json_runs_once(results_store, tmp_path):
+    legacy = tmp_path / 'results.json'
+    legacy.write_text(json.dumps([{'name': 'TestName', 'GitHub': True}]))
+    results_store.migrate_json(legacy)
+    results_store.upsert([{'name': 'TestName', 'GitHub': False}])
+    assert results_store.migrate_json(legacy) == 0
+    assert results_store.get('TestName')['GitHub'] is False
+
+def test_migrate_json_missing_file(results_store, tmp_path):
+    assert results_store.migrate_json(tmp_path / 'missing.json') == 0
+
+def test_export_json(results_store, tmp_path):
+    results_store.upsert([{'name': 'TestName', 'TestName.com': True, 'GitHub': False}])
+    export_path = tmp_path / 'export.json'
+    results_store.export_json(export_path)
+    assert json.loads(export_path.read_text()) == [
+        {'name': 'TestName', 'TestName.com': True, 'GitHub': False}
+    ]
+    assert [path.name for path in tmp_path.glob('*.tmp')] == []
+
+def test_results_store_from_config(config_helper, tmp_path):
+    config_helper.output_dir = tmp_path
+    legacy = json.dumps([{'name': 'TestName', 'GitHub': True}])
+    (tmp_path / config_helper.results_filename).write_text(legacy)
+    store = results_store_from_config(config_helper)
+    assert store.filepath == tmp_path / config_helper.results_db_filename
+    assert store.get('TestName') == {'name': 'TestName', 'GitHub': True}
+    store.close()
+
+def test_results_store_from_config_without_migration(config_helper, tmp_path):
+    config_helper.output_dir = tmp_path
+    legacy = json.dumps([{'name': 'TestName', 'GitHub': True}])
+    (tmp_path / config_helper.results_filename).write_text(legacy)
+    store = results_store_from_config(config_helper, migrate=False)
+    assert len(store) == 0
+    assert store.get_metadata('migrated_json') is None
+    store.close()
+
+
+# testing rejections
+def test_reject(results_store):
+    results_store.reject([('Red Oak', 'contains invalid characters')])
+    assert results_store.get_rejection('Red Oak') == 'contains invalid characters'
+    assert results_store.get_rejection('RedOak') is None
+    assert results_store.count_rejections() == 1
+    assert len(results_store) == 0
+
+
+# testing unknown results
+def test_upsert_stores_reasons(results_store):
+    results_store.upsert([
+        {'name': 'RedOak', 'RedOak.com': None, 'reason': 'HTTP 503'},
+        {'name': 'RedOak', 'GitHub': True, 'reason': 'ignored for known results'}
+    ])
+    assert results_store.get('RedOak') == {'name': 'RedOak', 'RedOak.com': None, 'GitHub': True}
+    assert results_store.get_reasons('RedOak') == {'RedOak.com': 'HTTP 503'}
+
+def test_upsert_known_clears_reason(results_store):
+    results_store.upsert([{'name': 'RedOak', 'GitHub': None, 'reason': 'HTTP 503'}])
+    results_store.upsert([{'name': 'RedOak', 'GitHub': False}])
+    assert results_store.get_reasons('RedOak') == {}
+
+def test_iter_unknown(results_store):
+    results_store.upsert([
+        {'name': 'RedOak', 'RedOak.com': None, 'GitHub': True},
+        {'name': 'RedFox', 'GitHub': None}
+    ])
+    assert list(results_store.iter_unknown()) == [('RedOak', 'RedOak.com'), ('RedFox', 'GitHub')]
+
+def test_adds_reason_column_to_existing_store(tmp_path):
+    conn = sqlite3.connect(tmp_path / 'results.sqlite3')
+    conn.execute('CREATE TABLE results (name TEXT NOT NULL, key TEXT NOT NULL, value, '
+                 'updated_at REAL NOT NULL, PRIMARY KEY (name, key))')
+    conn.execute("INSERT INTO results VALUES ('RedOak', 'GitHub', 1, 0)")
+    conn.commit()
+    conn.close()
+    store = ResultsStore(tmp_path / 'results.sqlite3')
+    store.upsert([{'name': 'RedFox', 'GitHub': None, 'reason': 'HTTP 503'}])
+    assert store.get('RedOak') == {'name': 'RedOak', 'GitHub': True}
+    assert store.get_reasons('RedFox') == {'GitHub': 'HTTP 503'}
+    store.close()
+
+
+# testing aliases
+def test_add_and_get_aliases(results_store):
+    results_store.add_aliases([('redoak', 'RedOak'), ('REDOAK', 'RedOak'), ('Redfox', 'RedFox')])
+    assert results_store.get_aliases('RedOak') == ['redoak', 'REDOAK']
+    assert results_store.get_aliases('RedFox') == ['Redfox']
+    assert results_store.get_aliases('BlueOak') == []
+
+def test_get_by_alias(results_store):
+    results_store.upsert([{'name': 'RedOak', 'GitHub': True}])
+    results_store.add_aliases([('redOAK', 'RedOak')])
+    assert results_store.get('redOAK') == {'name': 'RedOak', 'GitHub': True}
+
+def test_resolve_ignores_case(results_store):
+    results_store.upsert([{'name': 'RedOak', 'GitHub': True}])
+    assert results_store.resolve('REDOAK') == 'RedOak'
+    assert results_store.get('redoak') == {'name': 'RedOak', 'GitHub': True}
+    assert results_store.resolve('RedFox') is None
+
+
+# testing merge
+def test_merge(tmp_path):
+    store = ResultsStore(tmp_path / 'results.sqlite3')
+    shard = ResultsStore(tmp_path / 'results.shard0of2.sqlite3')
+    store.upsert([{'name': 'RedOak', 'RedOak.com': False}])
+    shard.upsert([
+        {'name': 'RedOak', 'RedOak.com': True, 'GitHub': True},
+        {'name': 'RedFox', 'GitHub': False}
+    ])
+    shard.reject([('Red Oak', 'contains invalid characters')])
+    shard.add_aliases([('redoak', 'RedOak')])
+    shard.set_metadata('seed_items', '[["Red"], ["Oak"]]')
+    shard.set_metadata('migrated_json', 'results.json')
+    shard.close()
+    assert store.merge(tmp_path / 'results.shard0of2.sqlite3') == 3
+    assert store.merge(tmp_path / 'results.shard0of2.sqlite3') == 3
+    assert store.get('RedOak') == {'name': 'RedOak', 'RedOak.com': True, 'GitHub': True}
+    assert store.get('RedFox') == {'name': 'RedFox', 'GitHub': False}
+    assert store.get_rejection('Red Oak') == 'contains invalid characters'
+    assert store.get_aliases('RedOak') == ['redoak']
+    assert store.get_metadata('seed_items') == '[["Red"], ["Oak"]]'
+    assert store.get_metadata('migrated_json') is None
+    store.close()
+
+def test_merge_skip_metadata(tmp_path):
+    store = ResultsStore(tmp_path / 'results.sqlite3')
+    shard = ResultsStore(tmp_path / 'results.shard0of2.sqlite3')
+    shard.set_metadata('seed_items', '[["Red"], ["Oak"]]')
+    shard.close()
+    store.merge(tmp_path / 'results.shard0of2.sqlite3', skip_metadata=['seed_items'])
+    assert store.get_metadata('seed_items') is None
+    store.close()
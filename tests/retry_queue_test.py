@@ -0,0 +1,24 @@
+from src.retry_queue import RetryQueue
+
+
+def test_empty_queue():
+    retry_queue = RetryQueue()
+    assert len(retry_queue) == 0
+    assert retry_queue.pop_all() == {}
+
+def test_names_queued_once_per_provider():
+    retry_queue = RetryQueue()
+    queued = [
+        ('GoDaddy', 'RedOak'), ('GitHub', 'RedOak'), ('GoDaddy', 'RedFox'), ('GoDaddy', 'RedOak')
+    ]
+    for provider, name in queued:
+        retry_queue.add(provider, name)
+    assert len(retry_queue) == 3
+    assert retry_queue.pop_all() == {'GoDaddy': ['RedOak', 'RedFox'], 'GitHub': ['RedOak']}
+    assert len(retry_queue) == 0
+
+def test_domain_endings_queued_separately():
+    retry_queue = RetryQueue()
+    retry_queue.add('.com', 'RedOak')
+    retry_queue.add('.net', 'RedOak')
+    assert retry_queue.pop_all() == {'.com': ['RedOak'], '.net': ['RedOak']}
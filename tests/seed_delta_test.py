@@ -0,0 +1,44 @@
+from itertools import product
+
+import pytest
+
+from src.seed_delta import SeedDelta
+
+
+def _product(item_lists):
+    return {"".join(items) for items in product(*item_lists)}
+
+
+def test_no_changes():
+    seed_delta = SeedDelta([['Red'], ['Oak']], [['Red'], ['Oak']])
+    assert list(seed_delta) == []
+    assert len(seed_delta) == 0
+
+def test_added_items_in_one_position():
+    seed_delta = SeedDelta([['Red', 'Blue'], ['Oak']], [['Red', 'Blue', 'Gold'], ['Oak', 'Fox']])
+    assert list(seed_delta) == ['GoldOak', 'GoldFox', 'RedFox', 'BlueFox']
+    assert seed_delta.added_items() == [['Gold'], ['Fox']]
+
+@pytest.mark.parametrize('old, new', [
+    ([['Red', 'Blue'], ['Oak', 'Fox']], [['Red', 'Blue', 'Gold'], ['Oak', 'Fox', 'Bud']]),
+    ([['Red', 'Blue'], ['Oak', 'Fox'], ['Io']], [['Blue', 'Gold'], ['Fox', 'Star'], ['Io', 'Xu']]),
+    ([[], ['Oak']], [['Red'], ['Oak', 'Fox']]),
+])
+def test_delta_matches_product_difference(old, new):
+    seed_delta = SeedDelta(old, new)
+    names = list(seed_delta)
+    assert len(names) == len(set(names)) == len(seed_delta)
+    assert set(names) == _product(new) - _product(old)
+
+def test_items_compare_ignoring_case():
+    seed_delta = SeedDelta([['Red'], ['Oak']], [['RED'], ['oak', 'Fox']])
+    assert list(seed_delta) == ['REDFox']
+
+def test_count_without_generating():
+    old = [[f"A{i}" for i in range(400)], [f"B{i}" for i in range(636)]]
+    new = [old[0] + [f"C{i}" for i in range(10)], old[1]]
+    assert len(SeedDelta(old, new)) == 10 * 636
+
+def test_position_count_mismatch():
+    with pytest.raises(ValueError):
+        SeedDelta([['Red']], [['Red'], ['Oak']])
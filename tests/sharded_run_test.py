@@ -0,0 +1,74 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.name_checker import NameChecker
+from src.sharded_run import ShardedRun
+from src.utils.results_store import ResultsStore
+from tests.name_checker_test import BLOCKLISTED, _check_github
+
+
+def _check_domains(checker):
+    return [{'name': name, f"{name}.com": True} for name in checker.host_names]
+
+
+@pytest.fixture
+def sharded_run(env_type, tmp_path):
+    sharded_run = ShardedRun(env_type, shard_count=2, test_mode=True, batch_size=2)
+    sharded_run.results_store.close()
+    sharded_run.results_store = ResultsStore(tmp_path / 'results.sqlite3')
+    sharded_run.cfg.output_dir = tmp_path
+    shard_paths = []
+    yield sharded_run, shard_paths
+    sharded_run.results_store.close()
+    for path in shard_paths:
+        for shard_file in path.parent.glob('*.shard*of2*'):
+            shard_file.unlink()
+
+
+def test_sharded_run_defaults(env_type):
+    sharded_run = ShardedRun(env_type, test_mode=True)
+    assert sharded_run.shard_count == sharded_run.cfg.shard_count
+    assert sharded_run.processes == sharded_run.shard_count
+    sharded_run.results_store.close()
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_sharded_run_merges_shards(sharded_run, processes):
+    sharded_run, shard_paths = sharded_run
+    sharded_run.processes = processes
+    with patch('src.name_checker.DomainChecker.check', _check_domains), \
+            patch('src.name_checker.GitHubChecker.check', _check_github):
+        shard_paths.extend(sharded_run.run())
+    results_db = sharded_run.cfg.results_db_filename
+    assert [path.name for path in shard_paths] == [
+        results_db.replace('.sqlite3', '.shard0of2.sqlite3'),
+        results_db.replace('.sqlite3', '.shard1of2.sqlite3')
+    ]
+    assert len(sharded_run.results_store) == 12 - len(BLOCKLISTED)
+    assert sharded_run.results_store.get('GoldBud') == {
+        'name': 'GoldBud', 'GoldBud.com': True, 'GitHub': True
+    }
+    assert sharded_run.results_store.get_rejection(BLOCKLISTED[0]) is not None
+    with open(sharded_run.cfg.output_dir / sharded_run.cfg.results_filename) as f:
+        assert len(json.load(f)) == 12 - len(BLOCKLISTED)
+    assert json.loads(sharded_run.results_store.get_metadata('seed_items')) == [
+        ['Red', 'Blue', 'Gold'],
+        ['Oak', 'Fox', 'Star', 'Bud']
+    ]
+
+def test_merge_records_seed_items_only_if_every_shard_finished(sharded_run, tmp_path):
+    sharded_run, _ = sharded_run
+    shard_paths = [tmp_path / 'results.shard0of2.sqlite3', tmp_path / 'results.shard1of2.sqlite3']
+    for path, seed_items in zip(shard_paths, ['[["Red"], ["Oak"]]', None]):
+        shard_store = ResultsStore(path)
+        if seed_items is not None:
+            shard_store.set_metadata('seed_items', seed_items)
+        shard_store.close()
+    sharded_run.merge(shard_paths)
+    assert sharded_run.results_store.get_metadata('seed_items') is None
+
+def test_shards_do_not_migrate_legacy_results(env_type):
+    with patch('src.name_checker.results_store_from_config') as mock_store_from_config:
+        NameChecker(env_type=env_type, test_mode=True, shard_index=0, shard_count=2)
+    assert mock_store_from_config.call_args.kwargs == {'migrate': False}
@@ -0,0 +1,43 @@
+import pytest
+
+from src.utils.sharding import (
+    ShardStrategy,
+    hash_shard,
+    iter_hash_shard,
+    shard_bounds,
+    shard_filename
+)
+
+
+# testing shard_bounds
+@pytest.mark.parametrize('total, shard_count, expected', [
+    (12, 3, [(0, 4), (4, 8), (8, 12)]),
+    (11, 3, [(0, 4), (4, 8), (8, 11)]),
+    (2, 4, [(0, 1), (1, 2), (2, 2), (2, 2)]),
+    (0, 2, [(0, 0), (0, 0)])
+])
+def test_shard_bounds(total, shard_count, expected):
+    assert [shard_bounds(total, index, shard_count) for index in range(shard_count)] == expected
+
+
+# testing hash sharding
+def test_hash_shard_is_stable():
+    assert hash_shard('RedOak', 4) == hash_shard('RedOak', 4)
+    assert 0 <= hash_shard('RedOak', 4) < 4
+
+def test_hash_shard_ignores_case():
+    assert all(hash_shard(f"Name{i}", 7) == hash_shard(f"NAME{i}", 7) for i in range(20))
+
+def test_iter_hash_shard_partitions_names():
+    names = [f"Name{i}" for i in range(100)]
+    shards = [list(iter_hash_shard(names, index, 3)) for index in range(3)]
+    assert sorted(sum(shards, [])) == sorted(names)
+    assert all(shards)
+
+
+# testing shard_filename
+def test_shard_filename():
+    assert shard_filename('results.sqlite3', 1, 4) == 'results.shard1of4.sqlite3'
+
+def test_shard_strategy_values():
+    assert ShardStrategy('hash') is ShardStrategy.HASH
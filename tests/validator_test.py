@@ -84,6 +84,52 @@ def test_negative_integer_value(validator):
     assert validator.integer(-5, min_value=-10, max_value=0) is True
 
 
+# testing boolean method
+@pytest.mark.parametrize('value', [True, False])
+def test_boolean_value_valid(validator, value):
+    assert validator.boolean(value) is True
+
+def test_boolean_value_none(validator):
+    with pytest.raises(InvalidConfigValueError, match='cannot be None'):
+        validator.boolean(None)
+
+@pytest.mark.parametrize('value', [1, 'True'])
+def test_boolean_value_bad_type(validator, value):
+    with pytest.raises(InvalidConfigValueError, match='must be a boolean'):
+        validator.boolean(value)
+
+
+# testing choice method
+def test_choice_value_valid(validator):
+    assert validator.choice('hash', ['range', 'hash']) is True
+
+def test_choice_value_none(validator):
+    with pytest.raises(InvalidConfigValueError, match='cannot be None'):
+        validator.choice(None, ['range', 'hash'])
+
+def test_choice_value_not_allowed(validator):
+    with pytest.raises(InvalidConfigValueError, match='must be one of range, hash'):
+        validator.choice('modulo', ['range', 'hash'])
+
+
+# testing string_list method
+@pytest.mark.parametrize('value', [[], ['PyPI'], ['PyPI', 'npm']])
+def test_string_list_value_valid(validator, value):
+    assert validator.string_list(value) is True
+
+def test_string_list_value_none(validator):
+    with pytest.raises(InvalidConfigValueError, match='cannot be None'):
+        validator.string_list(None)
+
+def test_string_list_value_not_list(validator):
+    with pytest.raises(InvalidConfigValueError, match='must be a list'):
+        validator.string_list('PyPI')
+
+def test_string_list_item_empty(validator):
+    with pytest.raises(InvalidConfigValueError, match='cannot be empty'):
+        validator.string_list(['PyPI', ''])
+
+
 # testing directory method
 def test_directory_value_valid_path(validator, project_root):
     assert validator.directory(project_root) is True
@@ -225,6 +271,20 @@ def test_url_flags_valid(validator, check_scheme, check_domain):
     ) is True
 
 
+# testing hostname method
+@pytest.mark.parametrize('value', ['1.1.1.1', 'dns.google', '2606:4700:4700::1111'])
+def test_hostname_value_valid(validator, value):
+    assert validator.hostname(value) is True
+
+def test_hostname_value_empty(validator):
+    with pytest.raises(InvalidConfigValueError, match='cannot be empty'):
+        validator.hostname('')
+
+def test_hostname_value_invalid_chars(validator):
+    with pytest.raises(InvalidConfigValueError, match='invalid characters'):
+        validator.hostname('dns google/53')
+
+
 # testing api_token method
 def test_token_value_valid(validator):
     assert validator.api_token('test') is True